@@ -184,14 +184,16 @@ def latex_shorten(value, width):
 
 def automation_band_summary(scores):
     """Return non-empty automation score bands with boundary-aware binning."""
+    # One binning pass; bins are [lower, upper), with the last edge nudged up
+    # so the final band also includes its upper bound
+    edges = [lower for lower, _, _ in AUTOMATION_BANDS]
+    edges.append(np.nextafter(AUTOMATION_BANDS[-1][1], np.inf))
+    counts = pd.cut(scores, edges, right=False).value_counts(sort=False)
+
     rows = []
-    for idx, (lower, upper, label) in enumerate(AUTOMATION_BANDS):
+    for idx, ((lower, upper, label), count) in enumerate(zip(AUTOMATION_BANDS, counts)):
         is_last = idx == len(AUTOMATION_BANDS) - 1
-        if is_last:
-            mask = scores.between(lower, upper, inclusive="both")
-        else:
-            mask = (scores >= lower) & (scores < upper)
-        count = int(mask.sum())
+        count = int(count)
         if count == 0:
             continue
         upper_display = "1.00" if is_last else f"{upper:.2f}"
@@ -287,19 +289,19 @@ def integrity_audit(df):
     # ── Hallucination flags ──
     suspect_rows = df[df["primary_app"].isin(SUSPECT_PRIMARY_APPS)]
     if len(suspect_rows) > 0:
-        for _, r in suspect_rows.iterrows():
+        for r in suspect_rows.itertuples(index=False):
             flags.append(
-                f"SUSPECT primary_app='{r['primary_app']}' for {r['username']}/{r['task_description']} "
-                f"(video_id={r['video_id']})"
+                f"SUSPECT primary_app='{r.primary_app}' for {r.username}/{r.task_description} "
+                f"(video_id={r.video_id})"
             )
 
     # Uniform 0.75 scores on very short recordings
     short_high = df[(df["duration_sec"] < 15) & (df["automation_score"] >= 0.75)]
     if len(short_high) > 0:
-        for _, r in short_high.iterrows():
+        for r in short_high.itertuples(index=False):
             flags.append(
-                f"SHORT+HIGH: {r['duration_sec']}s with score={r['automation_score']} — "
-                f"{r['username']}/{r['task_description']} (video_id={r['video_id']})"
+                f"SHORT+HIGH: {r.duration_sec}s with score={r.automation_score} — "
+                f"{r.username}/{r.task_description} (video_id={r.video_id})"
             )
 
     # localutility = pipeline test recordings
@@ -308,12 +310,12 @@ def integrity_audit(df):
         flags.append(f"PIPELINE TEST: {len(lu)} 'localutility' recordings (exclude from user analysis)")
 
     # Descriptions mentioning NASDAQ, stock tickers, etc. (likely hallucinated)
-    for _, r in df.iterrows():
-        if HALLUCINATION_PATTERNS.search(str(r.get("workflow_description", ""))):
-            flags.append(
-                f"HALLUCINATION? Description mentions financial markets: "
-                f"{r['username']}/{r['video_id']}: '{r['workflow_description'][:80]}...'"
-            )
+    mentions = df[df["workflow_description"].map(str).str.contains(HALLUCINATION_PATTERNS)]
+    for r in mentions.itertuples(index=False):
+        flags.append(
+            f"HALLUCINATION? Description mentions financial markets: "
+            f"{r.username}/{r.video_id}: '{r.workflow_description[:80]}...'"
+        )
 
     return flags
 
@@ -694,7 +696,7 @@ def fig_app_frequency(df):
 
 def fig_recording_timeline(df):
     """Fig 6: Recording timeline scatter by user."""
-    dfa = filtered_analysis_df(df).copy()
+    dfa = filtered_analysis_df(df)
     dfa["date_dt"] = pd.to_datetime(dfa["date"])
 
     # Sort users by first recording date
@@ -714,11 +716,11 @@ def fig_recording_timeline(df):
         "IT (Pipeline)": PALETTE[7],
     }
 
-    for _, r in dfa.iterrows():
-        y = user_y.get(r["full_name"], 0)
-        c = dept_colors.get(r["department"], "gray")
-        size = np.clip(r["duration_sec"] / 5, 8, 60)
-        ax.scatter(r["date_dt"], y, s=size, c=[c], alpha=0.7,
+    for r in dfa.itertuples(index=False):
+        y = user_y.get(r.full_name, 0)
+        c = dept_colors.get(r.department, "gray")
+        size = np.clip(r.duration_sec / 5, 8, 60)
+        ax.scatter(r.date_dt, y, s=size, c=[c], alpha=0.7,
                    edgecolors="white", linewidth=0.3)
 
     ax.set_yticks(range(len(user_order)))
@@ -781,7 +783,7 @@ def fig_action_cooccurrence(df):
 
 def fig_department_profile(df):
     """Fig 8: Department-level aggregated radar/bar comparison."""
-    dfa = filtered_analysis_df(df).copy()
+    dfa = filtered_analysis_df(df)
 
     dept_stats = dfa.groupby("department").agg(
         n_workflows=("video_id", "count"),
@@ -865,8 +867,8 @@ def fig_dendrogram(Z, dfa):
     """Fig 11: Hierarchical clustering dendrogram."""
     fig, ax = plt.subplots(figsize=(max(7.5, len(dfa) * 0.13), 5.2))
     # Use task descriptions as labels (truncated)
-    labels_text = [f"{r['full_name'][:12]}:{r['task_description'][:18]}"
-                   for _, r in dfa.iterrows()]
+    labels_text = [f"{r.full_name[:12]}:{r.task_description[:18]}"
+                   for r in dfa.itertuples(index=False)]
     dendrogram(Z, ax=ax, labels=labels_text, leaf_rotation=90, leaf_font_size=4,
                color_threshold=0.7 * max(Z[:, 2]),
                above_threshold_color="gray")
@@ -1051,16 +1053,21 @@ def generate_latex_tables(df, dfa_clustered, cluster_summaries):
         avg_score=("automation_score", "mean"),
         avg_sop=("sop_step_count", "mean"),
         total_min=("duration_sec", "sum"),
-        top_app=("primary_app", lambda x: x.mode().iloc[0] if len(x) > 0 else "—"),
-    ).reset_index()
+    )
+    # Most frequent app per participant from one native count (ties go to the
+    # alphabetically first app, as Series.mode() would pick)
+    app_counts = dfa.groupby(["full_name", "department", "primary_app"]).size()
+    top_apps = app_counts.groupby(level=[0, 1]).idxmax().map(lambda key: key[2])
+    user_stats["top_app"] = top_apps.reindex(user_stats.index).fillna("—")
+    user_stats = user_stats.reset_index()
     user_stats["total_min"] = (user_stats["total_min"] / 60).round(1)
     user_stats = user_stats.sort_values("n", ascending=False)
 
     participant_rows = []
-    for _, r in user_stats.iterrows():
+    for r in user_stats.itertuples(index=False):
         participant_rows.append(
-            f"{latex_escape(r['full_name'])} & {latex_shorten(r['department'], 18)} & {r['n']} & {r['avg_score']:.2f} & "
-            f"{r['avg_sop']:.0f} & {r['total_min']:.1f} & {latex_shorten(r['top_app'], 24)} \\\\" 
+            f"{latex_escape(r.full_name)} & {latex_shorten(r.department, 18)} & {r.n} & {r.avg_score:.2f} & "
+            f"{r.avg_sop:.0f} & {r.total_min:.1f} & {latex_shorten(r.top_app, 24)} \\\\" 
         )
     write_latex_table(
         tables_dir / "tab_participants.tex",
@@ -1088,12 +1095,12 @@ def generate_latex_tables(df, dfa_clustered, cluster_summaries):
     top_auto = dfa.nlargest(15, "automation_score")[
         ["full_name", "task_description", "primary_app", "automation_score",
          "sop_step_count", "top_automation_candidate"]
-    ].copy()
+    ]
     auto_rows = []
-    for _, r in top_auto.iterrows():
+    for r in top_auto.itertuples(index=False):
         auto_rows.append(
-            f"{latex_escape(r['full_name'])} & {latex_shorten(r['task_description'], 34)} & {r['automation_score']:.2f} & "
-            f"{latex_shorten(r['primary_app'], 20)} & {r['sop_step_count']:.0f} & {latex_shorten(r['top_automation_candidate'], 34)} \\\\" 
+            f"{latex_escape(r.full_name)} & {latex_shorten(r.task_description, 34)} & {r.automation_score:.2f} & "
+            f"{latex_shorten(r.primary_app, 20)} & {r.sop_step_count:.0f} & {latex_shorten(r.top_automation_candidate, 34)} \\\\" 
         )
     write_latex_table(
         tables_dir / "tab_top_automation.tex",
@@ -1104,17 +1111,17 @@ def generate_latex_tables(df, dfa_clustered, cluster_summaries):
 
     # ── Table 4: Deep-dive target workflows ──
     # High score + high SOP = best candidates for tool-building
-    dfa_scored = dfa.copy()
-    dfa_scored["impact_score"] = dfa_scored["automation_score"] * np.log1p(dfa_scored["sop_step_count"])
-    top_impact = dfa_scored.nlargest(10, "impact_score")[
+    impact_score = dfa["automation_score"] * np.log1p(dfa["sop_step_count"])
+    top_impact = dfa.loc[
+        impact_score.nlargest(10).index,
         ["full_name", "department", "task_description", "automation_score",
-         "sop_step_count", "workflow_category", "primary_app"]
-    ].copy()
+         "sop_step_count", "workflow_category", "primary_app"],
+    ]
     impact_rows = []
-    for _, r in top_impact.iterrows():
+    for r in top_impact.itertuples(index=False):
         impact_rows.append(
-            f"{latex_escape(r['full_name'])} & {latex_shorten(r['department'], 18)} & {latex_shorten(r['task_description'], 38)} & "
-            f"{r['automation_score']:.2f} & {r['sop_step_count']:.0f} & {latex_shorten(r['workflow_category'], 26)} \\\\" 
+            f"{latex_escape(r.full_name)} & {latex_shorten(r.department, 18)} & {latex_shorten(r.task_description, 38)} & "
+            f"{r.automation_score:.2f} & {r.sop_step_count:.0f} & {latex_shorten(r.workflow_category, 26)} \\\\" 
         )
     write_latex_table(
         tables_dir / "tab_deep_dive.tex",
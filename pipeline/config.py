@@ -3,21 +3,35 @@ Workflow Analysis Pipeline - Configuration
 All paths, constants, and environment variables centralized here.
 """
 
+import functools
 import os
+import shutil
 from pathlib import Path
-from dotenv import load_dotenv
 
-# Load .env file from the pipeline directory
 _pipeline_dir = Path(__file__).parent
-load_dotenv(_pipeline_dir / ".env", override=True)
+
+
+@functools.cache
+def _ensure_env() -> None:
+    """Load the .env file from the pipeline directory (once, on first use)."""
+    from dotenv import load_dotenv
+
+    load_dotenv(_pipeline_dir / ".env", override=True)
+
+
+def _env(name: str, default: str = "") -> str:
+    """Read an environment variable after making sure .env has been loaded."""
+    _ensure_env()
+    return os.environ.get(name, default)
+
 
 # =============================================================================
 # Paths
 # =============================================================================
 
 # Source directory where .webm files are collected (network share or local)
-# Configure via WORKFLOW_SOURCE_SHARE environment variable or set below
-SOURCE_SHARE = os.environ.get("WORKFLOW_SOURCE_SHARE", r"\\bulley-fs1\WORKFLOW").strip()
+# Configure via WORKFLOW_SOURCE_SHARE environment variable.
+# Exposed as config.SOURCE_SHARE, resolved lazily (see end of module).
 
 # Local directory where MP4s are written by video conversion process
 MP4_DIR = r"C:\temp\WorkflowProcessing"
@@ -43,28 +57,121 @@ REPORTS_DIR = os.path.join(OUTPUT_DIR, "reports")
 # Per-video analysis markdown output directory
 ANALYSES_DIR = os.path.join(OUTPUT_DIR, "analyses")
 
+# ffprobe results keyed by (path, mtime, size) so re-runs and the education
+# pass don't spawn ffprobe again for unchanged videos
+VIDEO_METADATA_CACHE = os.path.join(OUTPUT_DIR, "video_metadata_cache.json")
+
+# Parsed sections of per-video analysis markdown keyed by (path, mtime, size),
+# so rebuilding the insights report only re-parses files that changed
+REPORT_SECTIONS_CACHE = os.path.join(REPORTS_DIR, ".sections_cache.json")
+
+# Fingerprint of the last insights report's inputs: the analysis CSV (path,
+# mtime, size) plus the mtime/size of every per-video analysis file it embeds,
+# so re-running the report on unchanged data returns the existing file
+REPORT_CACHE = os.path.join(REPORTS_DIR, ".report_cache.json")
+
+# Threads used to read per-video analysis markdown when building the report
+# (file reads release the GIL, so these overlap share/disk latency)
+REPORT_READ_MAX_WORKERS = 16
+
+# Optional local staging directory for CSV appends. When OUTPUT_DIR is on a
+# network share, rows are appended to a per-process shard here and copied to
+# the share in one sequential write (see csv_manager.flush_staging).
+# Configure via WORKFLOW_STAGING_DIR environment variable (unset = disabled).
+# Exposed as config.STAGING_DIR, resolved lazily (see end of module).
+def get_staging_dir() -> str:
+    """Return the local CSV staging directory, or "" when staging is disabled."""
+    return _env("WORKFLOW_STAGING_DIR", "").strip()
+
+
 # =============================================================================
 # Pipeline Settings
 # =============================================================================
 
-# Delay between Gemini API calls in seconds (rate limit protection)
+# Delay before retrying a failed (non-rate-limit) Gemini API call in seconds
 API_CALL_DELAY_SECONDS = 5.0
 
-# Video upload polling interval (seconds between File API state checks)
+# Number of videos processed in parallel by run_pipeline.py (--workers overrides)
+# Configure via PIPELINE_WORKERS environment variable (default 1 = sequential).
+# Exposed as config.PIPELINE_WORKERS, resolved lazily (see end of module).
+
+# Upper bound on concurrent ffprobe processes when prefetching video metadata
+# (capped so a large batch can't spawn one process per video)
+FFPROBE_MAX_WORKERS = min(os.cpu_count() or 1, 8)
+
+# Video upload polling: first File API state check after VIDEO_UPLOAD_POLL_INITIAL
+# seconds, growing by VIDEO_UPLOAD_POLL_BACKOFF each poll up to
+# VIDEO_UPLOAD_POLL_INTERVAL (so short videos aren't held for a full interval)
+VIDEO_UPLOAD_POLL_INITIAL = 0.5
+VIDEO_UPLOAD_POLL_BACKOFF = 1.5
 VIDEO_UPLOAD_POLL_INTERVAL = 5
 
 # Maximum time to wait for Gemini to process an uploaded video (seconds)
-VIDEO_UPLOAD_TIMEOUT = int(os.environ.get("VIDEO_UPLOAD_TIMEOUT", "300"))
+# Configure via VIDEO_UPLOAD_TIMEOUT environment variable (default 300).
+# Exposed as config.VIDEO_UPLOAD_TIMEOUT, resolved lazily (see end of module).
+
+# Maximum in-flight Gemini requests (uploads + generate_content) across all
+# --workers threads, so raising --workers can't exceed the API quota.
+# The effective limit starts at GEMINI_INITIAL_CONCURRENT_REQUESTS, grows by
+# GEMINI_CONCURRENCY_INCREASE per successful call and halves on a 429.
+GEMINI_MAX_CONCURRENT_REQUESTS = 4
+GEMINI_INITIAL_CONCURRENT_REQUESTS = 2
+GEMINI_CONCURRENCY_INCREASE = 0.5
+
+# Gemini request quota: generate_content calls are paced to this many per
+# minute across all workers (token bucket holding GEMINI_REQUEST_BURST
+# requests), so calls only wait when they would exceed the quota.
+# Configure via GEMINI_REQUESTS_PER_MINUTE environment variable (default 30,
+# 0 disables pacing). Exposed as config.GEMINI_REQUESTS_PER_MINUTE, resolved
+# lazily (see end of module).
+GEMINI_REQUEST_BURST = 2
+
+# Gemini Batch Mode (run_pipeline.py --batch): job state poll interval and
+# how long to wait for a job before cancelling it (batch SLA is 24 hours)
+GEMINI_BATCH_POLL_INTERVAL = 30
+GEMINI_BATCH_TIMEOUT = 24 * 3600
+
+# Videos per --batch group: each group is uploaded, run through Pass 1,
+# and its uploads deleted before the next group starts, so a large backlog
+# never holds more than this many files in File API storage (20 GB/project)
+GEMINI_BATCH_GROUP_SIZE = 50
 
 # Maximum retries for Gemini API calls
 MAX_API_RETRIES = 5
 
-# Initial backoff delay for rate limit errors (seconds)
+# Initial backoff delay for rate limit errors (seconds). Used only when the
+# 429 carries no retry hint (Retry-After header / RetryInfo retryDelay);
+# doubles per attempt up to RATE_LIMIT_MAX_BACKOFF, plus random jitter so
+# parallel workers don't retry in lockstep. A server retry hint is honored
+# but also capped at RATE_LIMIT_MAX_BACKOFF.
 RATE_LIMIT_INITIAL_BACKOFF = 10.0
+RATE_LIMIT_MAX_BACKOFF = 120.0
+RATE_LIMIT_JITTER_SECONDS = 5.0
 
 # Minimum file size in bytes to consider a video valid (skip corrupt/empty)
 MIN_FILE_SIZE_BYTES = 10_000  # 10 KB
 
+# Write buffer for CSV appends (large buffer = fewer SMB packets on the share)
+CSV_WRITE_BUFFER_BYTES = 1 << 20  # 1 MB
+
+# fsync the CSV to disk every N appended rows (crash safety for batch runs)
+CSV_FSYNC_EVERY_ROWS = 16
+
+# fsync the processed/rejected logs every N appended lines
+LOG_FSYNC_EVERY_LINES = 16
+
+# Copy buffer used when moving staged CSV shards onto the share
+CSV_STAGING_COPY_BYTES = 4 << 20  # 4 MB
+
+# Publish a staged CSV shard to the share every N rows (and on close)
+CSV_STAGING_FLUSH_EVERY_ROWS = 50
+
+# Rewrite workflow_sessions.csv with queued status updates every N videos,
+# or once the oldest queued update is this many seconds old (and on close),
+# instead of once per video. Bounds what a killed run can lose.
+SESSIONS_STATUS_FLUSH_EVERY = 10
+SESSIONS_STATUS_FLUSH_SECONDS = 60.0
+
 # =============================================================================
 # Video Quality Filtering
 # =============================================================================
@@ -87,12 +194,15 @@ FFMPEG_CHOCO_PATH = r"C:\ProgramData\chocolatey\bin\ffmpeg.exe"
 FFPROBE_CHOCO_PATH = r"C:\ProgramData\chocolatey\bin\ffprobe.exe"
 
 
+@functools.lru_cache(maxsize=1)
 def find_ffmpeg() -> str:
-    """Locate ffmpeg executable. Checks Chocolatey path first, then PATH."""
+    """Locate ffmpeg executable. Checks Chocolatey path first, then PATH.
+
+    The result is cached for the lifetime of the process.
+    """
     if os.path.isfile(FFMPEG_CHOCO_PATH):
         return FFMPEG_CHOCO_PATH
 
-    import shutil
     path = shutil.which("ffmpeg")
     if path:
         return path
@@ -104,12 +214,15 @@ def find_ffmpeg() -> str:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def find_ffprobe() -> str:
-    """Locate ffprobe executable. Checks Chocolatey path first, then PATH."""
+    """Locate ffprobe executable. Checks Chocolatey path first, then PATH.
+
+    The result is cached for the lifetime of the process.
+    """
     if os.path.isfile(FFPROBE_CHOCO_PATH):
         return FFPROBE_CHOCO_PATH
 
-    import shutil
     path = shutil.which("ffprobe")
     if path:
         return path
@@ -125,9 +238,20 @@ def find_ffprobe() -> str:
 # Gemini API
 # =============================================================================
 
-GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "").strip()
+def get_gemini_key() -> str:
+    """Return the Gemini API key from the environment / pipeline .env file."""
+    return _env("GEMINI_API_KEY").strip()
+
+
 GEMINI_MODEL = "gemini-2.0-flash"
 
+# Optional inference tier for interactive generate_content calls, e.g. "flex"
+# (billed at a discount in exchange for best-effort capacity and higher
+# latency). A call the tier sheds or the API rejects is retried on the
+# standard tier.
+# Configure via GEMINI_SERVICE_TIER environment variable (blank = standard tier).
+# Exposed as config.GEMINI_SERVICE_TIER, resolved lazily (see end of module).
+
 # =============================================================================
 # Education Analysis Settings
 # =============================================================================
@@ -146,15 +270,16 @@ MIN_EDUCATION_DURATION_SEC = 30
 # =============================================================================
 
 # CSV schema: filename metadata + video metadata + Gemini analysis (two-pass)
-CSV_COLUMNS = [
+# Tuples so the schema can't be mutated at runtime and can back itemgetters.
+CSV_COLUMNS = (
     # From filename (7 fields)
     "video_id",
     "username",
     "timestamp",
     "machine_id",
     "task_description",
-    "day_of_week",
-    "hour_of_day",
+    "day_of_week",   # weekday name, e.g. "Monday" (matches workflow_sessions.csv)
+    "hour_of_day",   # int 0-23, -1 if unknown
     # From video file (2 fields)
     "duration_sec",
     "file_size_mb",
@@ -174,10 +299,10 @@ CSV_COLUMNS = [
     "mp4_path",
     "analysis_md_path",
     "processed_at",
-]
+)
 
 # Education CSV schema: filename metadata + video metadata + education analysis
-EDUCATION_CSV_COLUMNS = [
+EDUCATION_CSV_COLUMNS = (
     # From filename (reuse)
     "video_id",
     "username",
@@ -202,4 +327,29 @@ EDUCATION_CSV_COLUMNS = [
     "mp4_path",
     "education_md_path",
     "processed_at",
-]
+)
+
+
+# =============================================================================
+# Lazy Environment Settings
+# =============================================================================
+
+# Environment-backed settings are resolved on first access (PEP 562) so that
+# importing plain constants such as CSV_COLUMNS never touches the .env file.
+_LAZY_ENV_SETTINGS = {
+    "SOURCE_SHARE": lambda: _env("WORKFLOW_SOURCE_SHARE", r"\\bulley-fs1\WORKFLOW").strip(),
+    "VIDEO_UPLOAD_TIMEOUT": lambda: int(_env("VIDEO_UPLOAD_TIMEOUT", "300")),
+    "PIPELINE_WORKERS": lambda: max(1, int(_env("PIPELINE_WORKERS", "1"))),
+    "GEMINI_REQUESTS_PER_MINUTE": lambda: max(0.0, float(_env("GEMINI_REQUESTS_PER_MINUTE", "30"))),
+    "GEMINI_SERVICE_TIER": lambda: _env("GEMINI_SERVICE_TIER", "").strip().lower(),
+    "STAGING_DIR": get_staging_dir,
+    "GEMINI_API_KEY": get_gemini_key,
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ENV_SETTINGS:
+        value = _LAZY_ENV_SETTINGS[name]()
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,36 +9,87 @@ Manages the append-only analysis CSV, processing log, and per-video markdown fil
 - Never overwrites existing data
 """
 
+import atexit
 import csv
+import errno
+import functools
+import hashlib
+import io
+import operator
 import os
 import re
+import shutil
+import struct
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 
+import fast_json
 from config import (
     ANALYSES_DIR,
     ANALYSIS_CSV,
     CONVERSION_CSV,
     CSV_COLUMNS,
+    CSV_FSYNC_EVERY_ROWS,
+    CSV_STAGING_COPY_BYTES,
+    CSV_STAGING_FLUSH_EVERY_ROWS,
+    CSV_WRITE_BUFFER_BYTES,
     EDUCATION_ANALYSES_DIR,
     EDUCATION_CSV,
     EDUCATION_CSV_COLUMNS,
     EDUCATION_PROCESSING_LOG,
     EDUCATION_REJECTED_LOG,
+    LOG_FSYNC_EVERY_LINES,
     MISRECORDINGS_DIR,
     OUTPUT_DIR,
     PROCESSING_LOG,
     REJECTED_LOG,
+    SESSIONS_STATUS_FLUSH_EVERY,
+    SESSIONS_STATUS_FLUSH_SECONDS,
+    get_staging_dir,
 )
 
 
+def _now_iso() -> str:
+    """Local time as YYYY-MM-DDTHH:MM:SS, i.e. datetime.now().isoformat(timespec="seconds")."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+# Serializes shared CSV/log writes when run_pipeline processes videos in parallel
+_write_lock = threading.RLock()
+
+
+def _serialized(func):
+    """Run `func` while holding the module-wide write lock."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _write_lock:
+            return func(*args, **kwargs)
+    return wrapper
+
+
+# One-time filesystem checks, cached per process to avoid repeated SMB stat calls
+_dirs_ready = False
+_csv_initialized: set[str] = set()
+
+
 def ensure_output_dir() -> None:
     """Create the output directory, reports, and analyses subdirectories if they don't exist."""
+    global _dirs_ready
+    if _dirs_ready:
+        return
+
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     os.makedirs(os.path.join(OUTPUT_DIR, "reports"), exist_ok=True)
     os.makedirs(ANALYSES_DIR, exist_ok=True)
     os.makedirs(EDUCATION_ANALYSES_DIR, exist_ok=True)
     os.makedirs(MISRECORDINGS_DIR, exist_ok=True)
+    _dirs_ready = True
 
 
 def move_to_misrecordings(source_path: str = "", mp4_path: str = "", reason: str = "") -> bool:
@@ -54,34 +105,36 @@ def move_to_misrecordings(source_path: str = "", mp4_path: str = "", reason: str
     Returns:
         True if at least one file was moved or deleted successfully, False otherwise.
     """
-    import shutil
-
     moved_any = False
 
     # Move source .webm file into a sibling _misrecordings folder on the share
     if source_path and os.path.isfile(source_path):
         try:
-            source_dir = Path(source_path).parent
-            misrecordings_dir = source_dir / "_misrecordings"
+            source_dir, filename = os.path.split(source_path)
+            misrecordings_dir = os.path.join(source_dir, "_misrecordings")
             os.makedirs(misrecordings_dir, exist_ok=True)
 
-            filename = Path(source_path).name
-            dest_path = misrecordings_dir / filename
+            dest_path = os.path.join(misrecordings_dir, filename)
 
             # If destination already exists, add a timestamp
-            if dest_path.exists():
-                name_parts = Path(filename).stem
-                ext = Path(filename).suffix
+            if os.path.exists(dest_path):
+                name_parts, ext = os.path.splitext(filename)
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                dest_path = misrecordings_dir / f"{name_parts}_{timestamp}{ext}"
-
-            shutil.move(source_path, str(dest_path))
-            print(f"  Moved source to: {dest_path.name}")
+                dest_path = os.path.join(misrecordings_dir, f"{name_parts}_{timestamp}{ext}")
+
+            # Same-volume move is a single rename; only copy across volumes
+            try:
+                os.replace(source_path, dest_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(source_path, dest_path)
+            print(f"  Moved source to: {os.path.basename(dest_path)}")
             moved_any = True
 
             # Create a small log file with the reason
             if reason:
-                reason_file = str(dest_path) + ".reason.txt"
+                reason_file = dest_path + ".reason.txt"
                 with open(reason_file, "w", encoding="utf-8") as f:
                     f.write(f"Moved at: {datetime.now().isoformat()}\n")
                     f.write(f"Reason: {reason}\n")
@@ -93,7 +146,7 @@ def move_to_misrecordings(source_path: str = "", mp4_path: str = "", reason: str
     if mp4_path and os.path.isfile(mp4_path):
         try:
             os.remove(mp4_path)
-            print(f"  Deleted MP4: {Path(mp4_path).name}")
+            print(f"  Deleted MP4: {os.path.basename(mp4_path)}")
             moved_any = True
         except Exception as e:
             print(f"[ERROR] Failed to delete MP4 video: {e}")
@@ -104,83 +157,787 @@ def move_to_misrecordings(source_path: str = "", mp4_path: str = "", reason: str
     return moved_any
 
 
+def _csv_needs_header(csv_path: str) -> bool:
+    """True if the CSV is missing or empty (e.g. left behind by a crashed run). One stat call."""
+    try:
+        return os.stat(csv_path).st_size == 0
+    except FileNotFoundError:
+        return True
+
+
 def initialize_csv(csv_path: str = ANALYSIS_CSV) -> None:
     """Create the CSV file with headers if it doesn't exist."""
+    if csv_path in _csv_initialized:
+        return
+
     ensure_output_dir()
 
-    if not os.path.isfile(csv_path):
+    if _csv_needs_header(csv_path):
         with open(csv_path, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             writer.writerow(CSV_COLUMNS)
         print(f"[INFO] Created analysis CSV: {csv_path}")
+    _csv_initialized.add(csv_path)
+
 
+# video_ids are the first 12 hex chars of a SHA-256 (see filename_parser)
+_HEX_VIDEO_ID_RE = re.compile(r"[0-9a-f]{12}")
 
-def load_processed_ids(log_path: str = PROCESSING_LOG) -> set[str]:
+
+class ProcessedIndex:
     """
-    Load the set of already-processed video IDs from the processing log.
+    Compact membership index over video_ids.
 
-    Returns:
-        Set of video_id strings that have already been processed.
+    Standard 12-hex-char ids are packed into a sorted array of 64-bit ints
+    (8 bytes each, vs ~100 bytes per str in a set) and looked up by binary
+    search; anything else falls back to a small set. Supports the set
+    operations the pipeline uses: `in`, len(), iteration, `|` and add().
+    """
+
+    def __init__(self, video_ids=()):
+        packed = set()
+        other = set()
+        for vid in video_ids:
+            if _HEX_VIDEO_ID_RE.fullmatch(vid):
+                packed.add(int(vid, 16))
+            else:
+                other.add(vid)
+        self._packed = array("Q", sorted(packed))
+        self._other = other
+
+    def __contains__(self, video_id) -> bool:
+        if isinstance(video_id, str) and _HEX_VIDEO_ID_RE.fullmatch(video_id):
+            key = int(video_id, 16)
+            i = bisect_left(self._packed, key)
+            return i < len(self._packed) and self._packed[i] == key
+        return video_id in self._other
+
+    def __len__(self) -> int:
+        return len(self._packed) + len(self._other)
+
+    def __iter__(self):
+        for key in self._packed:
+            yield f"{key:012x}"
+        yield from self._other
+
+    def __or__(self, other) -> "ProcessedIndex":
+        merged = ProcessedIndex()
+        merged._packed = array("Q", sorted(set(self._packed).union(
+            int(v, 16) for v in other if _HEX_VIDEO_ID_RE.fullmatch(v)
+        )))
+        merged._other = self._other | {v for v in other if not _HEX_VIDEO_ID_RE.fullmatch(v)}
+        return merged
+
+    __ror__ = __or__
+
+    @classmethod
+    def from_packed(cls, data: bytes) -> "ProcessedIndex":
+        """Build an index from little-endian uint64 records (see packed_bytes)."""
+        keys = array("Q")
+        keys.frombytes(data)
+        if sys.byteorder == "big":
+            keys.byteswap()
+        index = cls()
+        # Records are appended unsorted and may repeat; array -> set -> sort stays in C
+        index._packed = array("Q", sorted(set(keys)))
+        return index
+
+    def packed_bytes(self) -> bytes:
+        """Serialize the packed ids as little-endian uint64 records."""
+        keys = array("Q", self._packed)
+        if sys.byteorder == "big":
+            keys.byteswap()
+        return keys.tobytes()
+
+    def add(self, video_id: str) -> None:
+        """Insert one id, keeping the packed array sorted."""
+        if video_id in self:
+            return
+        if _HEX_VIDEO_ID_RE.fullmatch(video_id):
+            key = int(video_id, 16)
+            self._packed.insert(bisect_left(self._packed, key), key)
+        else:
+            self._other.add(video_id)
+
+
+# Loaded id collections keyed by log path, with the log's (mtime_ns, size) at
+# load time. mark_* add to a cached collection in place, so reloading a log
+# during a run costs one stat instead of a full reread.
+_id_cache: dict[str, tuple[tuple[int, int], object]] = {}
+
+
+def _log_signature(log_path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(log_path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _cached_ids(log_path: str):
+    """Return the cached ids for `log_path` if the log is unchanged, else None."""
+    entry = _id_cache.get(log_path)
+    if entry is not None and entry[0] == _log_signature(log_path):
+        return entry[1]
+    return None
+
+
+def _cache_ids(log_path: str, ids):
+    signature = _log_signature(log_path)
+    if signature is not None:
+        _id_cache[log_path] = (signature, ids)
+    return ids
+
+
+def _cache_add(log_path: str, video_id: str, writer) -> None:
+    """Record our own append in the cache so the next load can skip the reread."""
+    entry = _id_cache.get(log_path)
+    if entry is None:
+        return
+    ids = entry[1]
+    ids.add(video_id)
+    try:
+        _id_cache[log_path] = (writer.signature(), ids)
+    except OSError:
+        del _id_cache[log_path]
+
+
+def _index_path(log_path: str) -> str:
+    """Binary sidecar of a processing log: one 8-byte record per hex video_id."""
+    return f"{log_path}.idx"
+
+
+# Index header: magic, size of the text log the index was built from, and the
+# number of records written at build time (little-endian). Each record appended
+# afterwards stands for one _INDEX_LINE_BYTES line appended to the log.
+_INDEX_HEADER = struct.Struct("<8sQQ")
+_INDEX_MAGIC = b"WCIDX\x00\x00\x01"
+_INDEX_LINE_BYTES = 13  # 12 hex chars + "\n", as written by mark_processed
+
+
+def _load_index_file(log_path: str) -> ProcessedIndex | None:
     """
-    processed = set()
+    Load the binary index for `log_path`, or None if it must be rebuilt.
 
+    The index is trusted only when it accounts for every byte of the text log
+    (build-time log size plus one line per appended record) and is at least
+    as new as the log. mark_processed appends to the log first and the index
+    second, so an interrupted append or a hand-edited log forces a rebuild
+    from the text log, even where coarse share mtimes can't tell them apart.
+    """
+    idx_path = _index_path(log_path)
+    try:
+        log_st = os.stat(log_path)
+        if os.stat(idx_path).st_mtime < log_st.st_mtime:
+            return None
+        with open(idx_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    header_size = _INDEX_HEADER.size
+    if len(data) < header_size or (len(data) - header_size) % 8:
+        return None
+    magic, built_log_size, built_count = _INDEX_HEADER.unpack_from(data)
+    appended = (len(data) - header_size) // 8 - built_count
+    if magic != _INDEX_MAGIC or appended < 0:
+        return None
+    if built_log_size + appended * _INDEX_LINE_BYTES != log_st.st_size:
+        return None
+    return ProcessedIndex.from_packed(memoryview(data)[header_size:])
+
+
+def _write_index_file(log_path: str, index: ProcessedIndex, log_size: int) -> None:
+    """
+    Atomically replace the binary index built from `log_size` bytes of the
+    log; drop it if some ids can't be packed.
+    """
+    idx_path = _index_path(log_path)
+    # An open append handle would keep writing to the replaced file
+    writer = _log_writers.pop(idx_path, None)
+    if writer is not None:
+        writer.close()
+    try:
+        if index._other:
+            if os.path.exists(idx_path):
+                os.remove(idx_path)
+            return
+        tmp_path = f"{idx_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, log_size, len(index._packed)))
+            f.write(index.packed_bytes())
+        os.replace(tmp_path, idx_path)
+    except OSError as e:
+        print(f"[WARN] Could not write processed index {idx_path}: {e}")
+
+
+def iter_processed_ids(log_path: str = PROCESSING_LOG):
+    """
+    Stream video IDs from the processing log without materializing them.
+
+    For callers that scan the log once (counting, exporting, feeding another
+    index); membership checks should use load_processed_ids() instead.
+
+    Yields:
+        video_id strings in log order (duplicates included).
+    """
     if not os.path.isfile(log_path):
-        return processed
+        return
 
     try:
         with open(log_path, "r", encoding="utf-8") as f:
             for line in f:
                 vid = line.strip()
                 if vid:
-                    processed.add(vid)
+                    yield vid
     except OSError as e:
         print(f"[WARN] Could not read processing log: {e}")
 
-    return processed
+
+def load_processed_ids(log_path: str = PROCESSING_LOG) -> ProcessedIndex:
+    """
+    Load the already-processed video IDs from the processing log.
+
+    Reads the binary sidecar index (processed.log.idx) when it is current and
+    falls back to parsing the text log, rebuilding the index from it.
+
+    Returns:
+        ProcessedIndex of video_id strings that have already been processed.
+    """
+    if not os.path.isfile(log_path):
+        return ProcessedIndex()
+
+    index = _cached_ids(log_path)
+    if index is not None:
+        return index
+
+    index = _load_index_file(log_path)
+    if index is not None:
+        return _cache_ids(log_path, index)
+
+    try:
+        # One bulk read + C-level split instead of a readline loop over the share
+        with open(log_path, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        print(f"[WARN] Could not read processing log: {e}")
+        return ProcessedIndex()
+
+    index = ProcessedIndex(
+        vid for vid in (line.strip() for line in data.decode("utf-8").splitlines()) if vid
+    )
+    _write_index_file(log_path, index, len(data))
+    return _cache_ids(log_path, index)
+
+
+class _LogWriter:
+    """
+    Append-only writer for the one-line-per-video logs.
+
+    Holds a single O_APPEND descriptor for the whole run and writes each line
+    with one os.write() call, so there is no reopen (SMB round-trip) per video.
+    O_APPEND writes of a short line are atomic on POSIX; on Windows shares the
+    win is collapsing many open/close cycles into one handle. Lines reach the
+    OS immediately and are fsynced every `fsync_every` lines.
+    """
+
+    _FLAGS = os.O_WRONLY | os.O_APPEND | getattr(os, "O_BINARY", 0)
+
+    def __init__(
+        self,
+        log_path: str,
+        fsync_every: int = LOG_FSYNC_EVERY_LINES,
+        create: bool = True,
+    ):
+        self.log_path = log_path
+        self.fsync_every = fsync_every
+        self.create = create
+        self._fd = None
+        self._unsynced = 0
+
+    def write_line(self, line: str) -> None:
+        """Append one line (newline added). Raises OSError on failure."""
+        self.write_bytes(f"{line}\n".encode("utf-8"))
+
+    def write_bytes(self, data: bytes) -> None:
+        """
+        Append one raw record. Raises OSError on failure, including
+        FileNotFoundError when the log is missing and `create` is False.
+        """
+        if self._fd is None:
+            ensure_output_dir()
+            flags = self._FLAGS | (os.O_CREAT if self.create else 0)
+            self._fd = os.open(self.log_path, flags, 0o644)
+        os.write(self._fd, data)
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every:
+            self.sync()
+
+    def sync(self) -> None:
+        if self._fd is None:
+            return
+        os.fsync(self._fd)
+        self._unsynced = 0
+
+    def signature(self) -> tuple[int, int]:
+        """(mtime_ns, size) of the open log, without a path lookup."""
+        st = os.fstat(self._fd)
+        return (st.st_mtime_ns, st.st_size)
+
+    def close(self) -> None:
+        if self._fd is None:
+            return
+        try:
+            self.sync()
+        except OSError as e:
+            print(f"[WARN] Could not sync log {self.log_path}: {e}")
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+
+# Log writers shared by mark_processed/mark_rejected, keyed by path
+_log_writers: dict[str, _LogWriter] = {}
+
+
+def _get_log_writer(log_path: str, create: bool = True) -> _LogWriter:
+    writer = _log_writers.get(log_path)
+    if writer is None:
+        writer = _LogWriter(log_path, create=create)
+        _log_writers[log_path] = writer
+    return writer
+
+
+def _append_to_index(log_path: str, video_id: str) -> None:
+    """Keep the binary index in step with the text log (only if it already exists)."""
+    idx_path = _index_path(log_path)
+    if _HEX_VIDEO_ID_RE.fullmatch(video_id):
+        try:
+            key = int(video_id, 16).to_bytes(8, "little")
+            _get_log_writer(idx_path, create=False).write_bytes(key)
+        except FileNotFoundError:
+            pass  # No index yet; the next load_processed_ids() builds it
+        except OSError as e:
+            print(f"[WARN] Could not update processed index {idx_path}: {e}")
+        return
+
+    # Unpackable id: retire the index so the next load reads the text log
+    writer = _log_writers.pop(idx_path, None)
+    if writer is not None:
+        writer.close()
+    try:
+        os.remove(idx_path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"[WARN] Could not remove processed index {idx_path}: {e}")
 
 
+@_serialized
 def mark_processed(video_id: str, log_path: str = PROCESSING_LOG) -> None:
     """Append a video_id to the processing log (only for successfully analyzed videos)."""
-    ensure_output_dir()
-
+    writer = _get_log_writer(log_path)
     try:
-        with open(log_path, "a", encoding="utf-8") as f:
-            f.write(f"{video_id}\n")
+        writer.write_line(video_id)
     except OSError as e:
         print(f"[ERROR] Could not write to processing log: {e}")
+        return
+    _cache_add(log_path, video_id, writer)
+    _append_to_index(log_path, video_id)
 
 
+@_serialized
 def mark_rejected(video_id: str, reason: str = "") -> None:
     """Append a video_id to the rejected log with reason."""
-    ensure_output_dir()
-
+    writer = _get_log_writer(REJECTED_LOG)
     try:
-        with open(REJECTED_LOG, "a", encoding="utf-8") as f:
-            timestamp = datetime.now().isoformat(timespec="seconds")
-            f.write(f"{video_id}|{timestamp}|{reason}\n")
+        timestamp = _now_iso()
+        writer.write_line(f"{video_id}|{timestamp}|{reason}")
     except OSError as e:
         print(f"[ERROR] Could not write to rejected log: {e}")
+        return
+    _cache_add(REJECTED_LOG, video_id, writer)
+
 
+def _first_fields(data: bytes) -> ProcessedIndex:
+    """Index of first `|`-separated fields (the video_id) from a bulk-read log."""
+    return ProcessedIndex(
+        vid for vid in (line.partition("|")[0].strip() for line in data.decode("utf-8").splitlines()) if vid
+    )
 
-def load_rejected_ids() -> set[str]:
-    """Load the set of rejected video IDs."""
-    rejected = set()
 
+def load_rejected_ids() -> ProcessedIndex:
+    """Load the rejected video IDs as a compact ProcessedIndex."""
     if not os.path.isfile(REJECTED_LOG):
+        return ProcessedIndex()
+
+    rejected = _cached_ids(REJECTED_LOG)
+    if rejected is not None:
         return rejected
 
     try:
-        with open(REJECTED_LOG, "r", encoding="utf-8") as f:
-            for line in f:
-                parts = line.strip().split("|")
-                if parts:
-                    rejected.add(parts[0])  # video_id is first field
+        with open(REJECTED_LOG, "rb") as f:
+            data = f.read()
     except OSError as e:
         print(f"[WARN] Could not read rejected log: {e}")
+        return ProcessedIndex()
+
+    return _cache_ids(REJECTED_LOG, _first_fields(data))
+
+
+def _shard_path(csv_path: str, staging_dir: str) -> str:
+    """Per-process staging shard for `csv_path`, e.g. workflow_analysis.shard-1234.csv."""
+    return os.path.join(staging_dir, f"{Path(csv_path).stem}.shard-{os.getpid()}.csv")
+
+
+def _pid_alive(pid: int) -> bool:
+    """True if process `pid` is (or may be) still running on this machine."""
+    if pid <= 0:
+        return False
+    if sys.platform == "win32":
+        # os.kill(pid, 0) would terminate the process on Windows; ask the kernel instead
+        import ctypes
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return ctypes.get_last_error() == 5  # ERROR_ACCESS_DENIED: exists, not ours
+        try:
+            exit_code = ctypes.c_ulong()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return True
+            return exit_code.value == 259  # STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True  # e.g. EPERM: the process exists but belongs to another user
+    return True
+
+
+def _complete_rows_length(f) -> int:
+    """
+    Byte length of the leading complete CSV records in binary file `f`.
+
+    A record ends at a newline outside quotes, i.e. one preceded by an even
+    number of `"` (escaped quotes come in pairs). Anything after the last such
+    newline is a row a crashed writer never finished.
+    """
+    quotes = 0
+    complete = 0
+    offset = 0
+    while True:
+        chunk = f.read(CSV_STAGING_COPY_BYTES)
+        if not chunk:
+            return complete
+        pos = chunk.find(b"\n")
+        start = 0
+        while pos != -1:
+            quotes += chunk.count(b'"', start, pos)
+            if quotes % 2 == 0:
+                complete = offset + pos + 1
+            start = pos
+            pos = chunk.find(b"\n", pos + 1)
+        quotes += chunk.count(b'"', start)
+        offset += len(chunk)
+
+
+def _discard_shard(path: str) -> None:
+    """Delete a published shard; if that fails, empty it so its rows aren't published twice."""
+    try:
+        os.remove(path)
+        return
+    except OSError as e:
+        print(f"[WARN] Could not delete staged shard {path}: {e}")
+    try:
+        open(path, "wb").close()
+    except OSError as e:
+        print(f"[WARN] Could not empty staged shard {path}, its rows may be published again: {e}")
+
+
+def flush_staging(
+    csv_path: str = ANALYSIS_CSV,
+    columns: tuple[str, ...] = CSV_COLUMNS,
+    staging_dir: str | None = None,
+) -> int:
+    """
+    Append staged shards for `csv_path` to the CSV and delete them locally.
+
+    Only this process's shard and shards left behind by processes that are no
+    longer running are touched; a live writer's shard is left alone. Each shard
+    reaches the CSV as one sequential, fsynced write of its complete rows (a
+    torn last row from a crashed writer is dropped). If the copy fails the CSV
+    is truncated back to its previous size and the shard is kept, so the next
+    flush retries it without duplicating rows.
+
+    Args:
+        csv_path: Destination CSV (usually on the network share)
+        columns: Header written if the destination is new
+        staging_dir: Directory holding the shards (default: config.STAGING_DIR)
+
+    Returns:
+        Number of shards published.
+    """
+    if staging_dir is None:
+        staging_dir = get_staging_dir()
+    if not staging_dir or not os.path.isdir(staging_dir):
+        return 0
+
+    prefix = f"{Path(csv_path).stem}.shard-"
+    own_pid = os.getpid()
+    published = 0
+    for entry in os.scandir(staging_dir):
+        if not (entry.name.startswith(prefix) and entry.name.endswith(".csv")):
+            continue
+        pid = entry.name[len(prefix):-len(".csv")]
+        if not pid.isdigit():
+            continue
+        if int(pid) != own_pid and _pid_alive(int(pid)):
+            continue
+        try:
+            if entry.stat().st_size == 0:
+                _discard_shard(entry.path)
+                continue
+        except OSError:
+            continue
+
+        ensure_output_dir()
+        needs_header = _csv_needs_header(csv_path)
+        try:
+            with open(entry.path, "rb") as src, open(csv_path, "ab") as dst:
+                length = _complete_rows_length(src)
+                torn = src.tell() - length
+                src.seek(0)
+                start = dst.tell()
+                try:
+                    if length and needs_header:
+                        header = io.StringIO()
+                        csv.writer(header).writerow(columns)
+                        dst.write(header.getvalue().encode("utf-8"))
+                    remaining = length
+                    while remaining:
+                        chunk = src.read(min(remaining, CSV_STAGING_COPY_BYTES))
+                        if not chunk:
+                            break
+                        dst.write(chunk)
+                        remaining -= len(chunk)
+                    dst.flush()
+                    os.fsync(dst.fileno())
+                except OSError:
+                    dst.truncate(start)
+                    raise
+        except OSError as e:
+            print(f"[WARN] Could not publish staged rows {entry.path} to {csv_path}: {e}")
+            continue
+
+        if torn:
+            print(f"[WARN] Dropped {torn} bytes of an unfinished row from {entry.path}")
+        _discard_shard(entry.path)
+        if length:
+            _csv_initialized.add(csv_path)
+            published += 1
+
+    return published
+
+
+class CsvAppender:
+    """
+    Keep an append-only CSV open across many rows.
+
+    Opening the CSV on the network share costs a full SMB round-trip, so batch
+    runs hold one appender for the whole loop instead of reopening per row.
+    Each row is flushed to the OS as it is written (so a crash never loses a
+    row that was reported as written) and fsynced every `fsync_every` rows.
+
+    With a `staging_dir`, rows go to a local per-process shard instead and are
+    published to the CSV by flush_staging() every
+    CSV_STAGING_FLUSH_EVERY_ROWS rows and on close.
+
+    Usage:
+        with CsvAppender(ANALYSIS_CSV) as appender:
+            appender.add(row)
+    """
+
+    def __init__(
+        self,
+        csv_path: str = ANALYSIS_CSV,
+        columns: tuple[str, ...] = CSV_COLUMNS,
+        fsync_every: int = CSV_FSYNC_EVERY_ROWS,
+        staging_dir: str = "",
+    ):
+        self.csv_path = csv_path
+        self.columns = tuple(columns)
+        # Pulls every column out of a row dict in schema order in one C call
+        self._getter = operator.itemgetter(*self.columns)
+        self.fsync_every = fsync_every
+        self.staging_dir = staging_dir
+        self._write_path = _shard_path(csv_path, staging_dir) if staging_dir else csv_path
+        self._f = None
+        self._writer = None
+        self._unsynced = 0
+        self._staged = 0
+
+    def open(self) -> "CsvAppender":
+        """Create the CSV (with header) if needed and open it for appending."""
+        if self._f is not None:
+            return self
+
+        ensure_output_dir()
+        if self.staging_dir:
+            # Shards hold data rows only; the header is written on publish.
+            # Shards left behind by a crashed run are published first.
+            os.makedirs(self.staging_dir, exist_ok=True)
+            flush_staging(self.csv_path, self.columns, self.staging_dir)
+            is_new = False
+        else:
+            is_new = self.csv_path not in _csv_initialized and _csv_needs_header(self.csv_path)
+        # Explicit 1 MB BufferedWriter under the text layer: a batch written by
+        # add_rows() reaches the share in as few SMB writes as possible.
+        raw = open(self._write_path, "ab", buffering=CSV_WRITE_BUFFER_BYTES)
+        self._f = io.TextIOWrapper(raw, encoding="utf-8", newline="", write_through=False)
+        self._writer = csv.writer(self._f)
+        if is_new:
+            self._writer.writerow(self.columns)
+            self._f.flush()
+            print(f"[INFO] Created CSV: {self.csv_path}")
+            _csv_initialized.add(self.csv_path)
+        return self
+
+    def add(self, row_data: dict) -> bool:
+        """
+        Append a single row.
+
+        Args:
+            row_data: Dictionary with keys matching the appender's columns.
+                      Missing keys will be filled with empty strings.
+
+        Returns:
+            True if the row was written successfully.
+        """
+        if "processed_at" not in row_data:
+            row_data["processed_at"] = _now_iso()
+
+        # csv.writer stringifies numbers and writes None as "" in C, so values
+        # (ints/floats included) are handed over without Python-side coercion.
+        row = self._getter(defaultdict(str, row_data))
+
+        try:
+            self.open()
+            self._writer.writerow(row)
+            self._f.flush()
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_every:
+                self.sync()
+            self._after_write(1)
+            return True
+        except OSError as e:
+            print(f"[ERROR] Could not append to CSV {self.csv_path}: {e}")
+            return False
+
+    def add_rows(self, rows) -> bool:
+        """
+        Append a batch of row tuples (already in column order) in one write.
+
+        Args:
+            rows: Iterable of tuples, e.g. from build_row_tuple().
+
+        Returns:
+            True if the batch was written successfully.
+        """
+        batch = list(rows)
+        if not batch:
+            return True
+
+        try:
+            self.open()
+            self._writer.writerows(batch)
+            self._f.flush()
+            self._unsynced += len(batch)
+            if self._unsynced >= self.fsync_every:
+                self.sync()
+            self._after_write(len(batch))
+            return True
+        except OSError as e:
+            print(f"[ERROR] Could not append to CSV {self.csv_path}: {e}")
+            return False
 
-    return rejected
+    def _after_write(self, count: int) -> None:
+        """Publish the staged shard once enough rows have accumulated."""
+        if not self.staging_dir:
+            return
+        self._staged += count
+        if self._staged >= CSV_STAGING_FLUSH_EVERY_ROWS:
+            self.publish()
+
+    def sync(self) -> None:
+        """Flush buffered rows and fsync them to disk."""
+        if self._f is None:
+            return
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        self._unsynced = 0
+
+    def publish(self) -> None:
+        """Close the local shard and append it to the CSV (no-op without staging)."""
+        if not self.staging_dir:
+            return
+        self._close_file()
+        flush_staging(self.csv_path, self.columns, self.staging_dir)
+        self._staged = 0
+
+    def _close_file(self) -> None:
+        if self._f is None:
+            return
+        try:
+            self.sync()
+        except OSError as e:
+            print(f"[WARN] Could not sync CSV {self._write_path}: {e}")
+        finally:
+            self._f.close()
+            self._f = None
+            self._writer = None
+
+    def close(self) -> None:
+        """Sync and close the underlying file, publishing any staged rows."""
+        self._close_file()
+        if self._staged:
+            self.publish()
+
+    def __enter__(self) -> "CsvAppender":
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+# Lazily-opened appenders shared by append_row/append_education_row, keyed by path
+_shared_appenders: dict[str, CsvAppender] = {}
+
+
+def _get_shared_appender(csv_path: str, columns: tuple[str, ...]) -> CsvAppender:
+    appender = _shared_appenders.get(csv_path)
+    if appender is None:
+        appender = CsvAppender(csv_path, columns, staging_dir=get_staging_dir())
+        _shared_appenders[csv_path] = appender
+    return appender
 
 
+@atexit.register
+@_serialized
+def close_shared_writers() -> None:
+    """Apply queued session status updates and close all CSV appenders and log writers."""
+    flush_sessions_status()
+    for appender in _shared_appenders.values():
+        appender.close()
+    _shared_appenders.clear()
+    for writer in _log_writers.values():
+        writer.close()
+    _log_writers.clear()
+
+
+@_serialized
 def append_row(
     row_data: dict,
     csv_path: str = ANALYSIS_CSV,
@@ -188,6 +945,8 @@ def append_row(
     """
     Append a single analysis row to the CSV.
 
+    Reuses a process-wide CsvAppender so repeated calls don't reopen the file.
+
     Args:
         row_data: Dictionary with keys matching CSV_COLUMNS.
                   Missing keys will be filled with empty strings.
@@ -196,35 +955,64 @@ def append_row(
     Returns:
         True if the row was written successfully.
     """
-    initialize_csv(csv_path)
+    return _get_shared_appender(csv_path, CSV_COLUMNS).add(row_data)
 
-    # Build row in column order, filling missing fields
-    row_data.setdefault("processed_at", datetime.now().isoformat(timespec="seconds"))
 
-    row = []
-    for col in CSV_COLUMNS:
-        value = row_data.get(col, "")
-        row.append(str(value) if value is not None else "")
+def _json_cell(value):
+    """Serialize list-valued fields to a JSON string (already-serialized strings pass through)."""
+    if isinstance(value, (list, tuple)):
+        return fast_json.dumps(value)
+    return value
 
-    try:
-        with open(csv_path, "a", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(row)
-        return True
-    except OSError as e:
-        print(f"[ERROR] Could not append to CSV: {e}")
-        return False
 
+# Column spec for build_row_tuple(): (column, source, default, converter).
+# Sources: "parsed" = filename_parser, "video" = frame_extractor metadata,
+# "gemini" = Gemini Pass 2 structured fields, "args" = build_row_tuple() args.
+_ROW_SPEC = (
+    # From filename parser
+    ("video_id", "parsed", "", None),
+    ("username", "parsed", "", None),
+    ("timestamp", "parsed", "", None),
+    ("machine_id", "parsed", "", None),
+    ("task_description", "parsed", "", None),
+    ("day_of_week", "parsed", "", None),
+    ("hour_of_day", "parsed", "", None),
+    # From video file
+    ("duration_sec", "video", -1, None),
+    ("file_size_mb", "video", 0, None),
+    # From Gemini Pass 2 structured analysis
+    ("workflow_description", "gemini", "", None),
+    ("primary_app", "gemini", "", None),
+    ("app_sequence", "gemini", "[]", _json_cell),
+    ("detected_actions", "gemini", "[]", _json_cell),
+    ("automation_score", "gemini", 0.0, None),
+    ("workflow_category", "gemini", "", None),
+    ("sop_step_count", "gemini", 0, None),
+    ("automation_candidate_count", "gemini", 0, None),
+    ("top_automation_candidate", "gemini", "", None),
+    # Metadata
+    ("source_path", "parsed", "", None),
+    ("mp4_path", "args", "", None),
+    ("analysis_md_path", "args", "", None),
+    ("processed_at", "args", "", None),
+)
+
+if tuple(spec[0] for spec in _ROW_SPEC) != CSV_COLUMNS:
+    raise RuntimeError("csv_manager._ROW_SPEC is out of sync with config.CSV_COLUMNS")
 
-def build_row(
+
+def build_row_tuple(
     parsed_metadata: dict,
     video_metadata: dict,
     gemini_structured: dict,
     analysis_md_path: str = "",
     mp4_path: str = "",
-) -> dict:
+) -> tuple:
     """
-    Merge all data sources into a single row dict matching CSV_COLUMNS.
+    Merge all data sources into a single row tuple in CSV_COLUMNS order.
+
+    Tuples skip the per-row dict and can be handed straight to
+    CsvAppender.add_rows() / csv.writer.writerows() in batches.
 
     Args:
         parsed_metadata: From filename_parser.parse_filename()
@@ -234,52 +1022,47 @@ def build_row(
         mp4_path: Path to the converted MP4 file (if available)
 
     Returns:
-        Dict with all CSV_COLUMNS keys populated.
+        Tuple with one value per CSV_COLUMNS entry.
     """
-    row = {}
-
-    # From filename parser
-    row["video_id"] = parsed_metadata.get("video_id", "")
-    row["username"] = parsed_metadata.get("username", "")
-    row["timestamp"] = parsed_metadata.get("timestamp", "")
-    row["machine_id"] = parsed_metadata.get("machine_id", "")
-    row["task_description"] = parsed_metadata.get("task_description", "")
-    row["day_of_week"] = parsed_metadata.get("day_of_week", "")
-    row["hour_of_day"] = parsed_metadata.get("hour_of_day", "")
+    sources = {
+        "parsed": parsed_metadata,
+        "video": video_metadata,
+        "gemini": gemini_structured or {},
+        "args": {
+            "mp4_path": mp4_path,
+            "analysis_md_path": analysis_md_path,
+            "processed_at": _now_iso(),
+        },
+    }
+    row = []
+    for column, source, default, convert in _ROW_SPEC:
+        value = sources[source].get(column, default)
+        row.append(convert(value) if convert else value)
+    return tuple(row)
 
-    # From video file
-    row["duration_sec"] = video_metadata.get("duration_sec", -1)
-    row["file_size_mb"] = video_metadata.get("file_size_mb", 0)
 
-    # From Gemini Pass 2 structured analysis
-    if gemini_structured:
-        row["workflow_description"] = gemini_structured.get("workflow_description", "")
-        row["primary_app"] = gemini_structured.get("primary_app", "")
-        row["app_sequence"] = gemini_structured.get("app_sequence", "[]")
-        row["detected_actions"] = gemini_structured.get("detected_actions", "[]")
-        row["automation_score"] = gemini_structured.get("automation_score", 0.0)
-        row["workflow_category"] = gemini_structured.get("workflow_category", "")
-        row["sop_step_count"] = gemini_structured.get("sop_step_count", 0)
-        row["automation_candidate_count"] = gemini_structured.get("automation_candidate_count", 0)
-        row["top_automation_candidate"] = gemini_structured.get("top_automation_candidate", "")
-    else:
-        row["workflow_description"] = ""
-        row["primary_app"] = ""
-        row["app_sequence"] = "[]"
-        row["detected_actions"] = "[]"
-        row["automation_score"] = 0.0
-        row["workflow_category"] = ""
-        row["sop_step_count"] = 0
-        row["automation_candidate_count"] = 0
-        row["top_automation_candidate"] = ""
+def build_row(
+    parsed_metadata: dict,
+    video_metadata: dict,
+    gemini_structured: dict,
+    analysis_md_path: str = "",
+    mp4_path: str = "",
+) -> dict:
+    """
+    Merge all data sources into a single row dict matching CSV_COLUMNS.
 
-    # Metadata
-    row["source_path"] = parsed_metadata.get("source_path", "")
-    row["mp4_path"] = mp4_path
-    row["analysis_md_path"] = analysis_md_path
-    row["processed_at"] = datetime.now().isoformat(timespec="seconds")
+    Thin wrapper over build_row_tuple() for callers that want named fields.
 
-    return row
+    Returns:
+        Dict with all CSV_COLUMNS keys populated.
+    """
+    return dict(zip(CSV_COLUMNS, build_row_tuple(
+        parsed_metadata,
+        video_metadata,
+        gemini_structured,
+        analysis_md_path=analysis_md_path,
+        mp4_path=mp4_path,
+    )))
 
 
 def update_workflow_sessions_status(
@@ -289,6 +1072,7 @@ def update_workflow_sessions_status(
     sessions_csv: str = CONVERSION_CSV,
     source_path: str = "",
     mp4_path: str = "",
+    defer: bool = False,
 ) -> bool:
     """
     Update the Status column in workflow_sessions.csv for a rejected video.
@@ -298,88 +1082,187 @@ def update_workflow_sessions_status(
         status: Status to set (e.g., "Rejected", "Analyzed")
         reason: Optional reason for the status
         sessions_csv: Path to workflow_sessions.csv
+        defer: Queue the update for the next batched rewrite of the CSV
+               (see flush_sessions_status) instead of rewriting it now
+
+    Returns:
+        True if update was successful (always True when deferred), False otherwise
+    """
+    normalized_source = (source_path or "").strip()
+    normalized_mp4 = (mp4_path or "").strip()
+
+    # Match on the given id, the ids derived from either path, or a filename
+    update = (status, reason)
+    updates = {video_id: update}
+    names = {}
+    for candidate in (normalized_source, normalized_mp4):
+        if candidate:
+            updates[hashlib.sha256(candidate.encode("utf-8")).hexdigest()[:12]] = update
+            names[Path(candidate).name] = update
+
+    if defer:
+        _queue_sessions_status(sessions_csv, updates, names)
+        return True
+
+    updated = update_workflow_sessions_status_bulk(updates, sessions_csv, names=names)
+    if updated == 0:
+        print(f"[WARN] Video ID not found in sessions CSV: {video_id}")
+    return bool(updated)
+
+
+class _PendingStatus:
+    """Status updates queued for one sessions CSV."""
+
+    def __init__(self):
+        self.updates: dict[str, tuple[str, str]] = {}
+        self.names: dict[str, tuple[str, str]] = {}
+        self.videos = 0
+        self.queued_at = time.monotonic()
+
+
+# Deferred update_workflow_sessions_status() calls, keyed by sessions CSV path
+_pending_status: dict[str, _PendingStatus] = {}
+
+
+@_serialized
+def _queue_sessions_status(
+    sessions_csv: str,
+    updates: dict[str, tuple[str, str]],
+    names: dict[str, tuple[str, str]],
+) -> None:
+    pending = _pending_status.setdefault(sessions_csv, _PendingStatus())
+    pending.updates.update(updates)
+    pending.names.update(names)
+    pending.videos += 1
+    if (
+        pending.videos >= SESSIONS_STATUS_FLUSH_EVERY
+        or time.monotonic() - pending.queued_at >= SESSIONS_STATUS_FLUSH_SECONDS
+    ):
+        flush_sessions_status(sessions_csv)
+
+
+@_serialized
+def flush_sessions_status(sessions_csv: str = "") -> None:
+    """
+    Apply queued status updates with one rewrite per sessions CSV.
+
+    Args:
+        sessions_csv: Only flush this CSV's queue (default: all of them)
+    """
+    paths = [sessions_csv] if sessions_csv else list(_pending_status)
+    for path in paths:
+        pending = _pending_status.pop(path, None)
+        if pending is None:
+            continue
+        updated = update_workflow_sessions_status_bulk(pending.updates, path, names=pending.names)
+        if updated == 0:
+            print(f"[WARN] None of {pending.videos} queued video(s) found in sessions CSV: {path}")
+
+
+@_serialized
+def update_workflow_sessions_status_bulk(
+    updates: dict[str, tuple[str, str]],
+    sessions_csv: str = CONVERSION_CSV,
+    names: dict[str, tuple[str, str]] | None = None,
+) -> int | None:
+    """
+    Apply many Status/RejectionReason updates to workflow_sessions.csv in one pass.
+
+    Args:
+        updates: video_id -> (status, reason)
+        sessions_csv: Path to workflow_sessions.csv
+        names: Optional source/MP4 filename -> (status, reason), checked for
+               rows whose video_id is not in `updates`
 
     Returns:
-        True if update was successful, False otherwise
+        Number of rows updated, or None if the CSV could not be read/written.
     """
     if not os.path.isfile(sessions_csv):
         print(f"[WARN] Sessions CSV not found: {sessions_csv}")
-        return False
+        return None
 
+    names = names or {}
+    sha256 = hashlib.sha256
+    tmp_path = f"{sessions_csv}.tmp"
     try:
-        import hashlib
-
-        normalized_source = (source_path or "").strip()
-        normalized_mp4 = (mp4_path or "").strip()
-        basename_source = Path(normalized_source).name if normalized_source else ""
-        basename_mp4 = Path(normalized_mp4).name if normalized_mp4 else ""
-
-        candidate_ids = set()
-        for candidate in (normalized_source, normalized_mp4):
-            if candidate:
-                candidate_ids.add(hashlib.sha256(candidate.encode("utf-8")).hexdigest()[:12])
-        # Read all rows
-        with open(sessions_csv, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-            fieldnames = reader.fieldnames
-
-        # Add Status/RejectionReason columns if they don't exist
-        if fieldnames:
-            fieldnames = list(fieldnames)
-            if "Status" not in fieldnames:
-                fieldnames.append("Status")
-            if "RejectionReason" not in fieldnames:
-                fieldnames.append("RejectionReason")
-
-            # Add empty values to existing rows
-            for row in rows:
-                row["Status"] = row.get("Status", "Converted")
-                row["RejectionReason"] = row.get("RejectionReason", "")
-
-        # Find and update the matching row(s)
-        updated = False
-        for row in rows:
-            row_source = (row.get("SourcePath", "") or "").strip()
-            row_mp4 = (row.get("Mp4Path", "") or "").strip()
-
-            # Generate video_id from source or mp4 path (matching load_converted_sessions logic)
-            id_source = row_source if row_source else row_mp4
-            if not id_source:
-                continue
-            row_video_id = hashlib.sha256(id_source.encode("utf-8")).hexdigest()[:12]
-
-            filename_match = False
-            if basename_source or basename_mp4:
-                row_basename_source = Path(row_source).name if row_source else ""
-                row_basename_mp4 = Path(row_mp4).name if row_mp4 else ""
-                filename_match = any(
-                    name
-                    and (name == row_basename_source or name == row_basename_mp4)
-                    for name in (basename_source, basename_mp4)
-                )
-
-            if row_video_id == video_id or row_video_id in candidate_ids or filename_match:
-                row["Status"] = status
-                row["RejectionReason"] = reason
-                updated = True
+        # Stream rows through a temp file and swap it in, instead of holding
+        # the whole sessions CSV in memory and rewriting it in place
+        updated = 0
+        with open(sessions_csv, "r", encoding="utf-8", newline="") as src, \
+                open(tmp_path, "w", encoding="utf-8", newline="") as dst:
+            reader = csv.reader(src)
+            writer = csv.writer(dst)
+
+            header = next(reader, None)
+            if header is None:
+                header = []
+            width = len(header)
+
+            # Add Status/RejectionReason columns if they don't exist
+            fieldnames = list(header)
+            added = []
+            for column, default in (("Status", "Converted"), ("RejectionReason", "")):
+                if column not in fieldnames:
+                    fieldnames.append(column)
+                    added.append(default)
+            i_status = fieldnames.index("Status")
+            i_reason = fieldnames.index("RejectionReason")
+            i_source = header.index("SourcePath") if "SourcePath" in header else -1
+            i_mp4 = header.index("Mp4Path") if "Mp4Path" in header else -1
+            if header:
+                writer.writerow(fieldnames)
 
-        if not updated:
-            print(f"[WARN] Video ID not found in sessions CSV: {video_id}")
-            return False
+            for row in reader:
+                if not row:
+                    continue
+                # Pad short rows / drop extras so every row matches the header
+                row = (row + [""] * (width - len(row)))[:width] + added
+
+                row_source = row[i_source].strip() if i_source >= 0 else ""
+                row_mp4 = row[i_mp4].strip() if i_mp4 >= 0 else ""
+
+                # Generate video_id from source or mp4 path (matching load_converted_sessions logic)
+                id_source = row_source if row_source else row_mp4
+                if id_source:
+                    row_video_id = sha256(id_source.encode("utf-8")).hexdigest()[:12]
+                    update = updates.get(row_video_id)
+                    if update is None and names:
+                        update = (
+                            (row_source and names.get(Path(row_source).name))
+                            or (row_mp4 and names.get(Path(row_mp4).name))
+                            or None
+                        )
+                    if update is not None:
+                        row[i_status], row[i_reason] = update
+                        updated += 1
+
+                writer.writerow(row)
 
-        # Write back the updated CSV
-        with open(sessions_csv, "w", newline="", encoding="utf-8") as f:
-            if fieldnames:
-                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-                writer.writeheader()
-                writer.writerows(rows)
+        if not updated:
+            os.remove(tmp_path)
+            return 0
 
-        return True
+        os.replace(tmp_path, sessions_csv)
+        return updated
 
     except (OSError, csv.Error) as e:
         print(f"[ERROR] Failed to update sessions CSV: {e}")
-        return False
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return None
+
+
+# Filename sanitization for per-video markdown files
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w\s-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _safe_task_name(task_description: str) -> str:
+    """Filename-safe, underscore-joined task description (max 50 chars)."""
+    safe_task = _UNSAFE_FILENAME_CHARS_RE.sub('', task_description).strip()
+    return _WHITESPACE_RE.sub('_', safe_task)[:50]
 
 
 def save_analysis_markdown(
@@ -405,13 +1288,12 @@ def save_analysis_markdown(
     os.makedirs(analyses_dir, exist_ok=True)
 
     # Sanitize task description for filename
-    safe_task = re.sub(r'[^\w\s-]', '', task_description).strip()
-    safe_task = re.sub(r'[\s]+', '_', safe_task)[:50]
+    safe_task = _safe_task_name(task_description)
 
     filename = f"{video_id}_{username}_{safe_task}.md"
     filepath = os.path.join(analyses_dir, filename)
 
-    analyzed_at = datetime.now().isoformat(timespec="seconds")
+    analyzed_at = _now_iso()
 
     # Build file with metadata header and a readable summary block
     header = f"""---
@@ -440,6 +1322,53 @@ analyzed_at: {analyzed_at}
         return ""
 
 
+def _csv_stats_columnar(csv_path: str) -> dict | None:
+    """
+    Compute get_csv_stats() with pandas' C parser, reading only the 3 needed columns.
+
+    Returns:
+        The stats dict, or None if pandas is unavailable or can't parse the file
+        (the caller then falls back to the pure-Python scan).
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+
+    wanted = ("username", "machine_id", "timestamp")
+    try:
+        # keep_default_na=False keeps empty cells as "" (no NaN handling needed)
+        df = pd.read_csv(
+            csv_path,
+            usecols=lambda column: column in wanted,
+            dtype=str,
+            keep_default_na=False,
+            encoding="utf-8",
+        )
+    except (OSError, ValueError) as e:
+        print(f"[WARN] Columnar CSV stats unavailable, falling back: {e}")
+        return None
+
+    def distinct(column: str) -> int:
+        if column not in df:
+            return 0
+        values = df[column]
+        return int(values[values != ""].nunique())
+
+    earliest = latest = None
+    if "timestamp" in df:
+        timestamps = df["timestamp"][df["timestamp"] != ""]
+        if len(timestamps):
+            earliest, latest = timestamps.min(), timestamps.max()
+
+    return {
+        "total_rows": len(df),
+        "unique_users": distinct("username"),
+        "unique_machines": distinct("machine_id"),
+        "date_range": {"earliest": earliest, "latest": latest},
+    }
+
+
 def get_csv_stats(csv_path: str = ANALYSIS_CSV) -> dict:
     """
     Get summary statistics from the analysis CSV.
@@ -457,24 +1386,44 @@ def get_csv_stats(csv_path: str = ANALYSIS_CSV) -> dict:
     if not os.path.isfile(csv_path):
         return stats
 
+    columnar = _csv_stats_columnar(csv_path)
+    if columnar is not None:
+        return columnar
+
+    users = stats["unique_users"]
+    machines = stats["unique_machines"]
+    earliest = latest = None
+
     try:
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+        with open(csv_path, "r", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER_BYTES) as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            user_idx = header.index("username") if "username" in header else -1
+            machine_idx = header.index("machine_id") if "machine_id" in header else -1
+            ts_idx = header.index("timestamp") if "timestamp" in header else -1
+            width = max(user_idx, machine_idx, ts_idx) + 1
+
             for row in reader:
+                if not row:
+                    continue
                 stats["total_rows"] += 1
-                if row.get("username"):
-                    stats["unique_users"].add(row["username"])
-                if row.get("machine_id"):
-                    stats["unique_machines"].add(row["machine_id"])
-                ts = row.get("timestamp", "")
+                if len(row) < width:
+                    row = row + [""] * (width - len(row))
+                if user_idx >= 0 and row[user_idx]:
+                    users.add(row[user_idx])
+                if machine_idx >= 0 and row[machine_idx]:
+                    machines.add(row[machine_idx])
+                ts = row[ts_idx] if ts_idx >= 0 else ""
                 if ts:
-                    if stats["date_range"]["earliest"] is None or ts < stats["date_range"]["earliest"]:
-                        stats["date_range"]["earliest"] = ts
-                    if stats["date_range"]["latest"] is None or ts > stats["date_range"]["latest"]:
-                        stats["date_range"]["latest"] = ts
+                    if earliest is None or ts < earliest:
+                        earliest = ts
+                    if latest is None or ts > latest:
+                        latest = ts
     except (OSError, csv.Error) as e:
         print(f"[WARN] Could not read CSV for stats: {e}")
 
+    stats["date_range"] = {"earliest": earliest, "latest": latest}
+
     # Convert sets to counts for serialization
     stats["unique_users"] = len(stats["unique_users"])
     stats["unique_machines"] = len(stats["unique_machines"])
@@ -489,15 +1438,20 @@ def get_csv_stats(csv_path: str = ANALYSIS_CSV) -> dict:
 
 def initialize_education_csv(csv_path: str = EDUCATION_CSV) -> None:
     """Create the education CSV file with headers if it doesn't exist."""
+    if csv_path in _csv_initialized:
+        return
+
     ensure_output_dir()
 
-    if not os.path.isfile(csv_path):
+    if _csv_needs_header(csv_path):
         with open(csv_path, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             writer.writerow(EDUCATION_CSV_COLUMNS)
         print(f"[INFO] Created education CSV: {csv_path}")
+    _csv_initialized.add(csv_path)
 
 
+@_serialized
 def append_education_row(
     row_data: dict,
     csv_path: str = EDUCATION_CSV,
@@ -505,6 +1459,8 @@ def append_education_row(
     """
     Append a single education analysis row to the education CSV.
 
+    Reuses a process-wide CsvAppender so repeated calls don't reopen the file.
+
     Args:
         row_data: Dictionary with keys matching EDUCATION_CSV_COLUMNS.
         csv_path: Path to the education CSV file.
@@ -512,23 +1468,7 @@ def append_education_row(
     Returns:
         True if the row was written successfully.
     """
-    initialize_education_csv(csv_path)
-
-    row_data.setdefault("processed_at", datetime.now().isoformat(timespec="seconds"))
-
-    row = []
-    for col in EDUCATION_CSV_COLUMNS:
-        value = row_data.get(col, "")
-        row.append(str(value) if value is not None else "")
-
-    try:
-        with open(csv_path, "a", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(row)
-        return True
-    except OSError as e:
-        print(f"[ERROR] Could not append to education CSV: {e}")
-        return False
+    return _get_shared_appender(csv_path, EDUCATION_CSV_COLUMNS).add(row_data)
 
 
 def build_education_row(
@@ -591,7 +1531,7 @@ def build_education_row(
     row["source_path"] = parsed_metadata.get("source_path", "")
     row["mp4_path"] = mp4_path
     row["education_md_path"] = education_md_path
-    row["processed_at"] = datetime.now().isoformat(timespec="seconds")
+    row["processed_at"] = _now_iso()
 
     return row
 
@@ -619,13 +1559,12 @@ def save_education_markdown(
     os.makedirs(analyses_dir, exist_ok=True)
 
     # Sanitize task description for filename
-    safe_task = re.sub(r'[^\w\s-]', '', task_description).strip()
-    safe_task = re.sub(r'[\s]+', '_', safe_task)[:50]
+    safe_task = _safe_task_name(task_description)
 
     filename = f"{video_id}_{username}_{safe_task}_education.md"
     filepath = os.path.join(analyses_dir, filename)
 
-    analyzed_at = datetime.now().isoformat(timespec="seconds")
+    analyzed_at = _now_iso()
 
     header = f"""---
 video_id: {video_id}
@@ -654,35 +1593,36 @@ analyzed_at: {analyzed_at}
         return ""
 
 
+@_serialized
 def mark_education_rejected(video_id: str, reason: str = "") -> None:
     """Append a video_id to the education rejected log with reason."""
-    ensure_output_dir()
-
+    writer = _get_log_writer(EDUCATION_REJECTED_LOG)
     try:
-        with open(EDUCATION_REJECTED_LOG, "a", encoding="utf-8") as f:
-            timestamp = datetime.now().isoformat(timespec="seconds")
-            f.write(f"{video_id}|{timestamp}|{reason}\n")
+        timestamp = _now_iso()
+        writer.write_line(f"{video_id}|{timestamp}|{reason}")
     except OSError as e:
         print(f"[ERROR] Could not write to education rejected log: {e}")
+        return
+    _cache_add(EDUCATION_REJECTED_LOG, video_id, writer)
 
 
-def load_education_rejected_ids() -> set[str]:
-    """Load the set of education-rejected video IDs."""
-    rejected = set()
-
+def load_education_rejected_ids() -> ProcessedIndex:
+    """Load the education-rejected video IDs as a compact ProcessedIndex."""
     if not os.path.isfile(EDUCATION_REJECTED_LOG):
+        return ProcessedIndex()
+
+    rejected = _cached_ids(EDUCATION_REJECTED_LOG)
+    if rejected is not None:
         return rejected
 
     try:
-        with open(EDUCATION_REJECTED_LOG, "r", encoding="utf-8") as f:
-            for line in f:
-                parts = line.strip().split("|")
-                if parts:
-                    rejected.add(parts[0])
+        with open(EDUCATION_REJECTED_LOG, "rb") as f:
+            data = f.read()
     except OSError as e:
         print(f"[WARN] Could not read education rejected log: {e}")
+        return ProcessedIndex()
 
-    return rejected
+    return _cache_ids(EDUCATION_REJECTED_LOG, _first_fields(data))
 
 
 if __name__ == "__main__":
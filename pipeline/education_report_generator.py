@@ -12,13 +12,14 @@ an aggregate education insights report. Report sections:
   7. Per-Video Education Details
 """
 
-import json
 import os
 from collections import Counter, defaultdict
 from datetime import datetime
+from itertools import chain
 
 import pandas as pd
 
+import fast_json
 from config import EDUCATION_CSV, REPORTS_DIR
 
 
@@ -42,13 +43,16 @@ def generate_education_report(
         print("[WARN] Education CSV is empty. No report to generate.")
         return ""
 
+    _parse_json_columns(df)
+
     os.makedirs(output_dir, exist_ok=True)
 
-    date_str = datetime.now().strftime("%Y-%m-%d")
-    report_path = os.path.join(output_dir, f"education_insights_{date_str}.md")
+    # One timestamp for the file name, header and footer
+    now = datetime.now()
+    report_path = os.path.join(output_dir, f"education_insights_{now:%Y-%m-%d}.md")
 
     sections = []
-    sections.append(_header(df))
+    sections.append(_header(now))
     sections.append(_volume_summary(df))
     sections.append(_per_user_learning_profiles(df))
     sections.append(_skill_gap_heatmap(df))
@@ -56,7 +60,7 @@ def generate_education_report(
     sections.append(_missed_tool_features_inventory(df))
     sections.append(_recommended_curriculum(df))
     sections.append(_per_video_details(df))
-    sections.append(_footer())
+    sections.append(_footer(now))
 
     report_content = "\n\n".join(sections)
 
@@ -72,11 +76,10 @@ def generate_education_report(
 # =============================================================================
 
 
-def _header(df: pd.DataFrame) -> str:
-    date_str = datetime.now().strftime("%B %d, %Y")
+def _header(now: datetime) -> str:
     return f"""# Education & Training Insights Report
 
-**Generated:** {date_str}
+**Generated:** {now:%B %d, %Y}
 **Source:** L7S Workflow Capture — Education Analysis Pipeline
 **Author:** Layer 7 Systems — Automated Report
 
@@ -146,8 +149,8 @@ def _per_user_learning_profiles(df: pd.DataFrame) -> str:
         lines.append("\n*No user data available.*")
         return "\n".join(lines)
 
-    for user in sorted(df["username"].unique()):
-        user_df = df[df["username"] == user]
+    # One grouping pass instead of a boolean scan per user (groups come sorted)
+    for user, user_df in df.groupby("username"):
         count = len(user_df)
 
         # Aggregate skill level (mode)
@@ -163,12 +166,11 @@ def _per_user_learning_profiles(df: pd.DataFrame) -> str:
         time_save = user_df["time_save_opportunity"].mode().iloc[0] if "time_save_opportunity" in user_df.columns and not user_df["time_save_opportunity"].dropna().empty else "unknown"
 
         # Collect all recommended modules
-        all_modules = []
+        module_counts = Counter()
         if "recommended_training_modules" in user_df.columns:
-            for val in user_df["recommended_training_modules"].dropna():
-                modules = _parse_json_field(val)
-                all_modules.extend(modules)
-        top_modules = Counter(all_modules).most_common(5)
+            module_lists = user_df["recommended_training_modules"].dropna().map(_parse_json_field)
+            module_counts.update(chain.from_iterable(module_lists))
+        top_modules = module_counts.most_common(5)
 
         # Collect example prompts
         example_prompts = []
@@ -223,16 +225,18 @@ def _skill_gap_heatmap(df: pd.DataFrame) -> str:
     lines.append(header)
     lines.append(sep)
 
+    # Time save values per (user, category) cell from a single grouping pass
+    cells = dict(iter(df.groupby(["username", "learning_category"])["time_save_opportunity"]))
+
     for user in users:
-        user_df = df[df["username"] == user]
         row_str = f"| {user} |"
         for cat in categories:
-            cat_df = user_df[user_df["learning_category"] == cat]
-            if cat_df.empty:
+            time_saves = cells.get((user, cat))
+            if time_saves is None:
                 row_str += " — |"
             else:
                 # Show the most common time save opportunity for this user+category
-                time_save = cat_df["time_save_opportunity"].mode().iloc[0] if not cat_df["time_save_opportunity"].dropna().empty else "—"
+                time_save = time_saves.mode().iloc[0] if not time_saves.dropna().empty else "—"
                 row_str += f" {time_save} |"
         lines.append(row_str)
 
@@ -247,7 +251,7 @@ def _common_ai_assistable_moments(df: pd.DataFrame) -> str:
         return "\n".join(lines)
 
     all_moments = []
-    for _, row in df.iterrows():
+    for row in df.to_dict("records"):
         moments = _parse_json_field(row.get("ai_assistable_moments", "[]"))
         for moment in moments:
             if isinstance(moment, dict):
@@ -302,7 +306,7 @@ def _missed_tool_features_inventory(df: pd.DataFrame) -> str:
         return "\n".join(lines)
 
     all_features = []
-    for _, row in df.iterrows():
+    for row in df.to_dict("records"):
         features = _parse_json_field(row.get("missed_tool_features", "[]"))
         for feat in features:
             if isinstance(feat, dict):
@@ -365,24 +369,23 @@ def _recommended_curriculum(df: pd.DataFrame) -> str:
         lines.append("\n*No training module data available.*")
         return "\n".join(lines)
 
-    all_modules = []
+    # Count modules as they stream in rather than collecting them into a list first
+    module_counts = Counter()
     module_users = defaultdict(set)
 
-    for _, row in df.iterrows():
+    for row in df.to_dict("records"):
         modules = _parse_json_field(row.get("recommended_training_modules", "[]"))
         username = row.get("username", "")
         for mod in modules:
             mod_str = str(mod).strip()
             if mod_str:
-                all_modules.append(mod_str)
+                module_counts[mod_str] += 1
                 module_users[mod_str].add(username)
 
-    if not all_modules:
+    if not module_counts:
         lines.append("\n*No training modules recommended.*")
         return "\n".join(lines)
 
-    module_counts = Counter(all_modules)
-
     lines.append(f"\n**{len(module_counts)}** unique training modules recommended across all analyses.\n")
     lines.append("### Priority Training Modules (ranked by frequency)\n")
     lines.append("| # | Training Module | Appearances | Users Who Need It |")
@@ -397,12 +400,10 @@ def _recommended_curriculum(df: pd.DataFrame) -> str:
         lines.append("\n### Modules by Learning Category\n")
         for cat in sorted(df["learning_category"].unique()):
             cat_df = df[df["learning_category"] == cat]
-            cat_modules = []
-            for val in cat_df["recommended_training_modules"].dropna():
-                cat_modules.extend(_parse_json_field(val))
+            module_lists = cat_df["recommended_training_modules"].dropna().map(_parse_json_field)
+            cat_module_counts = Counter(chain.from_iterable(module_lists))
 
-            if cat_modules:
-                cat_module_counts = Counter(cat_modules)
+            if cat_module_counts:
                 cat_display = cat.replace("_", " ").title()
                 lines.append(f"\n**{cat_display}:**")
                 for mod, count in cat_module_counts.most_common(5):
@@ -428,7 +429,7 @@ def _per_video_details(df: pd.DataFrame) -> str:
     lines.append("| User | Task | Skill Level | Category | Time Save | File |")
     lines.append("|------|------|-------------|----------|-----------|------|")
 
-    for _, row in analyses.iterrows():
+    for row in analyses.to_dict("records"):
         user = row.get("username", "")
         task = _truncate(row.get("task_description", ""), 30)
         skill = row.get("skill_level", "")
@@ -441,10 +442,10 @@ def _per_video_details(df: pd.DataFrame) -> str:
     return "\n".join(lines)
 
 
-def _footer() -> str:
+def _footer(now: datetime) -> str:
     return f"""---
 
-*Report generated by L7S Education Analysis Pipeline on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
+*Report generated by L7S Education Analysis Pipeline on {now:%Y-%m-%d %H:%M:%S}*
 *Data source: Gemini education-focused analysis of screen recordings collected via L7S Workflow Capture*
 *Layer 7 Systems — ML Engineering*"""
 
@@ -453,6 +454,13 @@ def _footer() -> str:
 # Helpers
 # =============================================================================
 
+# Columns holding JSON-encoded lists in the education CSV
+_JSON_LIST_COLUMNS = (
+    "ai_assistable_moments",
+    "missed_tool_features",
+    "recommended_training_modules",
+)
+
 
 def _truncate(text: str, max_len: int) -> str:
     if not text:
@@ -463,15 +471,25 @@ def _truncate(text: str, max_len: int) -> str:
     return text[:max_len - 3] + "..."
 
 
+def _parse_json_columns(df: pd.DataFrame) -> None:
+    """
+    Decode the JSON list columns once, in place. Sections still pass values
+    through _parse_json_field(), which returns already-decoded lists as-is.
+    """
+    for col in _JSON_LIST_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].map(_parse_json_field)
+
+
 def _parse_json_field(value) -> list:
     if isinstance(value, list):
         return value
     if isinstance(value, str):
         try:
-            parsed = json.loads(value)
+            parsed = fast_json.loads(value)
             if isinstance(parsed, list):
                 return parsed
-        except (json.JSONDecodeError, TypeError):
+        except (fast_json.JSONDecodeError, TypeError):
             pass
     return []
 
@@ -0,0 +1,31 @@
+"""
+L7S Workflow Analysis Pipeline - Fast JSON
+
+Thin wrappers that use orjson (C-level serializer) when it is installed and
+fall back to the stdlib json module otherwise. Both return/accept str so
+callers don't care which backend is active.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Raised by loads() on malformed input, regardless of backend
+JSONDecodeError = orjson.JSONDecodeError if orjson else json.JSONDecodeError
+
+
+def dumps(value) -> str:
+    """Serialize `value` to a JSON string."""
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value)
+
+
+def loads(text):
+    """Parse a JSON document from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
@@ -20,6 +20,15 @@ from datetime import datetime
 from pathlib import Path, PureWindowsPath
 from typing import Optional
 
+# Filename format: YYYY-MM-DD_HHMMSS_MACHINENAME_TaskDescription.webm
+# Compiled once at import; parse_filename() only ever matches against these.
+# Primary: machine names follow LETTERS/DIGITS + HYPHEN + LETTERS/DIGITS
+# (e.g., AALEKIC-LWX1, RCRANE-LWX1, EFUENTES-LWX2)
+FILENAME_RE = re.compile(r'^(\d{4}-\d{2}-\d{2})_(\d{6})_([A-Za-z0-9]+-[A-Za-z0-9]+)_(.+)\.webm$')
+
+# Fallback: machine name without hyphen
+FILENAME_LOOSE_RE = re.compile(r'^(\d{4}-\d{2}-\d{2})_(\d{6})_([^_]+)_(.+)\.webm$')
+
 
 def parse_filename(file_path: str) -> Optional[dict]:
     """
@@ -41,16 +50,7 @@ def parse_filename(file_path: str) -> Optional[dict]:
     filename = path.name
     username = path.parent.name.lower()
 
-    # Primary regex: YYYY-MM-DD_HHMMSS_MACHINENAME_TaskDescription.webm
-    # Machine names follow pattern: LETTERS/DIGITS + HYPHEN + LETTERS/DIGITS
-    # (e.g., AALEKIC-LWX1, RCRANE-LWX1, EFUENTES-LWX2)
-    pattern = r'^(\d{4}-\d{2}-\d{2})_(\d{6})_([A-Za-z0-9]+-[A-Za-z0-9]+)_(.+)\.webm$'
-    match = re.match(pattern, filename)
-
-    if not match:
-        # Fallback: machine name without hyphen
-        pattern_loose = r'^(\d{4}-\d{2}-\d{2})_(\d{6})_([^_]+)_(.+)\.webm$'
-        match = re.match(pattern_loose, filename)
+    match = FILENAME_RE.match(filename) or FILENAME_LOOSE_RE.match(filename)
 
     if not match:
         return None
@@ -141,6 +141,23 @@ def discover_videos(source_share: str, single_user: str = "") -> list[dict]:
     return results
 
 
+def _parse_hour(value: str) -> int:
+    """Parse the HourOfDay column to an int (0-23), or -1 if missing/invalid."""
+    try:
+        return int(value)
+    except ValueError:
+        return -1
+
+
+def _parse_duration(value: str) -> float:
+    """Parse the DurationSeconds column to seconds, or -1 if missing/invalid."""
+    try:
+        duration = float(value)
+    except ValueError:
+        return -1.0
+    return duration if duration > 0 else -1.0
+
+
 def load_converted_sessions(csv_path: str, single_user: str = "") -> list[dict]:
     """
     Load converted MP4 session metadata from workflow_sessions.csv.
@@ -184,7 +201,9 @@ def load_converted_sessions(csv_path: str, single_user: str = "") -> list[dict]:
                     "machine_id": (row.get("MachineName") or "").strip(),
                     "task_description": (row.get("TaskDescription") or "").strip(),
                     "day_of_week": (row.get("DayOfWeek") or "").strip(),
-                    "hour_of_day": (row.get("HourOfDay") or "").strip(),
+                    "hour_of_day": _parse_hour((row.get("HourOfDay") or "").strip()),
+                    # MP4 duration the converter already probed (-1 if unknown)
+                    "duration_sec": _parse_duration((row.get("DurationSeconds") or "").strip()),
                     "source_path": source_path,
                     "mp4_path": mp4_path,
                     "mp4_exists": mp4_exists,
@@ -2,29 +2,113 @@
 L7S Workflow Analysis Pipeline - Video Metadata Extractor
 
 Extracts video duration and file size via ffprobe.
+Successful probes are cached on disk keyed by (path, mtime, size).
 """
 
-import json
+import atexit
 import os
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import fast_json
 from config import (
+    FFPROBE_MAX_WORKERS,
     MIN_FILE_SIZE_BYTES,
+    VIDEO_METADATA_CACHE,
     find_ffprobe,
 )
 
 
-def get_video_metadata(video_path: str) -> dict:
+# video_path -> {"mtime_ns", "size", "duration_sec"}; loaded on first use
+_metadata_cache: dict | None = None
+_metadata_dirty = False
+_metadata_lock = threading.Lock()
+
+
+def _load_metadata_cache() -> dict:
+    global _metadata_cache
+    if _metadata_cache is None:
+        try:
+            with open(VIDEO_METADATA_CACHE, "rb") as f:
+                _metadata_cache = fast_json.loads(f.read())
+        except (OSError, ValueError):
+            _metadata_cache = {}
+    return _metadata_cache
+
+
+@atexit.register
+def save_metadata_cache() -> None:
+    """Write the metadata cache back to disk if new probes were added."""
+    global _metadata_dirty
+    with _metadata_lock:
+        if not _metadata_dirty or _metadata_cache is None:
+            return
+        tmp_path = f"{VIDEO_METADATA_CACHE}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(fast_json.dumps(_metadata_cache))
+            os.replace(tmp_path, VIDEO_METADATA_CACHE)
+            _metadata_dirty = False
+        except OSError as e:
+            print(f"[WARN] Could not save video metadata cache: {e}")
+
+
+def prune_metadata_cache(video_paths) -> int:
+    """
+    Forget cached probes for paths not in `video_paths` (deleted or renamed videos).
+
+    Args:
+        video_paths: Every video path the sessions CSV still lists.
+
+    Returns:
+        Number of entries dropped. The cache file is rewritten at exit.
+    """
+    global _metadata_dirty
+    keep = set(video_paths)
+    with _metadata_lock:
+        cache = _load_metadata_cache()
+        stale = [path for path in cache if path not in keep]
+        for path in stale:
+            del cache[path]
+        if stale:
+            _metadata_dirty = True
+    return len(stale)
+
+
+def get_video_metadata(video_path: str, known_duration: float = -1.0) -> dict:
     """
     Get video duration and file size via ffprobe.
 
+    Args:
+        video_path: Path to the video file.
+        known_duration: Duration already recorded for this file (e.g. the
+            DurationSeconds column of workflow_sessions.csv); when positive it
+            is used as-is and ffprobe is not run.
+
     Returns:
         Dict with duration_sec (float) and file_size_mb (float).
         duration_sec is -1 if ffprobe fails.
     """
-    file_size_bytes = os.path.getsize(video_path)
-    file_size_mb = round(file_size_bytes / (1024 * 1024), 2)
+    global _metadata_dirty
+
+    st = os.stat(video_path)
+    file_size_mb = round(st.st_size / (1024 * 1024), 2)
+
+    if known_duration > 0:
+        return {
+            "duration_sec": known_duration,
+            "file_size_mb": file_size_mb,
+        }
+
+    with _metadata_lock:
+        cached = _load_metadata_cache().get(video_path)
+    if cached and cached.get("mtime_ns") == st.st_mtime_ns and cached.get("size") == st.st_size:
+        return {
+            "duration_sec": cached["duration_sec"],
+            "file_size_mb": file_size_mb,
+        }
 
     try:
         ffprobe = find_ffprobe()
@@ -33,22 +117,32 @@ def get_video_metadata(video_path: str) -> dict:
                 ffprobe,
                 "-v", "quiet",
                 "-print_format", "json",
-                "-show_format",
+                # Only the container duration: skips tags/metadata serialization
+                "-show_entries", "format=duration",
                 video_path,
             ],
             capture_output=True,
-            text=True,
             timeout=30,
         )
 
         if result.returncode == 0:
-            info = json.loads(result.stdout)
-            duration = float(info.get("format", {}).get("duration", -1))
+            # Parse the raw stdout bytes directly (no text-mode decode pass)
+            info = fast_json.loads(result.stdout)
+            duration = round(float(info.get("format", {}).get("duration", -1)), 1)
+            if duration > 0:
+                with _metadata_lock:
+                    _load_metadata_cache()[video_path] = {
+                        "mtime_ns": st.st_mtime_ns,
+                        "size": st.st_size,
+                        "duration_sec": duration,
+                    }
+                    _metadata_dirty = True
             return {
-                "duration_sec": round(duration, 1),
+                "duration_sec": duration,
                 "file_size_mb": file_size_mb,
             }
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError) as e:
+    except (subprocess.TimeoutExpired, fast_json.JSONDecodeError, ValueError, OSError) as e:
+        # ValueError: a non-numeric duration such as "N/A"
         print(f"[WARN] ffprobe failed for {Path(video_path).name}: {e}")
 
     return {
@@ -57,6 +151,41 @@ def get_video_metadata(video_path: str) -> dict:
     }
 
 
+def get_video_metadata_batch(video_paths: list[str], max_workers: int = FFPROBE_MAX_WORKERS) -> dict[str, dict]:
+    """
+    Probe many videos concurrently (ffprobe runs out-of-process, so threads suffice).
+
+    Args:
+        video_paths: Paths to probe. Missing files are skipped.
+        max_workers: Cap on concurrent ffprobe processes.
+
+    Returns:
+        Dict of video_path -> get_video_metadata() result. Results are also
+        cached, so later get_video_metadata() calls for these paths are free.
+        A path that can't be probed (e.g. os.stat fails on the share) gets
+        duration_sec -1 instead of aborting the whole batch.
+    """
+    paths = [p for p in dict.fromkeys(video_paths) if p and os.path.isfile(p)]
+    if not paths:
+        return {}
+
+    workers = max(1, min(max_workers, len(paths)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(paths, pool.map(_probe_one, paths)))
+
+
+def _probe_one(video_path: str) -> dict:
+    """get_video_metadata() for one batch entry, with errors confined to that path."""
+    try:
+        return get_video_metadata(video_path)
+    except (OSError, ValueError) as e:
+        print(f"[WARN] Could not probe {Path(video_path).name}: {e}")
+        return {
+            "duration_sec": -1,
+            "file_size_mb": 0.0,
+        }
+
+
 if __name__ == "__main__":
     import sys
 
@@ -18,51 +18,151 @@ Videos failing quality check are rejected without saving (one upload, smart filt
 import json
 import mimetypes
 import os
+import random
 import re
+import threading
 import time
 from typing import Optional
 
 import google.genai as genai
 from google.genai import types
 
+import fast_json
 from config import (
     API_CALL_DELAY_SECONDS,
-    GEMINI_API_KEY,
+    GEMINI_BATCH_GROUP_SIZE,
+    GEMINI_BATCH_POLL_INTERVAL,
+    GEMINI_BATCH_TIMEOUT,
+    GEMINI_CONCURRENCY_INCREASE,
+    GEMINI_INITIAL_CONCURRENT_REQUESTS,
+    GEMINI_MAX_CONCURRENT_REQUESTS,
     GEMINI_MODEL,
+    GEMINI_REQUEST_BURST,
+    GEMINI_REQUESTS_PER_MINUTE,
+    GEMINI_SERVICE_TIER,
     MAX_API_RETRIES,
     MIN_FILE_SIZE_BYTES,
     RATE_LIMIT_INITIAL_BACKOFF,
+    RATE_LIMIT_JITTER_SECONDS,
+    RATE_LIMIT_MAX_BACKOFF,
+    VIDEO_UPLOAD_POLL_BACKOFF,
+    VIDEO_UPLOAD_POLL_INITIAL,
     VIDEO_UPLOAD_POLL_INTERVAL,
     VIDEO_UPLOAD_TIMEOUT,
+    get_gemini_key,
 )
 
 # =============================================================================
 # Gemini API Setup
 # =============================================================================
 
+# One client per process, created on first use: every upload and
+# generate_content call reuses its pooled HTTP connections (no TLS handshake
+# per video). The SDK's httpx transport is safe to share across the
+# run_pipeline worker threads.
 _client: Optional[genai.Client] = None
+_client_lock = threading.Lock()
 
 
-def _ensure_configured():
-    """Initialize the Gemini client once."""
-    global _client
-    if _client is not None:
-        return
+class _AdaptiveLimiter:
+    """
+    AIMD cap on in-flight Gemini requests, shared by all worker threads.
 
-    api_key = os.environ.get("GEMINI_API_KEY", GEMINI_API_KEY).strip()
-    if not api_key:
-        raise ValueError(
-            "GEMINI_API_KEY not set. Create pipeline/.env with:\n"
-            "  GEMINI_API_KEY=your-key-here\n"
-            "Get a key at: https://aistudio.google.com/app/apikey"
-        )
+    Used like a semaphore (`with _request_slots:`). The limit grows additively
+    on success and is halved on a rate-limit error, so --workers runs settle
+    just under the account quota instead of hammering it with retries.
+    """
+
+    def __init__(self, initial: float, maximum: float, increase: float):
+        self._maximum = float(maximum)
+        self._increase = increase
+        self._limit = max(1.0, min(float(initial), self._maximum))
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def __enter__(self) -> "_AdaptiveLimiter":
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+        return self
+
+    def __exit__(self, *exc) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def on_success(self) -> None:
+        """Additive increase after a successful call."""
+        with self._cond:
+            self._limit = min(self._maximum, self._limit + self._increase)
+            self._cond.notify_all()
+
+    def on_rate_limit(self) -> None:
+        """Multiplicative decrease after a 429 / quota error."""
+        with self._cond:
+            self._limit = max(1.0, self._limit / 2)
+
+
+# Caps concurrent uploads/generate_content calls when run_pipeline uses --workers
+_request_slots = _AdaptiveLimiter(
+    GEMINI_INITIAL_CONCURRENT_REQUESTS,
+    GEMINI_MAX_CONCURRENT_REQUESTS,
+    GEMINI_CONCURRENCY_INCREASE,
+)
 
-    _client = genai.Client(api_key=api_key)
 
+class _RequestPacer:
+    """
+    Token bucket (GCRA) spacing request starts to a per-minute quota.
+
+    Holds up to `burst` requests; a caller only sleeps when starting now would
+    exceed the quota, rather than every call paying a fixed delay.
+    """
 
-def _get_client():
-    """Get the configured client."""
-    _ensure_configured()
+    def __init__(self, per_minute: float, burst: int):
+        self._interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._tolerance = self._interval * max(0, burst - 1)
+        self._next_start = 0.0  # theoretical arrival time of the next request
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until a request may start under the quota."""
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            arrival = max(self._next_start, now)
+            delay = arrival - self._tolerance - now
+            self._next_start = arrival + self._interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+# Paces generate_content calls across all worker threads (RPM quota)
+_request_pacer = _RequestPacer(GEMINI_REQUESTS_PER_MINUTE, GEMINI_REQUEST_BURST)
+
+
+def _ensure_configured() -> genai.Client:
+    """Initialize the Gemini client once and return it (thread-safe)."""
+    global _client
+    if _client is not None:
+        return _client
+
+    with _client_lock:
+        if _client is None:
+            api_key = get_gemini_key()
+            if not api_key:
+                raise ValueError(
+                    "GEMINI_API_KEY not set. Create pipeline/.env with:\n"
+                    "  GEMINI_API_KEY=your-key-here\n"
+                    "Get a key at: https://aistudio.google.com/app/apikey"
+                )
+            _client = genai.Client(api_key=api_key)
     return _client
 
 
@@ -273,6 +373,28 @@ Guidelines for time_save_opportunity:
 Return ONLY the JSON object, no additional text."""
 
 
+def _split_prompt(template: str, field: str) -> tuple[str, str]:
+    """
+    Render `template` once around its single `{field}` placeholder.
+
+    Returns the text before and after the placeholder with {{ }} escapes
+    already resolved, so per-video prompts are plain concatenations instead
+    of re-scanning the large templates with str.format on every call.
+    """
+    before, after = template.format(**{field: "\0"}).split("\0")
+    return before, after
+
+
+def _fill_prompt(parts: tuple[str, str], value: str) -> str:
+    return parts[0] + value + parts[1]
+
+
+_ANALYSIS_PARTS = _split_prompt(ANALYSIS_PROMPT, "task_description")
+_EXTRACTION_PARTS = _split_prompt(EXTRACTION_PROMPT, "analysis_markdown")
+_EDUCATION_ANALYSIS_PARTS = _split_prompt(EDUCATION_ANALYSIS_PROMPT, "task_description")
+_EDUCATION_EXTRACTION_PARTS = _split_prompt(EDUCATION_EXTRACTION_PROMPT, "analysis_markdown")
+
+
 # =============================================================================
 # Video Upload
 # =============================================================================
@@ -301,7 +423,7 @@ def _upload_video(video_path: str, video_id: str = "") -> object:
     Returns the processed file object.
     Raises TimeoutError or RuntimeError on failure.
     """
-    client = _get_client()
+    client = _ensure_configured()
 
     file_size_bytes = os.path.getsize(video_path)
     if file_size_bytes < MIN_FILE_SIZE_BYTES:
@@ -317,10 +439,11 @@ def _upload_video(video_path: str, video_id: str = "") -> object:
 
     print(f"  Uploading video to Gemini File API... ({mime_type})")
     try:
-        try:
-            video_file = client.files.upload(file=video_path, mime_type=mime_type)
-        except TypeError:
-            video_file = client.files.upload(file=video_path)
+        with _request_slots:
+            try:
+                video_file = client.files.upload(file=video_path, mime_type=mime_type)
+            except TypeError:
+                video_file = client.files.upload(file=video_path)
     except Exception as e:
         if "invalid_argument" in str(e).lower():
             raise RuntimeError(
@@ -329,7 +452,8 @@ def _upload_video(video_path: str, video_id: str = "") -> object:
         raise
     print(f"  Upload complete, waiting for processing...")
 
-    elapsed = 0
+    elapsed = 0.0
+    wait = VIDEO_UPLOAD_POLL_INITIAL
     while video_file.state.name == "PROCESSING":
         if elapsed >= VIDEO_UPLOAD_TIMEOUT:
             # Clean up the stuck file
@@ -340,8 +464,9 @@ def _upload_video(video_path: str, video_id: str = "") -> object:
             raise TimeoutError(
                 f"Video processing timed out after {VIDEO_UPLOAD_TIMEOUT}s for {video_id}"
             )
-        time.sleep(VIDEO_UPLOAD_POLL_INTERVAL)
-        elapsed += VIDEO_UPLOAD_POLL_INTERVAL
+        time.sleep(wait)
+        elapsed += wait
+        wait = min(VIDEO_UPLOAD_POLL_INTERVAL, wait * VIDEO_UPLOAD_POLL_BACKOFF)
         video_file = client.files.get(name=video_file.name)
 
     if video_file.state.name == "FAILED":
@@ -355,6 +480,13 @@ def _upload_video(video_path: str, video_id: str = "") -> object:
 # Markdown Parsing
 # =============================================================================
 
+# Section headers like "### A)", "## A)" (automation) and "### E)" (education)
+_SECTION_AD_RE = re.compile(r'#{2,3}\s*([A-D])\s*\)')
+_SECTION_EH_RE = re.compile(r'#{2,3}\s*([E-H])\s*\)')
+
+# JSON object wrapped in a ```json fence (fallback when Pass 2 isn't bare JSON)
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
 
 def _parse_markdown_response(markdown_text: str) -> dict:
     """
@@ -378,9 +510,7 @@ def _parse_markdown_response(markdown_text: str) -> dict:
         "D": "clarifying_questions",
     }
 
-    # Match section headers like "### A)", "## A)", "### A."
-    pattern = r'#{2,3}\s*([A-D])\s*\)'
-    matches = list(re.finditer(pattern, markdown_text))
+    matches = list(_SECTION_AD_RE.finditer(markdown_text))
 
     for i, match in enumerate(matches):
         letter = match.group(1)
@@ -399,6 +529,22 @@ def _parse_markdown_response(markdown_text: str) -> dict:
 # Analysis (Two-Pass with Quality Check)
 # =============================================================================
 
+# A Pass 1 response shorter than this with no Section A can't yield SOP steps,
+# so Pass 2 would only confirm the rejection
+_MIN_PASS1_CHARS = 200
+_DEGENERATE_PASS1_REASON = "Pass 1 returned no workflow analysis"
+
+
+def _analysis_result(markdown_text: str, sections: dict, structured: dict, reason: str = "") -> dict:
+    """Build the analyze_video() result dict; a non-empty `reason` marks it not useful."""
+    return {
+        "markdown": markdown_text,
+        "sections": sections,
+        "structured": structured,
+        "is_useful": not reason,
+        "rejection_reason": reason,
+    }
+
 
 def analyze_video(
     video_path: str,
@@ -426,13 +572,12 @@ def analyze_video(
             "rejection_reason": str -- Why it was rejected (if is_useful=False)
         None on failure.
     """
-    _ensure_configured()
+    client = _ensure_configured()
 
     if not os.path.isfile(video_path):
         print(f"[ERROR] Video file not found: {video_path}")
         return None
 
-    client = _get_client()
     video_file = None
 
     try:
@@ -441,7 +586,7 @@ def analyze_video(
 
         # --- Pass 1: Rich analysis ---
         print(f"  Pass 1: Analyzing workflow (SOP + automation)...")
-        prompt = ANALYSIS_PROMPT.format(task_description=task_description)
+        prompt = _fill_prompt(_ANALYSIS_PARTS, task_description)
 
         markdown_text = _call_gemini(
             client=client,
@@ -456,9 +601,15 @@ def analyze_video(
 
         sections = _parse_markdown_response(markdown_text)
 
+        # --- Degenerate Pass 1 (no SOP and barely any text): skip Pass 2 ---
+        if not sections["sop"] and len(markdown_text.strip()) < _MIN_PASS1_CHARS:
+            reason = _DEGENERATE_PASS1_REASON
+            print(f"  Quality check FAILED: {reason}")
+            return _analysis_result(markdown_text, sections, _empty_structured(), reason)
+
         # --- Quick Pass 2 to check quality (cheaper than separate validation) ---
         print(f"  Pass 2: Extracting structured features...")
-        extraction_prompt = EXTRACTION_PROMPT.format(analysis_markdown=markdown_text)
+        extraction_prompt = _fill_prompt(_EXTRACTION_PARTS, markdown_text)
 
         json_text = _call_gemini(
             client=client,
@@ -475,22 +626,9 @@ def analyze_video(
         
         if not quality_check["is_useful"]:
             print(f"  Quality check FAILED: {quality_check['reason']}")
-            return {
-                "markdown": markdown_text,
-                "sections": sections,
-                "structured": structured,
-                "is_useful": False,
-                "rejection_reason": quality_check["reason"],
-            }
-
-        print(f"  Quality check PASSED: Useful workflow detected")
-        return {
-            "markdown": markdown_text,
-            "sections": sections,
-            "structured": structured,
-            "is_useful": True,
-            "rejection_reason": "",
-        }
+        else:
+            print(f"  Quality check PASSED: Useful workflow detected")
+        return _analysis_result(markdown_text, sections, structured, quality_check["reason"])
 
     except (TimeoutError, RuntimeError, ValueError) as e:
         print(f"[ERROR] {e}")
@@ -505,6 +643,54 @@ def analyze_video(
                 pass
 
 
+# retryDelay from a google.rpc.RetryInfo error detail, e.g. "retryDelay": "37s"
+_RETRY_DELAY_RE = re.compile(r"""retry_?delay['"]?\s*[:=]\s*['"]?(\d+(?:\.\d+)?)s""", re.IGNORECASE)
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Server-suggested retry delay from a 429 error, or None if it gave none."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers:
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            pass  # HTTP-date form; fall through to RetryInfo
+
+    match = _RETRY_DELAY_RE.search(str(getattr(error, "details", "") or error))
+    return float(match.group(1)) if match else None
+
+
+def _rate_limit_wait(error: Exception, attempt: int) -> float:
+    """Seconds to sleep before retrying a rate-limited call."""
+    hint = _retry_after_seconds(error)
+    if hint is not None:
+        # Capped so one huge or bogus retryDelay can't park a worker indefinitely
+        return min(max(hint, 1.0), RATE_LIMIT_MAX_BACKOFF)
+    backoff = min(RATE_LIMIT_MAX_BACKOFF, RATE_LIMIT_INITIAL_BACKOFF * (2 ** (attempt - 1)))
+    return backoff + random.uniform(0, RATE_LIMIT_JITTER_SECONDS)
+
+
+# False once the installed SDK or the API has rejected the service_tier field
+_service_tier_supported = True
+
+
+def _generate_config(config_kwargs: dict, service_tier: str):
+    """
+    GenerateContentConfig on `service_tier`, or None if no tier is configured
+    or the installed google-genai version doesn't support choosing one.
+    """
+    global _service_tier_supported
+    if not service_tier or not _service_tier_supported:
+        return None
+    try:
+        return types.GenerateContentConfig(service_tier=service_tier, **config_kwargs)
+    except (TypeError, ValueError):
+        _service_tier_supported = False
+        print(f"[WARN] google-genai does not support service_tier; using the standard tier")
+        return None
+
+
 def _call_gemini(
     client,
     contents: list,
@@ -515,23 +701,26 @@ def _call_gemini(
     """
     Call Gemini with retry logic. Returns the response text or None.
     """
-    config = types.GenerateContentConfig(
-        temperature=0.2,
-    )
+    global _service_tier_supported
+    config_kwargs = {"temperature": 0.2}
     if use_json:
-        config = types.GenerateContentConfig(
-            response_mime_type="application/json",
-            temperature=0.2,
-        )
+        config_kwargs["response_mime_type"] = "application/json"
+    config = _generate_config(config_kwargs, GEMINI_SERVICE_TIER)
+    on_tier = config is not None
+    if config is None:
+        config = types.GenerateContentConfig(**config_kwargs)
 
     last_error = None
     for attempt in range(1, MAX_API_RETRIES + 1):
         try:
-            response = client.models.generate_content(
-                model=GEMINI_MODEL,
-                contents=contents,
-                config=config,
-            )
+            _request_pacer.wait()
+            with _request_slots:
+                response = client.models.generate_content(
+                    model=GEMINI_MODEL,
+                    contents=contents,
+                    config=config,
+                )
+            _request_slots.on_success()
             if response.text:
                 return response.text
 
@@ -542,8 +731,9 @@ def _call_gemini(
             error_str = str(e).lower()
 
             if "429" in str(e) or "resource_exhausted" in error_str or "quota" in error_str:
-                wait = RATE_LIMIT_INITIAL_BACKOFF * (2 ** (attempt - 1))
-                print(f"[WARN] Rate limited on {video_id} {pass_name}, waiting {wait:.0f}s (attempt {attempt}/{MAX_API_RETRIES})")
+                _request_slots.on_rate_limit()
+                wait = _rate_limit_wait(e, attempt)
+                print(f"[WARN] Rate limited on {video_id} {pass_name}, waiting {wait:.0f}s (attempt {attempt}/{MAX_API_RETRIES}, concurrency now {_request_slots.limit})")
                 time.sleep(wait)
                 continue
 
@@ -551,6 +741,22 @@ def _call_gemini(
                 print(f"[WARN] Content blocked by safety filter for {video_id} {pass_name}: {e}")
                 return None
 
+            if on_tier and ("503" in error_str or "unavailable" in error_str or "sheddable" in error_str):
+                print(f"[WARN] {GEMINI_SERVICE_TIER} tier unavailable for {video_id} {pass_name}, retrying on standard tier")
+                config = types.GenerateContentConfig(**config_kwargs)
+                on_tier = False
+                continue
+
+            if on_tier and ("invalid_argument" in error_str or getattr(e, "code", None) == 400):
+                # The API may reject the tier for this model/key; the standard
+                # tier is retried instead of failing every attempt on it
+                if "service_tier" in error_str or "service tier" in error_str:
+                    _service_tier_supported = False
+                print(f"[WARN] Request on the {GEMINI_SERVICE_TIER} tier was rejected for {video_id} {pass_name}, retrying on standard tier: {e}")
+                config = types.GenerateContentConfig(**config_kwargs)
+                on_tier = False
+                continue
+
             print(f"[WARN] Gemini API error for {video_id} {pass_name} (attempt {attempt}/{MAX_API_RETRIES}): {e}")
             if attempt < MAX_API_RETRIES:
                 time.sleep(API_CALL_DELAY_SECONDS)
@@ -559,6 +765,187 @@ def _call_gemini(
     return None
 
 
+# =============================================================================
+# Batch Mode
+# =============================================================================
+
+# Terminal Gemini batch job states
+_BATCH_DONE_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
+
+def _inline_request(parts: list[dict], use_json: bool) -> dict:
+    """Build one inlined batch request with the same settings as _call_gemini()."""
+    config = {"temperature": 0.2}
+    if use_json:
+        config["response_mime_type"] = "application/json"
+    return {"contents": [{"role": "user", "parts": parts}], "config": config}
+
+
+def _run_batch_job(client, requests: list[dict], pass_name: str) -> list[Optional[str]]:
+    """
+    Submit `requests` as one Gemini batch job and wait for it to finish.
+
+    Returns:
+        Response texts in request order; None for requests that failed
+        (or for all of them if the job itself failed or timed out).
+    """
+    texts: list[Optional[str]] = [None] * len(requests)
+    try:
+        with _request_slots:
+            job = client.batches.create(
+                model=GEMINI_MODEL,
+                src=requests,
+                config={"display_name": f"workflow-{pass_name.replace(' ', '').lower()}-{int(time.time())}"},
+            )
+        print(f"  {pass_name}: batch job {job.name} submitted ({len(requests)} request(s))")
+
+        elapsed = 0
+        while job.state.name not in _BATCH_DONE_STATES:
+            if elapsed >= GEMINI_BATCH_TIMEOUT:
+                try:
+                    client.batches.cancel(name=job.name)
+                except Exception:
+                    pass
+                print(f"[ERROR] {pass_name} batch job timed out after {GEMINI_BATCH_TIMEOUT}s")
+                return texts
+            time.sleep(GEMINI_BATCH_POLL_INTERVAL)
+            elapsed += GEMINI_BATCH_POLL_INTERVAL
+            job = client.batches.get(name=job.name)
+    except Exception as e:
+        print(f"[ERROR] {pass_name} batch job failed: {e}")
+        return texts
+
+    if job.state.name != "JOB_STATE_SUCCEEDED":
+        print(f"[ERROR] {pass_name} batch job ended in state {job.state.name}")
+        return texts
+
+    responses = (job.dest.inlined_responses if job.dest else None) or []
+    for idx, item in enumerate(responses[:len(texts)]):
+        if item.response is not None and item.response.text:
+            texts[idx] = item.response.text
+        elif item.error is not None:
+            print(f"[WARN] {pass_name} batch request {idx} failed: {item.error}")
+    return texts
+
+
+def _run_pass1_group(client, jobs: list[tuple[str, str, str]], results: dict) -> list[tuple]:
+    """
+    Upload one group of videos, run Pass 1 over them as a batch job, then
+    delete the uploads.
+
+    Degenerate Pass 1 results are written to `results` directly.
+
+    Returns:
+        (video_id, markdown_text, sections) for the videos that go on to Pass 2.
+    """
+    uploaded = {}
+    try:
+        # --- Upload videos ---
+        for video_id, video_path, _ in jobs:
+            try:
+                uploaded[video_id] = _upload_video(video_path, video_id)
+            except (TimeoutError, RuntimeError, ValueError, OSError) as e:
+                print(f"[ERROR] {e}")
+
+        # --- Pass 1: Rich analysis, one request per uploaded video ---
+        pass1_jobs = [(vid, task) for vid, _, task in jobs if vid in uploaded]
+        if not pass1_jobs:
+            return []
+
+        pass1_requests = [
+            _inline_request(
+                [
+                    {"file_data": {"file_uri": uploaded[vid].uri, "mime_type": uploaded[vid].mime_type}},
+                    {"text": _fill_prompt(_ANALYSIS_PARTS, task)},
+                ],
+                use_json=False,
+            )
+            for vid, task in pass1_jobs
+        ]
+        markdown_texts = _run_batch_job(client, pass1_requests, "Pass 1")
+
+    finally:
+        # Clean up uploaded files (Pass 2 only reads the Pass 1 markdown)
+        for video_file in uploaded.values():
+            try:
+                client.files.delete(name=video_file.name)
+            except Exception:
+                pass
+
+    pass2_jobs = []
+    for (vid, _), markdown_text in zip(pass1_jobs, markdown_texts):
+        if not markdown_text:
+            continue
+        sections = _parse_markdown_response(markdown_text)
+        if not sections["sop"] and len(markdown_text.strip()) < _MIN_PASS1_CHARS:
+            results[vid] = _analysis_result(
+                markdown_text, sections, _empty_structured(), _DEGENERATE_PASS1_REASON
+            )
+            continue
+        pass2_jobs.append((vid, markdown_text, sections))
+    return pass2_jobs
+
+
+def analyze_videos_batch(jobs: list[tuple[str, str, str]]) -> dict[str, Optional[dict]]:
+    """
+    Two-pass analysis of many videos through Gemini Batch Mode.
+
+    Batch jobs are billed at half the interactive price and are not subject to
+    per-request rate limits, but can take hours to complete. Videos are handled
+    in groups of GEMINI_BATCH_GROUP_SIZE: each group is uploaded, Pass 1 runs
+    as one batch job and the uploads are deleted, then Pass 2 runs as a second
+    job over the Pass 1 markdown. Quality checks match analyze_video().
+
+    Args:
+        jobs: (video_id, video_path, task_description) tuples.
+
+    Returns:
+        Dict of video_id -> analyze_video()-style result, or None for videos
+        that failed (callers can retry those with analyze_video()).
+    """
+    client = _ensure_configured()
+    results: dict[str, Optional[dict]] = {video_id: None for video_id, _, _ in jobs}
+    group_size = max(1, GEMINI_BATCH_GROUP_SIZE)
+    group_count = (len(jobs) + group_size - 1) // group_size
+
+    for start in range(0, len(jobs), group_size):
+        group = jobs[start:start + group_size]
+        if group_count > 1:
+            print(f"  Batch group {start // group_size + 1}/{group_count} ({len(group)} video(s))")
+
+        pass2_jobs = _run_pass1_group(client, group, results)
+
+        # --- Pass 2: Structured extraction for the useful-looking Pass 1 results ---
+        if not pass2_jobs:
+            continue
+        pass2_requests = [
+            _inline_request(
+                [{"text": _fill_prompt(_EXTRACTION_PARTS, markdown_text)}],
+                use_json=True,
+            )
+            for _, markdown_text, _ in pass2_jobs
+        ]
+        json_texts = _run_batch_job(client, pass2_requests, "Pass 2")
+
+        for (vid, markdown_text, sections), json_text in zip(pass2_jobs, json_texts):
+            # A failed Pass 2 request leaves the result None (retried
+            # interactively) rather than rejecting the video outright
+            if not json_text:
+                continue
+            structured = _parse_json_response(json_text, vid)
+            quality_check = _check_analysis_quality(structured)
+            results[vid] = _analysis_result(
+                markdown_text, sections, structured, quality_check["reason"]
+            )
+
+    return results
+
+
 # =============================================================================
 # JSON Parsing (Pass 2)
 # =============================================================================
@@ -567,60 +954,40 @@ def _call_gemini(
 def _parse_json_response(response_text: str, video_id: str) -> dict:
     """Parse and validate the Pass 2 structured JSON response."""
     try:
-        data = json.loads(response_text)
-    except json.JSONDecodeError:
-        match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response_text, re.DOTALL)
+        data = fast_json.loads(response_text)
+    except fast_json.JSONDecodeError:
+        match = _JSON_FENCE_RE.search(response_text)
         if match:
             try:
-                data = json.loads(match.group(1))
-            except json.JSONDecodeError:
+                data = fast_json.loads(match.group(1))
+            except fast_json.JSONDecodeError:
                 print(f"[ERROR] Could not parse JSON from Pass 2 response for {video_id}")
                 return _empty_structured()
         else:
             print(f"[ERROR] Pass 2 response is not valid JSON for {video_id}")
             return _empty_structured()
 
-    return {
-        "workflow_description": str(data.get("workflow_description", "")),
-        "primary_app": str(data.get("primary_app", "Unknown")),
-        "app_sequence": _ensure_json_list(data.get("app_sequence", [])),
-        "detected_actions": _ensure_json_list(data.get("detected_actions", [])),
-        "automation_score": _clamp_float(data.get("automation_score", 0.0), 0.0, 1.0),
-        "workflow_category": str(data.get("workflow_category", "other")),
-        "sop_step_count": _safe_int(data.get("sop_step_count", 0)),
-        "automation_candidate_count": _safe_int(data.get("automation_candidate_count", 0)),
-        "top_automation_candidate": str(data.get("top_automation_candidate", "")),
-    }
+    return _apply_structured_schema(data)
 
 
 def _empty_structured() -> dict:
     """Return empty structured data when analysis fails."""
-    return {
-        "workflow_description": "",
-        "primary_app": "Unknown",
-        "app_sequence": "[]",
-        "detected_actions": "[]",
-        "automation_score": 0.0,
-        "workflow_category": "other",
-        "sop_step_count": 0,
-        "automation_candidate_count": 0,
-        "top_automation_candidate": "",
-    }
+    return _apply_structured_schema({})
 
 
 def _ensure_json_list(value) -> str:
     """Ensure value is serialized as a JSON array string."""
     if isinstance(value, list):
-        return json.dumps(value)
+        return fast_json.dumps(value)
     if isinstance(value, str):
         try:
-            parsed = json.loads(value)
+            parsed = fast_json.loads(value)
             if isinstance(parsed, list):
                 return value
-        except json.JSONDecodeError:
+        except fast_json.JSONDecodeError:
             pass
-        return json.dumps([value])
-    return json.dumps([])
+        return fast_json.dumps([value])
+    return "[]"
 
 
 def _clamp_float(value, min_val: float, max_val: float) -> float:
@@ -640,38 +1007,61 @@ def _safe_int(value) -> int:
         return 0
 
 
+def _clamp_unit(value) -> float:
+    return _clamp_float(value, 0.0, 1.0)
+
+
+# Pass 2 fields: (key, default when missing, coercion). Defaults pass through
+# the coercion too, so _empty_structured() is the schema applied to {}.
+_STRUCTURED_SCHEMA = (
+    ("workflow_description", "", str),
+    ("primary_app", "Unknown", str),
+    ("app_sequence", [], _ensure_json_list),
+    ("detected_actions", [], _ensure_json_list),
+    ("automation_score", 0.0, _clamp_unit),
+    ("workflow_category", "other", str),
+    ("sop_step_count", 0, _safe_int),
+    ("automation_candidate_count", 0, _safe_int),
+    ("top_automation_candidate", "", str),
+)
+
+
+def _apply_structured_schema(data: dict) -> dict:
+    """Coerce a parsed Pass 2 JSON object into the structured-field dict."""
+    get = data.get
+    return {key: coerce(get(key, default)) for key, default, coerce in _STRUCTURED_SCHEMA}
+
+
+# Quality predicates, evaluated in order; the first match rejects the video.
+# Reasons are format strings filled from the structured fields.
+_QUALITY_CHECKS = (
+    (lambda s: s.get("primary_app", "").strip() in ("", "Unknown", "N/A", "None"),
+     "No application detected"),
+    (lambda s: s.get("sop_step_count", 0) == 0,
+     "No workflow steps detected"),
+    (lambda s: s.get("automation_score", 0.0) < 0.3,
+     "Very low automation potential (score: {automation_score})"),
+    (lambda s: len(s.get("workflow_description", "").strip()) < 20,
+     "No meaningful workflow description"),
+)
+
+
 def _check_analysis_quality(structured: dict) -> dict:
     """
     Check if the structured analysis indicates a useful workflow recording.
     
-    Low-quality indicators:
+    Low-quality indicators (see _QUALITY_CHECKS):
     - Primary app is Unknown/N/A/empty
-    - Automation score very low (< 0.3)
     - No SOP steps detected
+    - Automation score very low (< 0.3)
     - No workflow description
     
     Returns:
         Dict with "is_useful" (bool) and "reason" (str)
     """
-    primary_app = structured.get("primary_app", "").strip()
-    automation_score = structured.get("automation_score", 0.0)
-    sop_steps = structured.get("sop_step_count", 0)
-    workflow_desc = structured.get("workflow_description", "").strip()
-    
-    # Check for clear "not useful" signals
-    if primary_app in ("", "Unknown", "N/A", "None"):
-        return {"is_useful": False, "reason": "No application detected"}
-    
-    if sop_steps == 0:
-        return {"is_useful": False, "reason": "No workflow steps detected"}
-    
-    if automation_score < 0.3:
-        return {"is_useful": False, "reason": f"Very low automation potential (score: {automation_score})"}
-    
-    if not workflow_desc or len(workflow_desc) < 20:
-        return {"is_useful": False, "reason": "No meaningful workflow description"}
-    
-    # Passed quality checks
+    for predicate, reason in _QUALITY_CHECKS:
+        if predicate(structured):
+            return {"is_useful": False, "reason": reason.format_map(structured)}
     return {"is_useful": True, "reason": ""}
 
 
@@ -679,6 +1069,11 @@ def _check_analysis_quality(structured: dict) -> dict:
 # Education Analysis
 # =============================================================================
 
+# Education counterpart of _DEGENERATE_PASS1_REASON: with no Section E or H,
+# Pass 2 can't find AI-assistable moments or training modules, which
+# _check_education_quality rejects anyway
+_DEGENERATE_EDUCATION_PASS1_REASON = "Education Pass 1 returned no training analysis"
+
 
 def _parse_education_markdown_response(markdown_text: str) -> dict:
     """
@@ -702,9 +1097,7 @@ def _parse_education_markdown_response(markdown_text: str) -> dict:
         "H": "learning_recommendations",
     }
 
-    # Match section headers like "### E)", "## E)", "### E."
-    pattern = r'#{2,3}\s*([E-H])\s*\)'
-    matches = list(re.finditer(pattern, markdown_text))
+    matches = list(_SECTION_EH_RE.finditer(markdown_text))
 
     for i, match in enumerate(matches):
         letter = match.group(1)
@@ -739,13 +1132,13 @@ def _check_education_quality(structured: dict) -> dict:
 
     # Parse JSON lists to check if they're empty
     try:
-        moments_list = json.loads(ai_moments) if isinstance(ai_moments, str) else ai_moments
-    except (json.JSONDecodeError, TypeError):
+        moments_list = fast_json.loads(ai_moments) if isinstance(ai_moments, str) else ai_moments
+    except (fast_json.JSONDecodeError, TypeError):
         moments_list = []
 
     try:
-        modules_list = json.loads(training_modules) if isinstance(training_modules, str) else training_modules
-    except (json.JSONDecodeError, TypeError):
+        modules_list = fast_json.loads(training_modules) if isinstance(training_modules, str) else training_modules
+    except (fast_json.JSONDecodeError, TypeError):
         modules_list = []
 
     # Reject if no AI-assistable moments AND no learning recommendations
@@ -761,13 +1154,13 @@ def _check_education_quality(structured: dict) -> dict:
 def _parse_education_json_response(response_text: str, video_id: str) -> dict:
     """Parse and validate the Education Pass 2 structured JSON response."""
     try:
-        data = json.loads(response_text)
-    except json.JSONDecodeError:
-        match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response_text, re.DOTALL)
+        data = fast_json.loads(response_text)
+    except fast_json.JSONDecodeError:
+        match = _JSON_FENCE_RE.search(response_text)
         if match:
             try:
-                data = json.loads(match.group(1))
-            except json.JSONDecodeError:
+                data = fast_json.loads(match.group(1))
+            except fast_json.JSONDecodeError:
                 print(f"[ERROR] Could not parse JSON from education Pass 2 response for {video_id}")
                 return _empty_education_structured()
         else:
@@ -849,13 +1242,12 @@ def analyze_video_education(
             "rejection_reason": str -- Why it was rejected (if is_useful=False)
         None on failure.
     """
-    _ensure_configured()
+    client = _ensure_configured()
 
     if not os.path.isfile(video_path):
         print(f"[ERROR] Video file not found: {video_path}")
         return None
 
-    client = _get_client()
     video_file = None
 
     try:
@@ -864,7 +1256,7 @@ def analyze_video_education(
 
         # --- Pass 1: Education analysis ---
         print(f"  Education Pass 1: Analyzing training opportunities...")
-        prompt = EDUCATION_ANALYSIS_PROMPT.format(task_description=task_description)
+        prompt = _fill_prompt(_EDUCATION_ANALYSIS_PARTS, task_description)
 
         markdown_text = _call_gemini(
             client=client,
@@ -879,9 +1271,25 @@ def analyze_video_education(
 
         sections = _parse_education_markdown_response(markdown_text)
 
+        # --- Degenerate Pass 1 (no Section E/H and barely any text): skip Pass 2 ---
+        if (
+            not sections["ai_assistable_moments"]
+            and not sections["learning_recommendations"]
+            and len(markdown_text.strip()) < _MIN_PASS1_CHARS
+        ):
+            reason = _DEGENERATE_EDUCATION_PASS1_REASON
+            print(f"  Education quality check FAILED: {reason}")
+            return {
+                "markdown": markdown_text,
+                "sections": sections,
+                "structured": _empty_education_structured(),
+                "is_useful": False,
+                "rejection_reason": reason,
+            }
+
         # --- Pass 2: Structured extraction ---
         print(f"  Education Pass 2: Extracting structured education data...")
-        extraction_prompt = EDUCATION_EXTRACTION_PROMPT.format(analysis_markdown=markdown_text)
+        extraction_prompt = _fill_prompt(_EDUCATION_EXTRACTION_PARTS, markdown_text)
 
         json_text = _call_gemini(
             client=client,
@@ -13,15 +13,53 @@ insights report. Report sections:
   8. Cross-Video Automation Themes
 """
 
-import json
 import os
+import re
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import combinations
 
 import pandas as pd
 
-from config import ANALYSIS_CSV, REPORTS_DIR
-from gemini_analyzer import _parse_markdown_response
+import fast_json
+from config import (
+    ANALYSIS_CSV,
+    REPORT_CACHE,
+    REPORT_READ_MAX_WORKERS,
+    REPORT_SECTIONS_CACHE,
+    REPORTS_DIR,
+)
+from gemini_analyzer import _SECTION_AD_RE
+
+
+# Columns the report sections read. Everything else in the analysis CSV
+# (notably the detected_actions JSON lists and the path/metadata columns)
+# is skipped by the parser instead of being loaded and discarded.
+_REPORT_COLUMNS = frozenset({
+    "username",
+    "machine_id",
+    "timestamp",
+    "task_description",
+    "duration_sec",
+    "workflow_description",
+    "primary_app",
+    "app_sequence",
+    "automation_score",
+    "workflow_category",
+    "sop_step_count",
+    "top_automation_candidate",
+    "analysis_md_path",
+})
+
+# Text columns are declared up front so the parser skips type inference for
+# them (and IDs such as machine_id stay strings even when they look numeric).
+# The numeric columns are parsed by _coerce_numeric_columns(), which tolerates
+# malformed values that a strict float/int dtype here would reject.
+_REPORT_TEXT_DTYPES = {
+    col: str
+    for col in _REPORT_COLUMNS - {"duration_sec", "automation_score", "sop_step_count"}
+}
 
 
 def generate_report(
@@ -31,6 +69,10 @@ def generate_report(
     """
     Generate a markdown insights report from the analysis CSV.
 
+    If today's report was already built from the same CSV (unchanged path,
+    mtime and size) and none of the per-video analysis files it embeds has
+    changed since, the existing file is returned without re-rendering.
+
     Returns:
         Path to the generated report file.
     """
@@ -38,33 +80,75 @@ def generate_report(
         print(f"[ERROR] Analysis CSV not found: {csv_path}")
         return ""
 
-    df = pd.read_csv(csv_path)
+    # One timestamp for the file name, header and footer
+    now = datetime.now()
+    report_path = os.path.join(output_dir, f"insights_{now:%Y-%m-%d}.md")
+
+    st = os.stat(csv_path)
+    fingerprint = {
+        "csv_path": os.path.abspath(csv_path),
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "report_path": os.path.abspath(report_path),
+    }
+    cached = _load_report_cache()
+    cached_files = cached.pop("analysis_files", None)
+    if (
+        cached == fingerprint
+        and cached_files is not None
+        and all(_file_signature(path) == sig for path, sig in cached_files.items())
+        and os.path.isfile(report_path)
+    ):
+        print(f"[INFO] Analysis data unchanged, report is up to date: {report_path}")
+        return report_path
+
+    # Callable usecols tolerates older CSVs that lack some of the columns
+    df = pd.read_csv(
+        csv_path,
+        usecols=lambda col: col in _REPORT_COLUMNS,
+        dtype=_REPORT_TEXT_DTYPES,
+    )
 
     if df.empty:
         print("[WARN] Analysis CSV is empty. No report to generate.")
         return ""
 
-    os.makedirs(output_dir, exist_ok=True)
-
-    date_str = datetime.now().strftime("%Y-%m-%d")
-    report_path = os.path.join(output_dir, f"insights_{date_str}.md")
+    _coerce_numeric_columns(df)
 
-    sections = []
-    sections.append(_header(df))
-    sections.append(_volume_summary(df))
-    sections.append(_workflow_inventory(df))
-    sections.append(_automation_landscape(df))
-    sections.append(_sop_complexity(df))
-    sections.append(_application_insights(df))
-    sections.append(_user_findings(df))
-    sections.append(_analysis_links(df))
-    sections.append(_cross_video_themes(df))
-    sections.append(_footer())
-
-    report_content = "\n\n".join(sections)
+    os.makedirs(output_dir, exist_ok=True)
 
+    # Rows with a per-video analysis file, shared by the last two sections
+    analyses = _rows_with_analysis(df)
+    # Signatures taken before the files are read, so an edit made while the
+    # report renders still invalidates it
+    fingerprint["analysis_files"] = {} if analyses is None else {
+        path: _file_signature(path) for path in analyses["analysis_md_path"]
+    }
+
+    # The themes section is bound by markdown file reads, so start it first and
+    # let those reads overlap the in-memory sections built below
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        themes = pool.submit(_cross_video_themes, analyses)
+
+        sections = []
+        sections.append(_header(now))
+        sections.append(_volume_summary(df))
+        sections.append(_workflow_inventory(df))
+        sections.append(_automation_landscape(df))
+        sections.append(_sop_complexity(df))
+        sections.append(_application_insights(df))
+        sections.append(_user_findings(df))
+        sections.append(_analysis_links(analyses))
+        sections.append(themes.result())
+    sections.append(_footer(now))
+
+    # Stream the sections out rather than joining them into one report string
     with open(report_path, "w", encoding="utf-8") as f:
-        f.write(report_content)
+        f.write(sections[0])
+        for section in sections[1:]:
+            f.write("\n\n")
+            f.write(section)
+    _save_report_cache(fingerprint)
 
     print(f"[INFO] Report generated: {report_path}")
     return report_path
@@ -75,11 +159,10 @@ def generate_report(
 # =============================================================================
 
 
-def _header(df: pd.DataFrame) -> str:
-    date_str = datetime.now().strftime("%B %d, %Y")
+def _header(now: datetime) -> str:
     return f"""# Workflow Analysis — Insights Report
 
-**Generated:** {date_str}
+**Generated:** {now:%B %d, %Y}
 **Source:** L7S Workflow Capture Analysis Pipeline
 **Author:** Layer 7 Systems — Automated Report
 
@@ -139,17 +222,21 @@ def _workflow_inventory(df: pd.DataFrame) -> str:
     lines.append("\n| User | Task | Duration | App | Score | SOP Steps | Top Candidate | Summary |")
     lines.append("|------|------|----------|-----|-------|-----------|---------------|---------|")
 
-    for _, row in df.iterrows():
-        user = row.get("username", "")
-        task = _truncate(row.get("task_description", ""), 30)
-        duration = f"{_safe_float(row.get('duration_sec', 0))/60:.1f}m" if _safe_float(row.get('duration_sec', 0)) > 0 else "-"
-        app = _truncate(row.get("primary_app", ""), 15)
-        score = f"{_safe_float(row.get('automation_score', 0)):.2f}"
-        sop = str(_safe_int(row.get("sop_step_count", 0)))
-        candidate = _truncate(row.get("top_automation_candidate", ""), 25)
-        summary = _truncate(row.get("workflow_description", ""), 40)
-
-        lines.append(f"| {user} | {task} | {duration} | {app} | {score} | {sop} | {candidate} | {summary} |")
+    # Format whole columns at once, then join them into table rows
+    duration_sec = _column(df, "duration_sec", 0.0)
+    duration = (duration_sec / 60).map("{:.1f}m".format).where(duration_sec > 0, "-")
+    table = (
+        "| " + _text_column(df, "username")
+        + " | " + _truncate_series(_text_column(df, "task_description"), 30)
+        + " | " + duration
+        + " | " + _truncate_series(_text_column(df, "primary_app"), 15)
+        + " | " + _column(df, "automation_score", 0.0).map("{:.2f}".format)
+        + " | " + _column(df, "sop_step_count", 0).astype(str)
+        + " | " + _truncate_series(_text_column(df, "top_automation_candidate"), 25)
+        + " | " + _truncate_series(_text_column(df, "workflow_description"), 40)
+        + " |"
+    )
+    lines.extend(table.tolist())
 
     return "\n".join(lines)
 
@@ -161,48 +248,51 @@ def _automation_landscape(df: pd.DataFrame) -> str:
         lines.append("\n*No automation data available.*")
         return "\n".join(lines)
 
-    df_scored = df.copy()
-    df_scored["score_float"] = df_scored["automation_score"].apply(_safe_float)
+    scores = df["automation_score"]
 
-    # Top automation candidates across all videos
+    # Top automation candidates across all videos (one groupby for counts + mean score)
     if "top_automation_candidate" in df.columns:
-        candidates = df["top_automation_candidate"].dropna().tolist()
-        candidates = [c for c in candidates if c and c != ""]
-        if candidates:
-            candidate_counts = Counter(candidates)
+        named = df[df["top_automation_candidate"].notna() & (df["top_automation_candidate"] != "")]
+        if not named.empty:
+            candidate_stats = (
+                named.groupby("top_automation_candidate", sort=False)["automation_score"]
+                .agg(["size", "mean"])
+                .nlargest(10, "size")
+            )
             lines.append("\n### Most Common Automation Candidates\n")
             lines.append("| Automation Candidate | Appearances | Avg Score |")
             lines.append("|---------------------|-------------|-----------|")
-            for candidate, count in candidate_counts.most_common(10):
-                matching = df_scored[df_scored["top_automation_candidate"] == candidate]
-                avg_score = matching["score_float"].mean()
+            for candidate, count, avg_score in candidate_stats.itertuples():
                 lines.append(f"| {_truncate(candidate, 50)} | {count} | {avg_score:.2f} |")
 
-    # Top scoring workflows
-    auto_ready = df_scored[df_scored["score_float"] >= 0.7].sort_values("score_float", ascending=False)
+    # Top scoring workflows (partial selection: only the top 15 rows are ordered)
+    auto_ready = df[scores >= 0.7]
     if auto_ready.empty:
         lines.append("\n*No workflows scored 0.7+ for automation potential.*")
     else:
         lines.append(f"\n### Top Automation Candidates ({len(auto_ready)} workflows scoring >= 0.7)\n")
         lines.append("| User | Task | Score | App | Category |")
         lines.append("|------|------|-------|-----|----------|")
-        for _, row in auto_ready.head(15).iterrows():
-            lines.append(
-                f"| {row.get('username', '')} "
-                f"| {_truncate(row.get('task_description', ''), 40)} "
-                f"| {row['score_float']:.2f} "
-                f"| {row.get('primary_app', '')} "
-                f"| {row.get('workflow_category', '')} |"
-            )
+        top = auto_ready.nlargest(15, "automation_score")
+        table = (
+            "| " + _text_column(top, "username")
+            + " | " + _truncate_series(_text_column(top, "task_description"), 40)
+            + " | " + top["automation_score"].map("{:.2f}".format)
+            + " | " + _text_column(top, "primary_app")
+            + " | " + _text_column(top, "workflow_category")
+            + " |"
+        )
+        lines.extend(table.tolist())
 
     # Score distribution
     bins = [(0, 0.3, "Low"), (0.3, 0.5, "Moderate"), (0.5, 0.7, "Medium"), (0.7, 0.85, "High"), (0.85, 1.01, "Very High")]
     lines.append("\n### Automation Score Distribution\n")
     lines.append("| Range | Level | Videos | % |")
     lines.append("|-------|-------|--------|---|")
-    total = len(df_scored)
-    for low, high, label in bins:
-        count = len(df_scored[(df_scored["score_float"] >= low) & (df_scored["score_float"] < high)])
+    total = len(df)
+    edges = [low for low, _, _ in bins] + [bins[-1][1]]
+    counts = pd.cut(scores, edges, right=False).value_counts(sort=False)
+    for (low, high, label), count in zip(bins, counts):
         pct = count / total * 100 if total > 0 else 0
         lines.append(f"| {low:.1f}–{high:.2f} | {label} | {count} | {pct:.0f}% |")
 
@@ -216,17 +306,16 @@ def _sop_complexity(df: pd.DataFrame) -> str:
         lines.append("\n*No SOP data available.*")
         return "\n".join(lines)
 
-    df_sop = df.copy()
-    df_sop["steps"] = df_sop["sop_step_count"].apply(_safe_int)
-    valid = df_sop[df_sop["steps"] > 0]
+    valid = df[df["sop_step_count"] > 0]
 
     if valid.empty:
         lines.append("\n*No SOP step data available.*")
         return "\n".join(lines)
 
-    avg_steps = valid["steps"].mean()
-    max_steps = valid["steps"].max()
-    min_steps = valid["steps"].min()
+    steps = valid["sop_step_count"]
+    avg_steps = steps.mean()
+    max_steps = steps.max()
+    min_steps = steps.min()
 
     lines.append(f"\n| Metric | Value |")
     lines.append(f"|--------|-------|")
@@ -235,18 +324,19 @@ def _sop_complexity(df: pd.DataFrame) -> str:
     lines.append(f"| Simplest (min steps) | {min_steps} |")
 
     # Most complex workflows
-    top_complex = valid.nlargest(10, "steps")
+    top_complex = valid.nlargest(10, "sop_step_count")
     lines.append("\n### Most Complex Workflows\n")
     lines.append("| User | Task | SOP Steps | Auto Score | App |")
     lines.append("|------|------|-----------|------------|-----|")
-    for _, row in top_complex.iterrows():
-        lines.append(
-            f"| {row.get('username', '')} "
-            f"| {_truncate(row.get('task_description', ''), 40)} "
-            f"| {row['steps']} "
-            f"| {_safe_float(row.get('automation_score', 0)):.2f} "
-            f"| {row.get('primary_app', '')} |"
-        )
+    table = (
+        "| " + _text_column(top_complex, "username")
+        + " | " + _truncate_series(_text_column(top_complex, "task_description"), 40)
+        + " | " + top_complex["sop_step_count"].astype(str)
+        + " | " + _column(top_complex, "automation_score", 0.0).map("{:.2f}".format)
+        + " | " + _text_column(top_complex, "primary_app")
+        + " |"
+    )
+    lines.extend(table.tolist())
 
     # Step count distribution
     bins_steps = [(1, 5, "Simple (1-5)"), (6, 10, "Moderate (6-10)"), (11, 20, "Complex (11-20)"), (21, 999, "Very Complex (21+)")]
@@ -254,8 +344,10 @@ def _sop_complexity(df: pd.DataFrame) -> str:
     lines.append("| Range | Videos | % |")
     lines.append("|-------|--------|---|")
     total = len(valid)
-    for low, high, label in bins_steps:
-        count = len(valid[(valid["steps"] >= low) & (valid["steps"] <= high)])
+    # Integer steps, so (low - 1, high] intervals match the inclusive ranges
+    edges = [low - 1 for low, _, _ in bins_steps] + [bins_steps[-1][1]]
+    counts = pd.cut(steps, edges).value_counts(sort=False)
+    for (low, high, label), count in zip(bins_steps, counts):
         pct = count / total * 100 if total > 0 else 0
         lines.append(f"| {label} | {count} | {pct:.0f}% |")
 
@@ -269,38 +361,44 @@ def _application_insights(df: pd.DataFrame) -> str:
         lines.append("\n*No application data available.*")
         return "\n".join(lines)
 
-    # Most-used apps
-    app_counts = df["primary_app"].value_counts()
+    # One groupby pass feeds both tables: videos per app and mean score
+    has_score = "automation_score" in df.columns
+    grouped = df.groupby("primary_app", sort=False)
+    if has_score:
+        app_stats = grouped["automation_score"].agg(["size", "mean"])
+    else:
+        app_stats = grouped.size().to_frame("size")
+
+    # Most-used apps (nlargest keeps first-seen order on ties, like a stable sort)
+    app_counts = app_stats["size"].nlargest(15)
     lines.append("\n### Most-Used Applications\n")
     lines.append("| Application | Videos | % of Total |")
     lines.append("|-------------|--------|------------|")
     total = len(df)
-    for app, count in app_counts.head(15).items():
+    for app, count in app_counts.items():
         lines.append(f"| {app} | {count} | {count/total*100:.0f}% |")
 
     # Apps by automation score
-    if "automation_score" in df.columns:
-        app_scores = df.groupby("primary_app")["automation_score"].apply(
-            lambda x: x.apply(_safe_float).mean()
-        ).sort_values(ascending=False)
+    if has_score:
+        # A full sort, not nlargest: nlargest drops apps with no scores (NaN
+        # mean), which the sort lists last. Sorting the name-ordered index
+        # keeps ties in the same order as a sorted groupby would.
+        app_scores = app_stats.sort_index().sort_values("mean", ascending=False).head(10)
 
         lines.append("\n### Applications by Average Automation Score\n")
         lines.append("| Application | Avg Score | Videos |")
         lines.append("|-------------|-----------|--------|")
-        for app, avg_s in app_scores.head(10).items():
-            count = len(df[df["primary_app"] == app])
+        for app, count, avg_s in app_scores.itertuples():
             lines.append(f"| {app} | {avg_s:.2f} | {count} |")
 
     # Co-occurring apps
     if "app_sequence" in df.columns:
         app_pairs = Counter()
-        for seq_str in df["app_sequence"].dropna():
-            apps = _parse_json_field(seq_str)
-            unique_apps = list(dict.fromkeys(apps))
-            for i in range(len(unique_apps)):
-                for j in range(i + 1, len(unique_apps)):
-                    pair = tuple(sorted([unique_apps[i], unique_apps[j]]))
-                    app_pairs[pair] += 1
+        for apps in df["app_sequence"].dropna().map(_parse_json_field):
+            # Pairs from a sorted unique list are already in canonical order,
+            # so Counter.update can count them in C without per-pair sorting
+            unique_apps = sorted(set(apps))
+            app_pairs.update(combinations(unique_apps, 2))
 
         if app_pairs:
             lines.append("\n### Frequently Co-Occurring Applications\n")
@@ -343,33 +441,41 @@ def _user_findings(df: pd.DataFrame) -> str:
     sep += "---------|"
     lines.append(sep)
 
-    for user in df["username"].unique():
-        user_df = df[df["username"] == user]
-        count = len(user_df)
-        top_app = user_df["primary_app"].mode().iloc[0] if "primary_app" in user_df.columns and not user_df["primary_app"].dropna().empty else ""
-
-        row_str = f"| {user} | {count} | "
+    # All per-user figures from grouped aggregates, no per-user filtering
+    grouped = df.groupby("username", sort=False, dropna=False)
+    stats = grouped.size().to_frame("count")
+    if has_score:
+        stats["avg_score"] = grouped["automation_score"].mean()
+    if has_sop:
+        stats["avg_steps"] = grouped["sop_step_count"].mean()
+    stats["top_app"] = ""
+    if "primary_app" in df.columns:
+        # Most frequent app per user; ties go to the alphabetically first app
+        # (as Series.mode() would pick) because the pair index is sorted
+        app_counts = df.groupby(["username", "primary_app"]).size()
+        if not app_counts.empty:
+            top_apps = app_counts.groupby(level=0).idxmax().map(lambda pair: pair[1])
+            stats["top_app"] = top_apps.reindex(stats.index).fillna("")
+
+    for user, row in zip(stats.index, stats.to_dict("records")):
+        row_str = f"| {user} | {row['count']} | "
         if has_score:
-            avg_s = user_df["automation_score"].apply(_safe_float).mean()
-            row_str += f"{avg_s:.2f} | "
+            row_str += f"{row['avg_score']:.2f} | "
         if has_sop:
-            avg_steps = user_df["sop_step_count"].apply(_safe_int).mean()
-            row_str += f"{avg_steps:.1f} | "
-        row_str += f"{top_app} |"
+            row_str += f"{row['avg_steps']:.1f} | "
+        row_str += f"{row['top_app']} |"
         lines.append(row_str)
 
     return "\n".join(lines)
 
 
-def _analysis_links(df: pd.DataFrame) -> str:
+def _analysis_links(analyses: pd.DataFrame | None) -> str:
     lines = ["## 7. Detailed Analysis Files"]
 
-    if "analysis_md_path" not in df.columns:
+    if analyses is None:
         lines.append("\n*No per-video analysis files available.*")
         return "\n".join(lines)
 
-    analyses = df[df["analysis_md_path"].notna() & (df["analysis_md_path"] != "")]
-
     if analyses.empty:
         lines.append("\n*No per-video analysis files found.*")
         return "\n".join(lines)
@@ -378,57 +484,59 @@ def _analysis_links(df: pd.DataFrame) -> str:
     lines.append("| User | Task | Score | Analysis File |")
     lines.append("|------|------|-------|---------------|")
 
-    for _, row in analyses.iterrows():
-        user = row.get("username", "")
-        task = _truncate(row.get("task_description", ""), 35)
-        score = f"{_safe_float(row.get('automation_score', 0)):.2f}"
-        md_path = row.get("analysis_md_path", "")
-        filename = os.path.basename(md_path) if md_path else ""
-        lines.append(f"| {user} | {task} | {score} | {filename} |")
+    table = (
+        "| " + _text_column(analyses, "username")
+        + " | " + _truncate_series(_text_column(analyses, "task_description"), 35)
+        + " | " + _column(analyses, "automation_score", 0.0).map("{:.2f}".format)
+        + " | " + analyses["analysis_md_path"].map(os.path.basename)
+        + " |"
+    )
+    lines.extend(table.tolist())
 
     return "\n".join(lines)
 
 
-def _cross_video_themes(df: pd.DataFrame) -> str:
+# Per-video block in the cross-video themes section
+_THEME_ENTRY = "### {username} — {task}\n\n```markdown\n{preview}\n```\n"
+
+
+def _cross_video_themes(analyses: pd.DataFrame | None) -> str:
     lines = ["## 8. Cross-Video Automation Themes"]
 
-    if "analysis_md_path" not in df.columns:
+    if analyses is None:
         lines.append("\n*No per-video analyses available for theme extraction.*")
         return "\n".join(lines)
 
-    analyses = df[df["analysis_md_path"].notna() & (df["analysis_md_path"] != "")]
-
     if analyses.empty:
         lines.append("\n*No analysis files to extract themes from.*")
         return "\n".join(lines)
 
-    # Read each markdown file and extract Section B (automation candidates)
-    all_candidates = []
-    for _, row in analyses.iterrows():
-        md_path = row.get("analysis_md_path", "")
-        if not md_path or not os.path.isfile(md_path):
-            continue
+    # Read each markdown file and extract Section B (automation candidates);
+    # unchanged files come from the sections cache, the rest are read in parallel
+    cache = _load_sections_cache()
+    rows = analyses.to_dict("records")
+    paths = [row.get("analysis_md_path", "") for row in rows]
+    workers = max(1, min(REPORT_READ_MAX_WORKERS, len(paths)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parsed = list(pool.map(lambda path: _candidates_section(path, cache), paths))
 
-        try:
-            with open(md_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Skip YAML front matter
-            if content.startswith("---"):
-                end_idx = content.find("---", 3)
-                if end_idx > 0:
-                    content = content[end_idx + 3:]
-
-            sections = _parse_markdown_response(content)
-            candidates_text = sections.get("automation_candidates", "")
-            if candidates_text:
-                all_candidates.append({
-                    "username": row.get("username", ""),
-                    "task": row.get("task_description", ""),
-                    "candidates": candidates_text,
-                })
-        except OSError:
-            continue
+    all_candidates = []
+    for row, candidates_text in zip(rows, parsed):
+        if candidates_text:
+            all_candidates.append({
+                "username": row.get("username", ""),
+                "task": row.get("task_description", ""),
+                "candidates": candidates_text,
+            })
+
+    # Drop entries for analysis files no longer in the CSV (deleted or renamed)
+    live = set(paths)
+    stale = [path for path in cache if path not in live]
+    for path in stale:
+        del cache[path]
+
+    if stale or _sections_cache_dirty:
+        _save_sections_cache(cache)
 
     if not all_candidates:
         lines.append("\n*Could not read analysis files for theme extraction.*")
@@ -436,25 +544,25 @@ def _cross_video_themes(df: pd.DataFrame) -> str:
 
     lines.append(f"\nExtracted automation candidates from **{len(all_candidates)}** analyses.\n")
 
-    # Show per-video candidate summaries
+    # Show per-video candidate summaries, one formatted block per video
     for entry in all_candidates:
-        lines.append(f"### {entry['username']} — {_truncate(entry['task'], 50)}\n")
         # Show first ~500 chars of candidates section
         preview = entry["candidates"][:500]
         if len(entry["candidates"]) > 500:
             preview += "\n\n*(truncated)*"
-        lines.append("```markdown")
-        lines.append(preview.rstrip())
-        lines.append("```")
-        lines.append("")
+        lines.append(_THEME_ENTRY.format(
+            username=entry["username"],
+            task=_truncate(entry["task"], 50),
+            preview=preview.rstrip(),
+        ))
 
     return "\n".join(lines)
 
 
-def _footer() -> str:
+def _footer(now: datetime) -> str:
     return f"""---
 
-*Report generated by L7S Workflow Analysis Pipeline on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
+*Report generated by L7S Workflow Analysis Pipeline on {now:%Y-%m-%d %H:%M:%S}*
 *Data source: Gemini whole-video analysis of screen recordings collected via L7S Workflow Capture*
 *Layer 7 Systems — ML Engineering*"""
 
@@ -463,12 +571,155 @@ def _footer() -> str:
 # Helpers
 # =============================================================================
 
+# YAML front matter: an opening "---" through the next "---"
+_FRONT_MATTER_RE = re.compile(r"\A---.*?---", re.DOTALL)
+
+# Set when _candidates_section() parses a file the cache didn't cover
+_sections_cache_dirty = False
 
-def _safe_int(value) -> int:
+
+def _load_sections_cache() -> dict:
     try:
-        return int(float(value))
-    except (ValueError, TypeError):
-        return 0
+        with open(REPORT_SECTIONS_CACHE, "rb") as f:
+            return fast_json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_sections_cache(cache: dict) -> None:
+    global _sections_cache_dirty
+    tmp_path = f"{REPORT_SECTIONS_CACHE}.tmp"
+    try:
+        os.makedirs(os.path.dirname(REPORT_SECTIONS_CACHE), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(fast_json.dumps(cache))
+        os.replace(tmp_path, REPORT_SECTIONS_CACHE)
+        _sections_cache_dirty = False
+    except OSError as e:
+        print(f"[WARN] Could not save report sections cache: {e}")
+
+
+def _load_report_cache() -> dict:
+    try:
+        with open(REPORT_CACHE, "rb") as f:
+            return fast_json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_report_cache(fingerprint: dict) -> None:
+    tmp_path = f"{REPORT_CACHE}.tmp"
+    try:
+        os.makedirs(os.path.dirname(REPORT_CACHE), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(fast_json.dumps(fingerprint))
+        os.replace(tmp_path, REPORT_CACHE)
+    except OSError as e:
+        print(f"[WARN] Could not save report cache: {e}")
+
+
+def _file_signature(path: str) -> list[int] | None:
+    """[mtime_ns, size] of `path`, or None if it can't be stat'ed."""
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _candidates_section(md_path: str, cache: dict) -> str | None:
+    """
+    Section B (automation candidates) of a per-video analysis file.
+
+    Entries in `cache` are reused while the file's mtime and size match.
+
+    Returns:
+        The section text ("" if absent), or None if the file can't be read.
+    """
+    global _sections_cache_dirty
+    try:
+        st = os.stat(md_path)
+    except OSError:
+        return None
+
+    cached = cache.get(md_path)
+    if (
+        cached
+        and cached.get("mtime_ns") == st.st_mtime_ns
+        and cached.get("size") == st.st_size
+        and "candidates" in cached
+    ):
+        return cached["candidates"]
+
+    try:
+        with open(md_path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except OSError:
+        return None
+
+    content = _FRONT_MATTER_RE.sub("", content, count=1)
+
+    # Only Section B is needed: it runs from its heading to the next A-D heading
+    candidates = ""
+    headings = _SECTION_AD_RE.finditer(content)
+    for heading in headings:
+        if heading.group(1) == "B":
+            following = next(headings, None)
+            end = following.start() if following else len(content)
+            candidates = content[heading.end():end].strip()
+            break
+
+    cache[md_path] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "candidates": candidates}
+    _sections_cache_dirty = True
+    return candidates
+
+
+def _coerce_numeric_columns(df: pd.DataFrame) -> None:
+    """
+    Parse the numeric columns once, in place, so report sections can filter
+    and aggregate them directly.
+
+    Unparseable values become 0. Missing automation scores stay NaN, so they
+    are left out of averages and score bands (and render as "nan"); missing
+    durations and step counts become 0.
+    """
+    if "duration_sec" in df.columns:
+        df["duration_sec"] = pd.to_numeric(df["duration_sec"], errors="coerce").fillna(0.0)
+    if "automation_score" in df.columns:
+        raw = df["automation_score"]
+        scores = pd.to_numeric(raw, errors="coerce")
+        # Only cells that were present but failed to parse go through
+        # _safe_float (-> 0.0); blank cells keep their NaN
+        failed = scores.isna() & raw.notna()
+        if failed.any():
+            scores[failed] = raw[failed].map(_safe_float)
+        df["automation_score"] = scores
+    if "sop_step_count" in df.columns:
+        df["sop_step_count"] = pd.to_numeric(df["sop_step_count"], errors="coerce").fillna(0).astype(int)
+
+
+def _rows_with_analysis(df: pd.DataFrame) -> pd.DataFrame | None:
+    """Rows that have an analysis markdown path, or None if the CSV lacks the column."""
+    if "analysis_md_path" not in df.columns:
+        return None
+    return df[df["analysis_md_path"].notna() & (df["analysis_md_path"] != "")]
+
+
+def _column(df: pd.DataFrame, col: str, default) -> pd.Series:
+    """`df[col]`, or a Series of `default` when an older CSV lacks the column."""
+    if col in df.columns:
+        return df[col]
+    return pd.Series(default, index=df.index)
+
+
+def _text_column(df: pd.DataFrame, col: str) -> pd.Series:
+    """Column rendered as strings the way f-string formatting of each cell would."""
+    return _column(df, col, "").map(str)
+
+
+def _truncate_series(text: pd.Series, max_len: int) -> pd.Series:
+    """Vectorized _truncate() over a Series of strings."""
+    return text.where(text.str.len() <= max_len, text.str.slice(0, max_len - 3) + "...")
 
 
 def _safe_float(value) -> float:
@@ -492,10 +743,10 @@ def _parse_json_field(value) -> list:
         return value
     if isinstance(value, str):
         try:
-            parsed = json.loads(value)
+            parsed = fast_json.loads(value)
             if isinstance(parsed, list):
                 return parsed
-        except (json.JSONDecodeError, TypeError):
+        except (fast_json.JSONDecodeError, TypeError):
             pass
     return []
 
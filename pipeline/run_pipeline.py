@@ -19,6 +19,8 @@ Usage:
     python run_pipeline.py                          # Process all users
     python run_pipeline.py --user rcrane             # Single user
     python run_pipeline.py --limit 5                 # Process max 5 videos
+    python run_pipeline.py --workers 4               # Process 4 videos in parallel
+    python run_pipeline.py --batch                   # Analyze via Gemini Batch Mode (half price, slower)
     python run_pipeline.py --dry-run                 # Preview only
     python run_pipeline.py --metadata-only           # Skip Gemini, just extract file metadata
     python run_pipeline.py --report                  # Generate insights report after processing
@@ -28,18 +30,18 @@ Usage:
 
 import argparse
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
 from config import (
-    API_CALL_DELAY_SECONDS,
     CONVERSION_CSV,
     MAX_VIDEO_DURATION_SEC,
     MIN_EDUCATION_DURATION_SEC,
     MIN_VIDEO_DURATION_SEC,
     MP4_DIR,
     OUTPUT_DIR,
+    PIPELINE_WORKERS,
     EDUCATION_PROCESSING_LOG,
 )
 from csv_manager import (
@@ -47,6 +49,7 @@ from csv_manager import (
     append_row,
     build_education_row,
     build_row,
+    close_shared_writers,
     ensure_output_dir,
     get_csv_stats,
     load_education_rejected_ids,
@@ -61,8 +64,10 @@ from csv_manager import (
     update_workflow_sessions_status,
 )
 from filename_parser import load_converted_sessions
-from frame_extractor import get_video_metadata
-from gemini_analyzer import analyze_video, analyze_video_education
+from frame_extractor import get_video_metadata, get_video_metadata_batch, prune_metadata_cache
+
+# gemini_analyzer (google-genai and its dependencies) is imported where Gemini
+# is actually called, so --help, --dry-run and --metadata-only start quickly
 
 
 def run_pipeline(args: argparse.Namespace) -> dict:
@@ -93,10 +98,14 @@ def run_pipeline(args: argparse.Namespace) -> dict:
         print(f"Filter:      user = {args.user}")
     if args.limit:
         print(f"Limit:       {args.limit} videos")
+    if args.workers > 1:
+        print(f"Workers:     {args.workers}")
     if args.dry_run:
         print(f"Mode:        DRY RUN")
     if args.metadata_only:
         print(f"Mode:        METADATA ONLY (no Gemini)")
+    elif args.batch:
+        print(f"Mode:        GEMINI BATCH")
     print("=" * 60)
 
     # Ensure output directories exist
@@ -113,6 +122,7 @@ def run_pipeline(args: argparse.Namespace) -> dict:
         return stats
 
     print(f"  Found {len(videos)} video(s)")
+    _prune_video_metadata(videos, args)
 
     # --- Load processing and rejected logs for dedup ---
     processed_ids = load_processed_ids()
@@ -120,9 +130,11 @@ def run_pipeline(args: argparse.Namespace) -> dict:
     print(f"  Previously processed: {len(processed_ids)} video(s)")
     print(f"  Previously rejected: {len(rejected_ids)} video(s)")
 
-    # Filter to unprocessed and not rejected
-    already_handled = processed_ids | rejected_ids
-    to_process = [v for v in videos if v["video_id"] not in already_handled]
+    # Filter to unprocessed and not rejected (probe both indexes; no merged copy)
+    to_process = [
+        v for v in videos
+        if v["video_id"] not in processed_ids and v["video_id"] not in rejected_ids
+    ]
     stats["skipped"] = len(videos) - len(to_process)
 
     if not to_process:
@@ -135,215 +147,18 @@ def run_pipeline(args: argparse.Namespace) -> dict:
 
     print(f"  Will process: {len(to_process)} video(s) (skipping {stats['skipped']} already done)")
 
-    # --- Stage 2-5: Process each video ---
-    for i, video_meta in enumerate(to_process, 1):
-        video_id = video_meta["video_id"]
-        source_path = video_meta.get("source_path", "")
-        mp4_path = video_meta.get("mp4_path", "")
-        video_path = mp4_path if mp4_path else source_path
-        filename = Path(video_path).name
-        username = video_meta["username"]
-
-        if not video_path:
-            stats["failed"] += 1
-            stats["errors"].append("Missing video path in sessions CSV")
-            print("  ERROR: Missing video path in sessions CSV")
-            continue
-
-        print(f"\n[{i}/{len(to_process)}] {filename}")
-        print(f"  User: {username} | Task: {video_meta['task_description']}")
-
-        if args.dry_run:
-            print(f"  DRY RUN: Would process this video")
-            stats["processed"] += 1
-            continue
-
-        # --- Sanity checks: required metadata and files ---
-        missing_fields = []
-        if not video_meta.get("username"):
-            missing_fields.append("username")
-        if not video_meta.get("timestamp"):
-            missing_fields.append("timestamp")
-        if not video_meta.get("machine_id"):
-            missing_fields.append("machine_id")
-        if not video_meta.get("task_description"):
-            missing_fields.append("task_description")
-
-        mp4_missing = not (mp4_path and Path(mp4_path).is_file())
-        source_missing = not (source_path and Path(source_path).is_file())
-
-        if missing_fields or mp4_missing or source_missing:
-            reasons = []
-            if missing_fields:
-                reasons.append(f"Missing metadata: {', '.join(missing_fields)}")
-            if mp4_missing:
-                reasons.append("Missing MP4")
-            if source_missing:
-                reasons.append("Missing source WebM")
-            reason = "; ".join(reasons) if reasons else "Invalid session metadata"
-
-            print(f"  REJECTED: {reason}")
-            move_to_misrecordings(
-                source_path=source_path,
-                mp4_path=mp4_path,
-                reason=reason,
-            )
-            mark_rejected(video_id, reason)
-            update_workflow_sessions_status(
-                video_id,
-                "Rejected",
-                reason,
-                args.sessions_csv,
-                source_path=source_path,
-                mp4_path=mp4_path,
-            )
-            stats["rejected"] += 1
-            continue
-
-        try:
-            # --- Stage 2: Get video metadata ---
-            print(f"  Getting video metadata...")
-            file_metadata = get_video_metadata(video_path)
-            duration = file_metadata['duration_sec']
-            print(f"  Duration: {duration}s | Size: {file_metadata['file_size_mb']} MB")
-
-            # --- Quality Check: Duration bounds ---
-            if duration > 0:  # Only check if we got a valid duration
-                if duration < MIN_VIDEO_DURATION_SEC:
-                    reason = f"Too short: {duration}s"
-                    print(f"  REJECTED: Video too short ({duration}s < {MIN_VIDEO_DURATION_SEC}s minimum)")
-                    move_to_misrecordings(
-                        source_path=video_meta.get("source_path", ""),
-                        mp4_path=mp4_path,
-                        reason=reason
-                    )
-                    mark_rejected(video_id, reason)
-                    update_workflow_sessions_status(
-                        video_id,
-                        "Rejected",
-                        reason,
-                        args.sessions_csv,
-                        source_path=source_path,
-                        mp4_path=mp4_path,
-                    )
-                    stats["rejected"] += 1
-                    continue
-
-                if duration > MAX_VIDEO_DURATION_SEC:
-                    reason = f"Too long: {duration}s"
-                    print(f"  REJECTED: Video too long ({duration}s > {MAX_VIDEO_DURATION_SEC}s maximum)")
-                    move_to_misrecordings(
-                        source_path=video_meta.get("source_path", ""),
-                        mp4_path=mp4_path,
-                        reason=reason
-                    )
-                    mark_rejected(video_id, reason)
-                    update_workflow_sessions_status(
-                        video_id,
-                        "Rejected",
-                        reason,
-                        args.sessions_csv,
-                        source_path=source_path,
-                        mp4_path=mp4_path,
-                    )
-                    stats["rejected"] += 1
-                    continue
-
-            gemini_result = None
-            analysis_md_path = ""
-
-            if not args.metadata_only:
-                # --- Stage 3: Gemini two-pass analysis with quality check ---
-                print(f"  Analyzing with Gemini (two-pass + quality check)...")
-                gemini_result = analyze_video(
-                    video_path=video_path,
-                    task_description=video_meta["task_description"],
-                    video_id=video_id,
-                )
-
-                if not gemini_result:
-                    print(f"  ERROR: Gemini analysis failed - no results returned")
-                    stats["failed"] += 1
-                    stats["errors"].append(f"{filename}: Gemini analysis failed")
-                    continue
-
-                # Check if Pass 1 quality indicates useful workflow
-                if not gemini_result.get("is_useful", False):
-                    reason = gemini_result.get("rejection_reason", "Low quality analysis results")
-                    print(f"  REJECTED: {reason}")
-                    move_to_misrecordings(
-                        source_path=video_meta.get("source_path", ""),
-                        mp4_path=mp4_path,
-                        reason=reason
-                    )
-                    mark_rejected(video_id, reason)
-                    update_workflow_sessions_status(
-                        video_id,
-                        "Rejected",
-                        reason,
-                        args.sessions_csv,
-                        source_path=source_path,
-                        mp4_path=mp4_path,
-                    )
-                    stats["rejected"] += 1
-                    # Add delay before next video
-                    if i < len(to_process):
-                        print(f"  Waiting {API_CALL_DELAY_SECONDS:.0f}s before next video...")
-                        time.sleep(API_CALL_DELAY_SECONDS)
-                    continue
-
-                # --- Stage 4: Save per-video markdown ---
-                structured = gemini_result["structured"]
-                print(f"  Primary app: {structured['primary_app']}")
-                print(f"  Automation score: {structured['automation_score']}")
-                print(f"  SOP steps: {structured['sop_step_count']}")
-                print(f"  Top automation candidate: {structured['top_automation_candidate']}")
-
-                analysis_md_path = save_analysis_markdown(
-                    video_id=video_id,
-                    username=username,
-                    task_description=video_meta["task_description"],
-                    markdown_content=gemini_result["markdown"],
-                )
-                if analysis_md_path:
-                    print(f"  Analysis saved: {Path(analysis_md_path).name}")
-
-            # --- Stage 5: Build and append CSV row (only for successfully analyzed videos) ---
-            if args.metadata_only or gemini_result:
-                row = build_row(
-                    parsed_metadata=video_meta,
-                    video_metadata=file_metadata,
-                    gemini_structured=gemini_result["structured"] if gemini_result else None,
-                    analysis_md_path=analysis_md_path,
-                    mp4_path=mp4_path,
-                )
-
-                if append_row(row):
-                    mark_processed(video_id)
-                    update_workflow_sessions_status(
-                        video_id,
-                        "Analyzed",
-                        "",
-                        args.sessions_csv,
-                        source_path=source_path,
-                        mp4_path=mp4_path,
-                    )
-                    stats["processed"] += 1
-                    print(f"  Written to CSV")
-                else:
-                    stats["failed"] += 1
-                    stats["errors"].append(f"CSV write failed: {filename}")
-
-            # Rate limit delay between Gemini calls
-            if not args.metadata_only and i < len(to_process):
-                print(f"  Waiting {API_CALL_DELAY_SECONDS:.0f}s before next video...")
-                time.sleep(API_CALL_DELAY_SECONDS)
+    if not args.dry_run:
+        _prefetch_video_metadata(to_process, args)
+        if args.batch and not args.metadata_only:
+            args.batch_results = _prefetch_batch_analysis(to_process, args)
 
-        except Exception as e:
-            stats["failed"] += 1
-            stats["errors"].append(f"{filename}: {e}")
-            print(f"  ERROR: {e}")
-            continue
+    # --- Stage 2-5: Process each video ---
+    try:
+        _run_batch(_process_video, to_process, args, stats)
+    finally:
+        # Release the CSV/log handles held open across the batch and apply
+        # queued sessions status updates, even if the batch is interrupted
+        close_shared_writers()
 
     # --- Summary ---
     elapsed = (datetime.now() - start_time).total_seconds()
@@ -374,6 +189,320 @@ def run_pipeline(args: argparse.Namespace) -> dict:
     return stats
 
 
+def _process_video(i: int, total: int, video_meta: dict, args: argparse.Namespace) -> tuple[str, str]:
+    """
+    Run stages 2-5 for a single video.
+
+    Safe to call from worker threads: shared CSV/log writes are serialized
+    inside csv_manager.
+
+    Returns:
+        (outcome, error) where outcome is "processed", "rejected" or "failed"
+        and error is a message for the summary ("" if none).
+    """
+    video_id = video_meta["video_id"]
+    source_path = video_meta.get("source_path", "")
+    mp4_path = video_meta.get("mp4_path", "")
+    video_path = mp4_path if mp4_path else source_path
+    filename = Path(video_path).name
+    username = video_meta["username"]
+
+    if not video_path:
+        print("  ERROR: Missing video path in sessions CSV")
+        return "failed", "Missing video path in sessions CSV"
+
+    print(f"\n[{i}/{total}] {filename}")
+    print(f"  User: {username} | Task: {video_meta['task_description']}")
+
+    if args.dry_run:
+        print(f"  DRY RUN: Would process this video")
+        return "processed", ""
+
+    # --- Sanity checks: required metadata and files ---
+    missing_fields = []
+    if not video_meta.get("username"):
+        missing_fields.append("username")
+    if not video_meta.get("timestamp"):
+        missing_fields.append("timestamp")
+    if not video_meta.get("machine_id"):
+        missing_fields.append("machine_id")
+    if not video_meta.get("task_description"):
+        missing_fields.append("task_description")
+
+    mp4_missing = not (mp4_path and Path(mp4_path).is_file())
+    source_missing = not (source_path and Path(source_path).is_file())
+
+    if missing_fields or mp4_missing or source_missing:
+        reasons = []
+        if missing_fields:
+            reasons.append(f"Missing metadata: {', '.join(missing_fields)}")
+        if mp4_missing:
+            reasons.append("Missing MP4")
+        if source_missing:
+            reasons.append("Missing source WebM")
+        reason = "; ".join(reasons) if reasons else "Invalid session metadata"
+
+        print(f"  REJECTED: {reason}")
+        move_to_misrecordings(
+            source_path=source_path,
+            mp4_path=mp4_path,
+            reason=reason,
+        )
+        mark_rejected(video_id, reason)
+        update_workflow_sessions_status(
+            video_id,
+            "Rejected",
+            reason,
+            args.sessions_csv,
+            source_path=source_path,
+            mp4_path=mp4_path,
+            defer=True,
+        )
+        return "rejected", ""
+
+    try:
+        # --- Stage 2: Get video metadata ---
+        print(f"  Getting video metadata...")
+        file_metadata = get_video_metadata(video_path, _known_duration(video_meta, args))
+        duration = file_metadata['duration_sec']
+        print(f"  Duration: {duration}s | Size: {file_metadata['file_size_mb']} MB")
+
+        # --- Quality Check: Duration bounds ---
+        if duration > 0:  # Only check if we got a valid duration
+            if duration < MIN_VIDEO_DURATION_SEC:
+                reason = f"Too short: {duration}s"
+                print(f"  REJECTED: Video too short ({duration}s < {MIN_VIDEO_DURATION_SEC}s minimum)")
+                move_to_misrecordings(
+                    source_path=video_meta.get("source_path", ""),
+                    mp4_path=mp4_path,
+                    reason=reason
+                )
+                mark_rejected(video_id, reason)
+                update_workflow_sessions_status(
+                    video_id,
+                    "Rejected",
+                    reason,
+                    args.sessions_csv,
+                    source_path=source_path,
+                    mp4_path=mp4_path,
+                    defer=True,
+                )
+                return "rejected", ""
+
+            if duration > MAX_VIDEO_DURATION_SEC:
+                reason = f"Too long: {duration}s"
+                print(f"  REJECTED: Video too long ({duration}s > {MAX_VIDEO_DURATION_SEC}s maximum)")
+                move_to_misrecordings(
+                    source_path=video_meta.get("source_path", ""),
+                    mp4_path=mp4_path,
+                    reason=reason
+                )
+                mark_rejected(video_id, reason)
+                update_workflow_sessions_status(
+                    video_id,
+                    "Rejected",
+                    reason,
+                    args.sessions_csv,
+                    source_path=source_path,
+                    mp4_path=mp4_path,
+                    defer=True,
+                )
+                return "rejected", ""
+
+        gemini_result = None
+        analysis_md_path = ""
+        # Result from a --batch job, if this video was part of one
+        batch_result = getattr(args, "batch_results", {}).get(video_id)
+
+        if not args.metadata_only:
+            # --- Stage 3: Gemini two-pass analysis with quality check ---
+            if batch_result:
+                print(f"  Using Gemini batch analysis result")
+                gemini_result = batch_result
+            else:
+                from gemini_analyzer import analyze_video
+                print(f"  Analyzing with Gemini (two-pass + quality check)...")
+                gemini_result = analyze_video(
+                    video_path=video_path,
+                    task_description=video_meta["task_description"],
+                    video_id=video_id,
+                )
+
+            if not gemini_result:
+                print(f"  ERROR: Gemini analysis failed - no results returned")
+                return "failed", f"{filename}: Gemini analysis failed"
+
+            # Check if Pass 1 quality indicates useful workflow
+            if not gemini_result.get("is_useful", False):
+                reason = gemini_result.get("rejection_reason", "Low quality analysis results")
+                print(f"  REJECTED: {reason}")
+                move_to_misrecordings(
+                    source_path=video_meta.get("source_path", ""),
+                    mp4_path=mp4_path,
+                    reason=reason
+                )
+                mark_rejected(video_id, reason)
+                update_workflow_sessions_status(
+                    video_id,
+                    "Rejected",
+                    reason,
+                    args.sessions_csv,
+                    source_path=source_path,
+                    mp4_path=mp4_path,
+                    defer=True,
+                )
+                return "rejected", ""
+
+            # --- Stage 4: Save per-video markdown ---
+            structured = gemini_result["structured"]
+            print(f"  Primary app: {structured['primary_app']}")
+            print(f"  Automation score: {structured['automation_score']}")
+            print(f"  SOP steps: {structured['sop_step_count']}")
+            print(f"  Top automation candidate: {structured['top_automation_candidate']}")
+
+            analysis_md_path = save_analysis_markdown(
+                video_id=video_id,
+                username=username,
+                task_description=video_meta["task_description"],
+                markdown_content=gemini_result["markdown"],
+            )
+            if analysis_md_path:
+                print(f"  Analysis saved: {Path(analysis_md_path).name}")
+
+        # --- Stage 5: Build and append CSV row (only for successfully analyzed videos) ---
+        outcome = "processed", ""
+        if args.metadata_only or gemini_result:
+            row = build_row(
+                parsed_metadata=video_meta,
+                video_metadata=file_metadata,
+                gemini_structured=gemini_result["structured"] if gemini_result else None,
+                analysis_md_path=analysis_md_path,
+                mp4_path=mp4_path,
+            )
+
+            if append_row(row):
+                mark_processed(video_id)
+                update_workflow_sessions_status(
+                    video_id,
+                    "Analyzed",
+                    "",
+                    args.sessions_csv,
+                    source_path=source_path,
+                    mp4_path=mp4_path,
+                    defer=True,
+                )
+                print(f"  Written to CSV")
+            else:
+                outcome = "failed", f"CSV write failed: {filename}"
+
+        return outcome
+
+    except Exception as e:
+        print(f"  ERROR: {e}")
+        return "failed", f"{filename}: {e}"
+
+
+def _run_batch(process_fn, to_process: list[dict], args: argparse.Namespace, stats: dict) -> None:
+    """
+    Run `process_fn` over every video and fold the outcomes into `stats`.
+
+    With --workers > 1 the videos are submitted to a thread pool: the work is
+    dominated by ffprobe subprocesses and Gemini network calls, so threads are
+    enough to overlap them.
+    """
+    total = len(to_process)
+    workers = max(1, min(args.workers, total))
+
+    if workers == 1:
+        outcomes = (process_fn(i, total, v, args) for i, v in enumerate(to_process, 1))
+        for outcome, error in outcomes:
+            _record_outcome(stats, outcome, error)
+        return
+
+    print(f"  Running with {workers} parallel workers")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(process_fn, i, total, v, args)
+            for i, v in enumerate(to_process, 1)
+        ]
+        for future in as_completed(futures):
+            outcome, error = future.result()
+            _record_outcome(stats, outcome, error)
+
+
+def _known_duration(video_meta: dict, args: argparse.Namespace) -> float:
+    """Duration from workflow_sessions.csv, or -1 to make Stage 2 run ffprobe."""
+    if args.force_probe:
+        return -1.0
+    return video_meta.get("duration_sec", -1.0)
+
+
+def _prune_video_metadata(videos: list[dict], args: argparse.Namespace) -> None:
+    """
+    Drop ffprobe cache entries for videos the sessions CSV no longer lists.
+
+    Skipped for --user runs, which only see part of the CSV.
+    """
+    if args.dry_run or args.user:
+        return
+    pruned = prune_metadata_cache(v.get("mp4_path") or v.get("source_path", "") for v in videos)
+    if pruned:
+        print(f"  Dropped cached metadata for {pruned} video(s) no longer in the sessions CSV")
+
+
+def _prefetch_video_metadata(to_process: list[dict], args: argparse.Namespace) -> None:
+    """
+    Probe all MP4s up front in parallel so Stage 2 reads from the metadata cache.
+
+    Videos whose duration the sessions CSV already records are not probed.
+    """
+    paths = [
+        v.get("mp4_path") or v.get("source_path", "")
+        for v in to_process
+        if _known_duration(v, args) <= 0
+    ]
+    probed = get_video_metadata_batch(paths)
+    if probed:
+        print(f"  Prefetched metadata for {len(probed)} video(s)")
+
+
+def _prefetch_batch_analysis(to_process: list[dict], args: argparse.Namespace) -> dict[str, dict]:
+    """
+    Analyze every video that will reach Stage 3 in one Gemini Batch Mode run.
+
+    Videos whose MP4 is missing or whose duration is out of bounds are left
+    out (Stage 2 rejects them anyway). Videos the batch fails on are absent
+    from the result and fall back to analyze_video() in _process_video.
+
+    Returns:
+        Dict of video_id -> analyze_video()-style result.
+    """
+    jobs = []
+    for v in to_process:
+        mp4_path = v.get("mp4_path", "")
+        if not (mp4_path and Path(mp4_path).is_file() and v.get("task_description")):
+            continue
+        duration = get_video_metadata(mp4_path, _known_duration(v, args))["duration_sec"]
+        if duration > 0 and not (MIN_VIDEO_DURATION_SEC <= duration <= MAX_VIDEO_DURATION_SEC):
+            continue
+        jobs.append((v["video_id"], mp4_path, v["task_description"]))
+
+    if not jobs:
+        return {}
+
+    from gemini_analyzer import analyze_videos_batch
+    print(f"  Submitting {len(jobs)} video(s) to Gemini Batch Mode (this can take a while)...")
+    results = {vid: r for vid, r in analyze_videos_batch(jobs).items() if r}
+    print(f"  Batch analysis returned results for {len(results)}/{len(jobs)} video(s)")
+    return results
+
+
+def _record_outcome(stats: dict, outcome: str, error: str) -> None:
+    stats[outcome] += 1
+    if error:
+        stats["errors"].append(error)
+
+
 # =============================================================================
 # Education Pipeline
 # =============================================================================
@@ -411,6 +540,8 @@ def run_education_pipeline(args: argparse.Namespace) -> dict:
         print(f"Filter:      user = {args.user}")
     if args.limit:
         print(f"Limit:       {args.limit} videos")
+    if args.workers > 1:
+        print(f"Workers:     {args.workers}")
     if args.dry_run:
         print(f"Mode:        DRY RUN")
     print("=" * 60)
@@ -428,6 +559,7 @@ def run_education_pipeline(args: argparse.Namespace) -> dict:
         return stats
 
     print(f"  Found {len(videos)} video(s)")
+    _prune_video_metadata(videos, args)
 
     # --- Load education-specific dedup logs ---
     processed_ids = load_processed_ids(EDUCATION_PROCESSING_LOG)
@@ -435,8 +567,10 @@ def run_education_pipeline(args: argparse.Namespace) -> dict:
     print(f"  Education previously processed: {len(processed_ids)} video(s)")
     print(f"  Education previously rejected: {len(rejected_ids)} video(s)")
 
-    already_handled = processed_ids | rejected_ids
-    to_process = [v for v in videos if v["video_id"] not in already_handled]
+    to_process = [
+        v for v in videos
+        if v["video_id"] not in processed_ids and v["video_id"] not in rejected_ids
+    ]
     stats["skipped"] = len(videos) - len(to_process)
 
     # --- Pre-filter: exclude localutility user ---
@@ -451,131 +585,16 @@ def run_education_pipeline(args: argparse.Namespace) -> dict:
 
     print(f"  Will process: {len(to_process)} video(s) (skipping {stats['skipped']} already done)")
 
-    # --- Stage 2-5: Process each video ---
-    for i, video_meta in enumerate(to_process, 1):
-        video_id = video_meta["video_id"]
-        source_path = video_meta.get("source_path", "")
-        mp4_path = video_meta.get("mp4_path", "")
-        video_path = mp4_path if mp4_path else source_path
-        filename = Path(video_path).name if video_path else video_id
-        username = video_meta["username"]
-
-        if not video_path:
-            stats["failed"] += 1
-            stats["errors"].append("Missing video path in sessions CSV")
-            print("  ERROR: Missing video path in sessions CSV")
-            continue
-
-        print(f"\n[{i}/{len(to_process)}] {filename}")
-        print(f"  User: {username} | Task: {video_meta['task_description']}")
-
-        if args.dry_run:
-            print(f"  DRY RUN: Would process this video for education analysis")
-            stats["processed"] += 1
-            continue
-
-        # --- Sanity checks ---
-        mp4_missing = not (mp4_path and Path(mp4_path).is_file())
-        if mp4_missing:
-            reason = "Missing MP4 file"
-            print(f"  REJECTED: {reason}")
-            mark_education_rejected(video_id, reason)
-            stats["rejected"] += 1
-            continue
-
-        try:
-            # --- Stage 2: Get video metadata ---
-            print(f"  Getting video metadata...")
-            file_metadata = get_video_metadata(video_path)
-            duration = file_metadata['duration_sec']
-            print(f"  Duration: {duration}s | Size: {file_metadata['file_size_mb']} MB")
-
-            # --- Education duration filter (stricter: 30s minimum) ---
-            if duration > 0 and duration < MIN_EDUCATION_DURATION_SEC:
-                reason = f"Too short for education analysis: {duration}s < {MIN_EDUCATION_DURATION_SEC}s"
-                print(f"  REJECTED: {reason}")
-                mark_education_rejected(video_id, reason)
-                stats["rejected"] += 1
-                continue
-
-            if duration > 0 and duration > MAX_VIDEO_DURATION_SEC:
-                reason = f"Too long: {duration}s"
-                print(f"  REJECTED: {reason}")
-                mark_education_rejected(video_id, reason)
-                stats["rejected"] += 1
-                continue
-
-            # --- Stage 3: Gemini education analysis ---
-            print(f"  Analyzing with Gemini (education two-pass)...")
-            gemini_result = analyze_video_education(
-                video_path=video_path,
-                task_description=video_meta["task_description"],
-                video_id=video_id,
-            )
-
-            if not gemini_result:
-                print(f"  ERROR: Gemini education analysis failed")
-                stats["failed"] += 1
-                stats["errors"].append(f"{filename}: Education analysis failed")
-                continue
-
-            structured = gemini_result["structured"]
-
-            # --- Education-specific app exclusion (post-analysis) ---
-            # We check primary_app from the automation CSV or infer from education summary
-            # The education quality gate handles content-level rejection
-
-            if not gemini_result.get("is_useful", False):
-                reason = gemini_result.get("rejection_reason", "Low quality education analysis")
-                print(f"  REJECTED: {reason}")
-                mark_education_rejected(video_id, reason)
-                stats["rejected"] += 1
-                if i < len(to_process):
-                    print(f"  Waiting {API_CALL_DELAY_SECONDS:.0f}s before next video...")
-                    time.sleep(API_CALL_DELAY_SECONDS)
-                continue
-
-            # --- Stage 4: Save education markdown ---
-            print(f"  Skill level: {structured['skill_level']}")
-            print(f"  Learning category: {structured['learning_category']}")
-            print(f"  Time save opportunity: {structured['time_save_opportunity']}")
-
-            education_md_path = save_education_markdown(
-                video_id=video_id,
-                username=username,
-                task_description=video_meta["task_description"],
-                markdown_content=gemini_result["markdown"],
-            )
-            if education_md_path:
-                print(f"  Education analysis saved: {Path(education_md_path).name}")
-
-            # --- Stage 5: Build and append education CSV row ---
-            row = build_education_row(
-                parsed_metadata=video_meta,
-                video_metadata=file_metadata,
-                education_structured=structured,
-                education_md_path=education_md_path,
-                mp4_path=mp4_path,
-            )
-
-            if append_education_row(row):
-                mark_processed(video_id, EDUCATION_PROCESSING_LOG)
-                stats["processed"] += 1
-                print(f"  Written to education CSV")
-            else:
-                stats["failed"] += 1
-                stats["errors"].append(f"Education CSV write failed: {filename}")
-
-            # Rate limit delay
-            if i < len(to_process):
-                print(f"  Waiting {API_CALL_DELAY_SECONDS:.0f}s before next video...")
-                time.sleep(API_CALL_DELAY_SECONDS)
+    if not args.dry_run:
+        _prefetch_video_metadata(to_process, args)
 
-        except Exception as e:
-            stats["failed"] += 1
-            stats["errors"].append(f"{filename}: {e}")
-            print(f"  ERROR: {e}")
-            continue
+    # --- Stage 2-5: Process each video ---
+    try:
+        _run_batch(_process_education_video, to_process, args, stats)
+    finally:
+        # Release the CSV/log handles held open across the batch and apply
+        # queued sessions status updates, even if the batch is interrupted
+        close_shared_writers()
 
     # --- Summary ---
     elapsed = (datetime.now() - start_time).total_seconds()
@@ -605,6 +624,121 @@ def run_education_pipeline(args: argparse.Namespace) -> dict:
     return stats
 
 
+def _process_education_video(i: int, total: int, video_meta: dict, args: argparse.Namespace) -> tuple[str, str]:
+    """
+    Run education stages 2-5 for a single video.
+
+    Returns:
+        (outcome, error) — see _process_video().
+    """
+    video_id = video_meta["video_id"]
+    source_path = video_meta.get("source_path", "")
+    mp4_path = video_meta.get("mp4_path", "")
+    video_path = mp4_path if mp4_path else source_path
+    filename = Path(video_path).name if video_path else video_id
+    username = video_meta["username"]
+
+    if not video_path:
+        print("  ERROR: Missing video path in sessions CSV")
+        return "failed", "Missing video path in sessions CSV"
+
+    print(f"\n[{i}/{total}] {filename}")
+    print(f"  User: {username} | Task: {video_meta['task_description']}")
+
+    if args.dry_run:
+        print(f"  DRY RUN: Would process this video for education analysis")
+        return "processed", ""
+
+    # --- Sanity checks ---
+    mp4_missing = not (mp4_path and Path(mp4_path).is_file())
+    if mp4_missing:
+        reason = "Missing MP4 file"
+        print(f"  REJECTED: {reason}")
+        mark_education_rejected(video_id, reason)
+        return "rejected", ""
+
+    try:
+        # --- Stage 2: Get video metadata ---
+        print(f"  Getting video metadata...")
+        file_metadata = get_video_metadata(video_path, _known_duration(video_meta, args))
+        duration = file_metadata['duration_sec']
+        print(f"  Duration: {duration}s | Size: {file_metadata['file_size_mb']} MB")
+
+        # --- Education duration filter (stricter: 30s minimum) ---
+        if duration > 0 and duration < MIN_EDUCATION_DURATION_SEC:
+            reason = f"Too short for education analysis: {duration}s < {MIN_EDUCATION_DURATION_SEC}s"
+            print(f"  REJECTED: {reason}")
+            mark_education_rejected(video_id, reason)
+            return "rejected", ""
+
+        if duration > 0 and duration > MAX_VIDEO_DURATION_SEC:
+            reason = f"Too long: {duration}s"
+            print(f"  REJECTED: {reason}")
+            mark_education_rejected(video_id, reason)
+            return "rejected", ""
+
+        # --- Stage 3: Gemini education analysis ---
+        from gemini_analyzer import analyze_video_education
+        print(f"  Analyzing with Gemini (education two-pass)...")
+        gemini_result = analyze_video_education(
+            video_path=video_path,
+            task_description=video_meta["task_description"],
+            video_id=video_id,
+        )
+
+        if not gemini_result:
+            print(f"  ERROR: Gemini education analysis failed")
+            return "failed", f"{filename}: Education analysis failed"
+
+        structured = gemini_result["structured"]
+
+        # --- Education-specific app exclusion (post-analysis) ---
+        # We check primary_app from the automation CSV or infer from education summary
+        # The education quality gate handles content-level rejection
+
+        if not gemini_result.get("is_useful", False):
+            reason = gemini_result.get("rejection_reason", "Low quality education analysis")
+            print(f"  REJECTED: {reason}")
+            mark_education_rejected(video_id, reason)
+            return "rejected", ""
+
+        # --- Stage 4: Save education markdown ---
+        print(f"  Skill level: {structured['skill_level']}")
+        print(f"  Learning category: {structured['learning_category']}")
+        print(f"  Time save opportunity: {structured['time_save_opportunity']}")
+
+        education_md_path = save_education_markdown(
+            video_id=video_id,
+            username=username,
+            task_description=video_meta["task_description"],
+            markdown_content=gemini_result["markdown"],
+        )
+        if education_md_path:
+            print(f"  Education analysis saved: {Path(education_md_path).name}")
+
+        # --- Stage 5: Build and append education CSV row ---
+        row = build_education_row(
+            parsed_metadata=video_meta,
+            video_metadata=file_metadata,
+            education_structured=structured,
+            education_md_path=education_md_path,
+            mp4_path=mp4_path,
+        )
+
+        outcome = "processed", ""
+        if append_education_row(row):
+            mark_processed(video_id, EDUCATION_PROCESSING_LOG)
+            print(f"  Written to education CSV")
+        else:
+            outcome = "failed", f"Education CSV write failed: {filename}"
+
+        return outcome
+
+    except Exception as e:
+        print(f"  ERROR: {e}")
+        return "failed", f"{filename}: {e}"
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="L7S Workflow Analysis Pipeline - Process workflow recordings into structured data",
@@ -614,6 +748,8 @@ Examples:
   python run_pipeline.py                        Process all users, full pipeline
   python run_pipeline.py --user rcrane           Process a single user
   python run_pipeline.py --limit 3               Process at most 3 videos
+  python run_pipeline.py --workers 4             Process 4 videos in parallel
+  python run_pipeline.py --batch                 Analyze via Gemini Batch Mode (half price, slower)
   python run_pipeline.py --dry-run               Preview what would be processed
   python run_pipeline.py --metadata-only         Extract file metadata only (no Gemini)
   python run_pipeline.py --report                Generate insights report after processing
@@ -641,6 +777,17 @@ Examples:
         default=0,
         help="Maximum number of videos to process (0 = unlimited)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=PIPELINE_WORKERS,
+        help=f"Number of videos to process in parallel (default: {PIPELINE_WORKERS})",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit Gemini analysis as Batch Mode jobs (half price; results can take hours)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -651,6 +798,11 @@ Examples:
         action="store_true",
         help="Extract file metadata only (skip Gemini analysis)",
     )
+    parser.add_argument(
+        "--force-probe",
+        action="store_true",
+        help="Re-probe video durations with ffprobe instead of trusting workflow_sessions.csv",
+    )
     parser.add_argument(
         "--report",
         action="store_true",
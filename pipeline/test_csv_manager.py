@@ -0,0 +1,146 @@
+"""Quick test for CSV/log bookkeeping in csv_manager."""
+import csv
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+sys.path.insert(0, '.')
+
+import csv_manager
+from csv_manager import (
+    close_shared_writers, flush_staging, iter_processed_ids, load_processed_ids,
+    mark_processed, update_workflow_sessions_status,
+)
+from filename_parser import load_converted_sessions
+
+tmp = tempfile.mkdtemp(prefix='csv_manager_test_')
+
+# Sessions CSV as written by Convert-WorkflowSessions.ps1
+SESSIONS_HEADER = [
+    'SourcePath', 'Mp4Path', 'Username', 'Date', 'Time', 'Timestamp', 'MachineName',
+    'TaskDescription', 'DayOfWeek', 'HourOfDay', 'DurationSeconds', 'FileSizeMB',
+    'ConvertedAt', 'Status',
+]
+sessions_csv = os.path.join(tmp, 'workflow_sessions.csv')
+with open(sessions_csv, 'w', newline='', encoding='utf-8') as f:
+    writer = csv.writer(f)
+    writer.writerow(SESSIONS_HEADER)
+    for name in ('first', 'second'):
+        open(os.path.join(tmp, f'{name}.mp4'), 'wb').close()
+        writer.writerow([
+            os.path.join(tmp, f'{name}.webm'), os.path.join(tmp, f'{name}.mp4'), 'amy',
+            '2025-01-01', '08:00:00', '2025-01-01 08:00:00', 'M1', f'{name} task',
+            'Monday', '8', '42.0', '1.5', '2025-01-01 09:00:00', 'Converted',
+        ])
+
+# Status updates keep the converter's schema (plus RejectionReason) and the
+# ids derived from the paths stay the same across the rewrite
+before = load_converted_sessions(sessions_csv)
+target = before[1]
+assert update_workflow_sessions_status(
+    target['video_id'], 'Rejected', 'Too short', sessions_csv,
+    source_path=target['source_path'], mp4_path=target['mp4_path'],
+)
+with open(sessions_csv, newline='', encoding='utf-8') as f:
+    rows = list(csv.DictReader(f))
+assert list(rows[0]) == SESSIONS_HEADER + ['RejectionReason']
+assert [r['Status'] for r in rows] == ['Converted', 'Rejected']
+assert rows[1]['RejectionReason'] == 'Too short'
+after = load_converted_sessions(sessions_csv)
+assert [v['video_id'] for v in after] == [v['video_id'] for v in before]
+print('Sessions status update OK')
+
+# Deferred updates are queued, then written once the oldest is too old
+first = after[0]
+assert update_workflow_sessions_status(
+    first['video_id'], 'Processed', '', sessions_csv,
+    source_path=first['source_path'], mp4_path=first['mp4_path'], defer=True,
+)
+with open(sessions_csv, newline='', encoding='utf-8') as f:
+    assert next(csv.DictReader(f))['Status'] == 'Converted', 'deferred update written early'
+csv_manager._pending_status[sessions_csv].queued_at -= csv_manager.SESSIONS_STATUS_FLUSH_SECONDS
+assert update_workflow_sessions_status(
+    target['video_id'], 'Rejected', 'Too short', sessions_csv,
+    source_path=target['source_path'], mp4_path=target['mp4_path'], defer=True,
+)
+assert sessions_csv not in csv_manager._pending_status
+with open(sessions_csv, newline='', encoding='utf-8') as f:
+    assert [r['Status'] for r in csv.DictReader(f)] == ['Processed', 'Rejected']
+print('Deferred status flush OK')
+
+# Processed log <-> binary .idx sidecar round trip
+log_path = os.path.join(tmp, 'processed.log')
+idx_path = log_path + '.idx'
+idx_header = csv_manager._INDEX_HEADER.size
+ids = ['0123456789ab', 'fedcba987654', '00000000000f']
+with open(log_path, 'w', encoding='utf-8') as f:
+    f.write('\n'.join(ids + ids[:1]) + '\n')  # duplicates are tolerated
+
+loaded = load_processed_ids(log_path)
+assert sorted(loaded) == sorted(ids)
+assert os.path.getsize(idx_path) == idx_header + 8 * len(ids), 'index not built from the text log'
+
+mark_processed('aaaaaaaaaaaa', log_path)
+close_shared_writers()
+csv_manager._id_cache.clear()  # force a reload from disk
+from_index = csv_manager._load_index_file(log_path)
+assert from_index is not None, 'index should be current after mark_processed'
+assert sorted(from_index) == sorted(set(iter_processed_ids(log_path)))
+assert 'aaaaaaaaaaaa' in load_processed_ids(log_path)
+print('Processed index round trip OK')
+
+# A log edited behind the index's back (index older than the log) is reread
+with open(log_path, 'a', encoding='utf-8') as f:
+    f.write('bbbbbbbbbbbb\n')
+log_mtime = os.stat(log_path).st_mtime_ns
+os.utime(idx_path, ns=(log_mtime - 10**9, log_mtime - 10**9))
+csv_manager._id_cache.clear()
+assert 'bbbbbbbbbbbb' in load_processed_ids(log_path)
+assert os.path.getsize(idx_path) == idx_header + 8 * (len(ids) + 2), 'stale index not rebuilt'
+print('Stale index rebuild OK')
+
+# An append the index missed is caught by the log size even when the share's
+# coarse mtimes make the log and the index look equally new
+idx_mtime = os.stat(idx_path).st_mtime_ns
+with open(log_path, 'a', encoding='utf-8') as f:
+    f.write('cccccccccccc\n')
+os.utime(log_path, ns=(idx_mtime, idx_mtime))
+csv_manager._id_cache.clear()
+assert csv_manager._load_index_file(log_path) is None
+assert 'cccccccccccc' in load_processed_ids(log_path)
+assert csv_manager._load_index_file(log_path) is not None, 'index not rebuilt after size mismatch'
+print('Same-mtime append detection OK')
+
+# Ids that can't be packed retire the index; the text log stays authoritative
+mark_processed('not-a-hex-id', log_path)
+close_shared_writers()
+csv_manager._id_cache.clear()
+reloaded = load_processed_ids(log_path)
+assert 'not-a-hex-id' in reloaded and 'bbbbbbbbbbbb' in reloaded
+assert not os.path.exists(idx_path)
+print('Unpackable id fallback OK')
+
+# Staging shards: only this process's shard and shards of dead processes are
+# published, and only their complete rows; a live writer's shard is left alone
+staging = os.path.join(tmp, 'staging')
+os.makedirs(staging)
+shared_csv = os.path.join(tmp, 'shared.csv')
+dead = subprocess.Popen([sys.executable, '-c', 'pass'])
+dead.wait()
+dead_shard = os.path.join(staging, f'shared.shard-{dead.pid}.csv')
+live_shard = os.path.join(staging, f'shared.shard-{os.getppid()}.csv')
+with open(dead_shard, 'wb') as f:
+    f.write(b'v1,"two\nlines"\r\nv2,plain\r\nv3,"torn\n')
+with open(live_shard, 'wb') as f:
+    f.write(b'v9,live\r\nv10,half')
+assert flush_staging(shared_csv, ('video_id', 'note'), staging) == 1
+with open(shared_csv, newline='', encoding='utf-8') as f:
+    assert list(csv.reader(f)) == [['video_id', 'note'], ['v1', 'two\nlines'], ['v2', 'plain']]
+assert not os.path.exists(dead_shard)
+with open(live_shard, 'rb') as f:
+    assert f.read() == b'v9,live\r\nv10,half', 'live shard was touched'
+print('Staging shard recovery OK')
+
+shutil.rmtree(tmp, ignore_errors=True)
+print('\nALL TESTS PASSED')
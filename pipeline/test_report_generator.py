@@ -0,0 +1,113 @@
+"""Quick regression test for the insights report generator."""
+import csv
+import json
+import os
+import shutil
+import sys
+import tempfile
+sys.path.insert(0, '.')
+
+import report_generator
+
+tmp = tempfile.mkdtemp(prefix='report_test_')
+report_generator.REPORT_SECTIONS_CACHE = os.path.join(tmp, 'sections_cache.json')
+report_generator.REPORT_CACHE = os.path.join(tmp, 'report_cache.json')
+
+COLUMNS = [
+    'video_id', 'username', 'timestamp', 'machine_id', 'task_description',
+    'duration_sec', 'workflow_description', 'primary_app', 'app_sequence',
+    'automation_score', 'workflow_category', 'sop_step_count',
+    'top_automation_candidate', 'analysis_md_path',
+]
+
+
+def write_csv(path, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        writer.writerows(rows)
+
+
+def build(csv_path, out_dir):
+    path = report_generator.generate_report(csv_path, out_dir)
+    assert path, 'report was not generated'
+    with open(path, encoding='utf-8') as f:
+        return f.read().splitlines()
+
+
+# Blank and non-numeric automation scores. Expected lines are the ones the
+# original per-row _safe_float() report produced: blank scores stay NaN (left
+# out of averages and bands, shown as "nan"), unparseable scores count as 0.
+csv_path = os.path.join(tmp, 'scores.csv')
+write_csv(csv_path, [
+    ['v1', 'amy', '2025-01-01', 'm1', 'task one', '60', 'desc', 'Excel', '[]', '0.9', 'other', '5', 'Invoice entry', ''],
+    ['v2', 'amy', '2025-01-02', 'm1', 'task two', '60', 'desc', 'Excel', '[]', '', 'other', '3', 'Invoice entry', ''],
+    ['v3', 'bob', '2025-01-03', 'm1', 'task three', '60', 'desc', 'SAP', '[]', 'abc', 'other', '', 'Invoice entry', ''],
+    ['v4', 'bob', '2025-01-04', 'm1', 'task four', '', 'desc', 'SAP', '[]', '0.2', 'other', '12', '', ''],
+    ['v5', 'cy', '2025-01-05', 'm1', 'task five', '60', 'desc', 'Outlook', '[]', '', 'other', '2', '', ''],
+])
+lines = build(csv_path, os.path.join(tmp, 'out'))
+
+expected = [
+    '| amy | task two | 1.0m | Excel | nan | 3 | Invoice entry | desc |',
+    '| bob | task three | 1.0m | SAP | 0.00 | 0 | Invoice entry | desc |',
+    '| Invoice entry | 3 | 0.45 |',
+    '| 0.0–0.30 | Low | 2 | 40% |',
+    '| 0.3–0.50 | Moderate | 0 | 0% |',
+    '| 0.8–1.01 | Very High | 1 | 20% |',
+    '| Excel | 0.90 | 2 |',
+    '| SAP | 0.10 | 2 |',
+    '| Outlook | nan | 1 |',
+    '| amy | 2 | 0.90 | 4.0 | Excel |',
+    '| bob | 2 | 0.10 | 6.0 | SAP |',
+    '| cy | 1 | nan | 2.0 | Outlook |',
+]
+for line in expected:
+    assert line in lines, f'missing report line: {line}'
+# The unscored app is listed after every scored one
+assert lines.index('| SAP | 0.10 | 2 |') < lines.index('| Outlook | nan | 1 |')
+print('Blank/non-numeric score handling OK')
+
+# Report cache: an unchanged CSV and analysis files reuse the existing report,
+# but editing an analysis file (without touching the CSV) re-renders it
+md_path = os.path.join(tmp, 'v1.md')
+with open(md_path, 'w', encoding='utf-8') as f:
+    f.write('### A) SOP\n1. Open Excel\n\n### B) Automation candidates\n1. Macro for totals\n')
+csv_path = os.path.join(tmp, 'cached.csv')
+write_csv(csv_path, [
+    ['v1', 'amy', '2025-01-01', 'm1', 'task one', '60', 'desc', 'Excel', '[]', '0.9', 'other', '5', 'Totals', md_path],
+])
+out_dir = os.path.join(tmp, 'cached_out')
+lines = build(csv_path, out_dir)
+assert '1. Macro for totals' in lines
+
+report_path = report_generator.generate_report(csv_path, out_dir)
+os.utime(report_path, ns=(1, 1))
+assert report_generator.generate_report(csv_path, out_dir) == report_path
+assert os.stat(report_path).st_mtime_ns == 1, 'unchanged inputs should not re-render'
+print('Report cache reuse OK')
+
+with open(md_path, 'w', encoding='utf-8') as f:
+    f.write('### A) SOP\n1. Open Excel\n\n### B) Automation candidates\n1. Scheduled export script\n')
+os.utime(md_path, ns=(2_000_000_000, 2_000_000_000))
+lines = build(csv_path, out_dir)
+assert '1. Scheduled export script' in lines, 'edited analysis file did not invalidate the report'
+assert '1. Macro for totals' not in lines
+print('Report cache invalidation on analysis file change OK')
+
+# Sections cache entries for analysis files that left the CSV are pruned
+with open(report_generator.REPORT_SECTIONS_CACHE, encoding='utf-8') as f:
+    cached_paths = set(json.load(f))
+assert cached_paths == {md_path}, cached_paths
+moved_md = os.path.join(tmp, 'v1_renamed.md')
+os.replace(md_path, moved_md)
+write_csv(csv_path, [
+    ['v1', 'amy', '2025-01-01', 'm1', 'task one', '60', 'desc', 'Excel', '[]', '0.9', 'other', '5', 'Totals', moved_md],
+])
+build(csv_path, out_dir)
+with open(report_generator.REPORT_SECTIONS_CACHE, encoding='utf-8') as f:
+    assert set(json.load(f)) == {moved_md}, 'stale sections cache entry kept'
+print('Sections cache pruning OK')
+
+shutil.rmtree(tmp, ignore_errors=True)
+print('\nALL TESTS PASSED')